@@ -0,0 +1,97 @@
+"""
+Certificate page parsing benchmark: targeted pull parse vs full soup.
+
+Runs the Coursera, EdX and LinkedIn field extraction from the validators on
+each page in both modes and reports wall time, peak traced memory and how
+much of the page the targeted parser consumed before every field settled.
+
+Usage:
+    python benchmarks/bench_certificate_parse.py [page.html ...] [--repeat N]
+
+Without arguments it uses ``benchmarks/pages/*.html``, or generated
+certificate pages with the fields near the top of a long page.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cert_validator.core import FieldSpec, compile_selector, extract_page_fields, get_selector_program
+from bench_parsers import PAGES_DIR
+
+FILLER = "<div class='course-card'><h3>Related course</h3><p>" + "Learn something new every day. " * 20 + "</p></div>"
+
+
+def platform_fields(platform: str):
+    program = get_selector_program()
+    selectors = program.platform(platform)
+    if platform == "coursera":
+        return {
+            "name": FieldSpec([selectors["name"]], strip=False),
+            "course": FieldSpec([compile_selector(f"{selectors['name'].text} {selectors['course'].text}")]),
+            "date": FieldSpec(program.dates),
+        }
+    if platform == "edx":
+        return {"name": FieldSpec([selectors["name"]]), "date": FieldSpec([selectors["date"]])}
+    return {"name": FieldSpec([selectors["name"]]), "course": FieldSpec([selectors["certificate"]]),
+            "date": FieldSpec(program.dates)}
+
+
+def generated_pages(tail: int = 400):
+    return [
+        ("coursera-generated", "coursera",
+         "<html><body><p class='account-verification-description'>Jane Doe's account is verified. "
+         "<a class='product-link'>Machine Learning</a></p><time>2023-01-05</time>" + FILLER * tail + "</body></html>"),
+        ("edx-generated", "edx",
+         "<html><body><h1 class='certificate-title'>Intro to CS</h1><span class='certificate-date'>2021-03-03</span>"
+         + FILLER * tail + "</body></html>"),
+        ("linkedin-generated", "linkedin",
+         "<html><body><h1 class='text-heading-xlarge'>Sam</h1><div class='certificate-card'>Python</div>"
+         "<time>2020-02-02</time>" + FILLER * tail + "</body></html>"),
+    ]
+
+
+def measure(content: str, fields, targeted: bool, repeat: int):
+    tracemalloc.start()
+    page = extract_page_fields(content, fields, targeted=targeted)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract_page_fields(content, fields, targeted=targeted)
+    return (time.perf_counter() - start) / repeat * 1000, peak / 1024, page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="HTML files named <platform>-*.html (coursera, edx, linkedin)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.pages or sorted(glob.glob(os.path.join(PAGES_DIR, "*.html")))
+    pages = []
+    for path in paths:
+        name = os.path.basename(path)
+        platform = name.split("-")[0]
+        if platform in ("coursera", "edx", "linkedin"):
+            pages.append((name, platform, open(path, encoding="utf-8", errors="replace").read()))
+    if not pages:
+        pages = generated_pages()
+
+    print(f"{'page':<24}{'mode':<10}{'ms':>9}{'peak KiB':>11}{'parsed':>9}  fields")
+    for name, platform, content in pages:
+        fields = platform_fields(platform)
+        for targeted in (False, True):
+            ms, peak_kib, page = measure(content, fields, targeted, args.repeat)
+            parsed = f"{page.parsed_chars / max(1, page.total_chars):.0%}"
+            found = ",".join(field for field, element in page.elements.items() if element is not None)
+            print(f"{name[:23]:<24}{page.mode:<10}{ms:>9.2f}{peak_kib:>11.0f}{parsed:>9}  {found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Keyword filter micro-benchmark.
+
+Compares the per-keyword ``any(kw.lower() in text.lower() ...)`` loops the
+extraction helpers used to run with :class:`KeywordMatcher`, for every keyword
+list in ``SELECTORS_CONFIG``.
+
+Usage:
+    python benchmarks/bench_keywords.py [--texts N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cert_validator.core import SELECTORS_CONFIG, keyword_matcher
+
+KEYWORD_LISTS = [
+    "skill_keywords",
+    "experience_keywords",
+    "portfolio_keywords",
+    "portfolio_exclude_keywords",
+    "portfolio_list_exclude_keywords",
+    "portfolio_education_keywords",
+    "portfolio_education_exclude_keywords",
+]
+
+FILLER = ("built a tool for students using modern frameworks at the university lab with a small team "
+          "and shipped it to production after several iterations of design review").split()
+
+
+def sample_texts(keywords, count: int):
+    random.seed(7)
+    vocabulary = FILLER + [word for keyword in keywords for word in keyword.split()]
+    return [" ".join(random.choice(vocabulary) for _ in range(random.randint(3, 40))).capitalize() for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'keyword list':<40}{'keywords':>9}{'loop us':>10}{'matcher us':>12}{'speedup':>9}")
+    for name in KEYWORD_LISTS:
+        keywords = SELECTORS_CONFIG[name]
+        texts = sample_texts(keywords, args.texts)
+        matcher = keyword_matcher(keywords)
+
+        def loop():
+            return [any(kw.lower() in text.lower() for kw in keywords) for text in texts]
+
+        def compiled():
+            return [matcher.search(text) for text in texts]
+
+        assert loop() == compiled()
+        loop_us = min(timeit.repeat(loop, number=args.repeat, repeat=3)) / args.repeat / len(texts) * 1e6
+        matcher_us = min(timeit.repeat(compiled, number=args.repeat, repeat=3)) / args.repeat / len(texts) * 1e6
+        print(f"{name:<40}{len(keywords):>9}{loop_us:>10.2f}{matcher_us:>12.2f}{loop_us / matcher_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Parser backend benchmark.
+
+Times parsing, the portfolio CSS selectors and a full ``parse_portfolio`` run
+for every installed BeautifulSoup backend. selectolax, when installed, is timed
+for parse + select as a reference for a pure CSS engine.
+
+Usage:
+    python benchmarks/bench_parsers.py [page.html ...] [--repeat N]
+
+Without arguments it uses ``benchmarks/pages/*.html`` (saved portfolio or
+certificate pages), or a generated portfolio page when that folder is empty.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import complete_file
+from cert_validator import core
+from complete_file import parse_portfolio
+from cert_validator.core import SELECTORS_CONFIG, available_parser_backends, make_soup
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+
+def portfolio_selectors():
+    selectors = []
+    for key, value in SELECTORS_CONFIG.items():
+        if key.startswith("portfolio_") and key.endswith("_selectors"):
+            if isinstance(value, dict):
+                for group in value.values():
+                    selectors.extend(group)
+            else:
+                selectors.extend(value)
+    return selectors
+
+
+def generated_page(sections: int = 200) -> str:
+    blocks = []
+    for i in range(sections):
+        blocks.append(
+            f'<section class="project-card work" id="project-{i}">'
+            f'<h3 class="project-title">Project {i}</h3>'
+            f'<p class="project-description">A developer tool built with React, Python and Docker #{i}.</p>'
+            f'<a class="project-link" href="https://github.com/demo/project-{i}">Source</a>'
+            f'<ul class="skills-list"><li class="skill">Python</li><li class="skill">SQL</li></ul>'
+            f'</section>'
+        )
+    return (
+        "<html><head><title>Demo User</title>"
+        '<meta property="og:site_name" content="Demo User"></head><body>'
+        '<header><h1 class="name">Demo User</h1></header>'
+        '<div class="about">Software engineer and open source enthusiast.</div>'
+        + "".join(blocks)
+        + '<div class="education"><p>Bachelor of Technology, Demo University</p></div>'
+        '<a href="mailto:demo@example.com">Email</a></body></html>'
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench_soup(html: str, backend: str, selectors, repeat: int):
+    soup = make_soup(html, backend)
+    parse_ms = timed(lambda: make_soup(html, backend), repeat)
+    select_ms = timed(lambda: [soup.select(selector) for selector in selectors], repeat)
+    core._parser_backend = backend
+    portfolio_ms = timed(lambda: parse_portfolio(html, "https://example.com"), repeat)
+    return parse_ms, select_ms, portfolio_ms
+
+
+def bench_selectolax(html: str, selectors, repeat: int):
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        return None
+    tree = HTMLParser(html)
+    parse_ms = timed(lambda: HTMLParser(html), repeat)
+    select_ms = timed(lambda: [tree.css(selector) for selector in selectors], repeat)
+    return parse_ms, select_ms, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="HTML files to benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.pages or sorted(glob.glob(os.path.join(PAGES_DIR, "*.html")))
+    pages = [(os.path.basename(path), open(path, encoding="utf-8", errors="replace").read()) for path in paths]
+    if not pages:
+        pages = [("generated-portfolio", generated_page())]
+
+    selectors = portfolio_selectors()
+    print(f"{'page':<28}{'backend':<14}{'parse ms':>10}{'select ms':>11}{'portfolio ms':>14}")
+    for name, html in pages:
+        results = [(backend, bench_soup(html, backend, selectors, args.repeat)) for backend in available_parser_backends()]
+        selectolax = bench_selectolax(html, selectors, args.repeat)
+        if selectolax:
+            results.append(("selectolax", selectolax))
+        for backend, (parse_ms, select_ms, portfolio_ms) in results:
+            portfolio = f"{portfolio_ms:>14.2f}" if portfolio_ms is not None else f"{'-':>14}"
+            print(f"{name[:27]:<28}{backend:<14}{parse_ms:>10.2f}{select_ms:>11.2f}{portfolio}")
+
+
+if __name__ == "__main__":
+    main()
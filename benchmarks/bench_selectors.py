@@ -0,0 +1,75 @@
+"""
+Selector program benchmark.
+
+Per page, times the selectors ``parse_portfolio`` and the certificate
+validators run, first as raw strings through ``soup.select`` (soupsieve
+re-resolves each string every call) and then through the compiled
+:class:`SelectorProgram`, on plain soup and on a :class:`DocumentIndex`.
+Also reports how long a full program reload takes.
+
+Usage:
+    python benchmarks/bench_selectors.py [page.html ...] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from complete_file import DocumentIndex
+from cert_validator.core import make_soup, reload_selector_program
+from bench_parsers import PAGES_DIR, generated_page
+
+
+def flatten(groups):
+    selectors = []
+    for value in groups.values():
+        if isinstance(value, dict):
+            selectors.extend(flatten(value))
+        elif isinstance(value, list):
+            selectors.extend(value)
+        else:
+            selectors.append(value)
+    return selectors
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="HTML files to benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    program = reload_selector_program()
+    reload_ms = (time.perf_counter() - start) * 1000
+    compiled = flatten(program.portfolio) + flatten(program.platforms) + program.dates
+    strings = [selector.text for selector in compiled]
+
+    paths = args.pages or sorted(glob.glob(os.path.join(PAGES_DIR, "*.html")))
+    pages = [(os.path.basename(path), open(path, encoding="utf-8", errors="replace").read()) for path in paths]
+    if not pages:
+        pages = [("generated-portfolio", generated_page()), ("generated-small", generated_page(sections=3))]
+
+    print(f"program reload: {reload_ms:.2f} ms for {len(compiled)} selectors")
+    print(f"{'page':<28}{'strings ms':>12}{'compiled ms':>13}{'indexed ms':>12}")
+    for name, html in pages:
+        soup = make_soup(html)
+        index = DocumentIndex(soup)
+        strings_ms = timed(lambda: [soup.select(selector) for selector in strings], args.repeat)
+        compiled_ms = timed(lambda: [selector.select(soup) for selector in compiled], args.repeat)
+        indexed_ms = timed(lambda: [index.select(selector) for selector in compiled], args.repeat)
+        print(f"{name[:27]:<28}{strings_ms:>12.2f}{compiled_ms:>13.2f}{indexed_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2647 @@
+"""
+Certificate validation core.
+
+Configs, request deadlines, retries, circuit breakers, HTML parsing and the
+platform validators, together with the orchestrator and the API wrapper built
+on them. Nothing here imports the web stack (FastAPI, aiohttp, document
+parsers) or Selenium, so the cert_validator CLI and import shims load only
+what validation needs; the FastAPI app in complete_file builds on this module.
+"""
+
+import abc
+import asyncio
+import contextvars
+import importlib.util
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_futures
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+from urllib.parse import urlparse
+
+import requests
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# Relative data paths (certificate cache, logs) resolve against the repository root
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- INLINED CONFIGS ---
+PATTERNS = {
+  "certificate_patterns": {
+    "udemy": r"https?://(www\.)?udemy\.com/certificate/[A-Za-z0-9_-]+/?",
+    "credly": r"https?://(www\.)?credly\.com/badges/[A-Za-z0-9_-]+/?",
+    "coursera": r"https?://(www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?"
+  }
+}
+
+REGEX_CONFIG = {
+  "extract_elements_patterns": {
+    "github": r"github\.com/([A-Za-z0-9_-]+)",
+    "portfolio": r"(https?://[^\s]+vercel\.app[^\s]*)",
+    "instagram": r"Instagram:\s*@?([A-Za-z0-9_.-]+)",
+    "udemy": r"(https?://www\.udemy\.com/certificate/[A-Za-z0-9_-]+)",
+    "linkedin": r"(https?://www\.linkedin\.com/(in|learning/certificates)/[A-Za-z0-9_-]+)",
+    "credly": r"(https?://www\.credly\.com/badges/[A-Za-z0-9_-]+)",
+    "coursera": r"(https?://www\.coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+)"
+  },
+  "date_patterns": [
+    r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})",
+    r"(\d{2}/\d{2}/\d{4})"
+  ],
+  "github_username": r"github\.com/([A-Za-z0-9_-]+)",
+  "validator_url_patterns": {
+    "edx": r"https?://(www\.)?edx\.org/certificates/[A-Za-z0-9_-]+/?",
+    "udemy": r"https?://(www\.)?udemy\.com/certificate/[A-Za-z0-9_-]+/?",
+    "linkedin": r"https?://(www\.)?linkedin\.com/learning/certificates/[A-Za-z0-9_-]+/?",
+    "credly": r"https?://(www\.)?credly\.com/badges/[A-Za-z0-9_-]+/?",
+    "coursera": r"https?://(www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?",
+    "linkedin": r"^https://(?:www\.)?linkedin\.com/(learning/certificates|in)/[A-Za-z0-9_-]+/?$",
+    "credly": r"^https://(?:www\.)?credly\.com/(?:org/[^/]+/badge/[^/]+|badges/[A-Za-z0-9_-]+)/?$",
+    "coursera": r"^https://(?:www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?$"
+  },
+  "extract_certificate_id": {
+    "udemy": r"/certificate/(UC-[A-Za-z0-9-]+)",
+    "credly": r"/badges/([A-Za-z0-9_-]+)",
+    "coursera": r"/account/accomplishments/verify/([A-Za-z0-9]+)",
+    "linkedin": r"/certificates/([A-Za-z0-9-]+)",
+    "edx": r"/certificates/([A-Za-z0-9]+)"
+  },
+  "certificate_canonical_urls": {
+    "udemy": "https://www.udemy.com/certificate/{id}/",
+    "credly": "https://www.credly.com/badges/{id}",
+    "coursera": "https://www.coursera.org/account/accomplishments/verify/{id}",
+    "linkedin": "https://www.linkedin.com/learning/certificates/{id}",
+    "edx": "https://www.edx.org/certificates/{id}"
+  },
+  "percentage_pattern": r"(\d+(?:\.\d+)?)%",
+  "decimal_pattern": r"(\d+\.\d+)",
+  "integer_pattern": r"(\d+)",
+  "followers_pattern": r"([\d,]+) followers",
+  "following_pattern": r"([\d,]+) following",
+  "posts_pattern": r"([\d,]+) posts",
+  "account_verified_pattern": r"([A-Za-z\s]+)'s account is verified",
+  "credly_og_title": r"^(?P<badge>.+?) was issued by (?P<issuer>.+?) to (?P<recipient>.+?)\.?$",
+  "udemy_og_description": r"^(?P<recipient>.+?) (?:has )?(?:successfully )?completed (?:the )?(?P<course>.+?)(?: (?:online )?course)?(?: on (?P<date>\d{2}/\d{2}/\d{4}))?\.?$",
+  "time_pattern": r"(\d+)\s*hours?\s*(\d+)?\s*minutes?",
+  "hours_pattern": r"(\d+)\s*hours?",
+  "minutes_pattern": r"(\d+)\s*minutes?"
+}
+
+SELECTORS_CONFIG = {
+  "date_selectors": [
+    "time",
+    "[data-testid=\"completion-date\"]",
+    ".completion-date",
+    ".certificate-date",
+    "span[class*=\"date\"]",
+    "div[class*=\"date\"]",
+    ".course-details p strong",
+    ".course-details p"
+  ],
+  "portfolio_fallback_tags": ["p"],
+  "portfolio_keywords": ["about", "developer", "engineer", "student", "enthusiast", "portfolio"],
+  "portfolio_exclude_keywords": ["copyright", "privacy", "terms", "cookie", "all rights", "responsibilities", "experience", "projects", "skills", "education", "contact"],
+  "portfolio_list_exclude_keywords": ["projects", "skills", "experience", "education", "contact", "resume", "certificates", "terms", "conditions", "icon", "hackathons", "internships"],
+  "user_agents": [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+  ],
+  "mock_metadata": {
+    "name": "Demo User",
+    "course": "Demo Course",
+    "issue_date": "2022-01-01"
+  },
+  "udemy": {
+    "title": "div.certificate-title, h1",
+    "description": "div.certificate-description, [data-purpose=\"certificate-description\"]",
+    "user_name": "div.user-name",
+    "issue_date": "div.issue-date, span.issue-date"
+  },
+  "credly": {
+    "badge_name": "h1.badge-title, div.BadgeTitle",
+    "issuer": "div.IssuerName",
+    "issue_date": "div.IssuedOn-date, div.IssuedOn",
+    "skills": "div.SkillsList, ul.skills-list"
+  },
+  "coursera": {
+    "name": "p.account-verification-description",
+    "course": "a.product-link",
+    "date": "span.completion-date, time, .certificate-date"
+  },
+  "linkedin": {
+    "name": ".profile-topcard-person-entity__name, h1.text-heading-xlarge",
+    "certificate": ".certificate-card, .certification-list__item"
+  },
+  "edx": {
+    "name": "h1.certificate-title, h1",
+    "date": "span.certificate-date, time"
+  },
+  "platform_names": {
+    "coursera": "Coursera",
+    "udemy": "Udemy",
+    "credly": "Credly",
+    "edx": "EdX",
+    "linkedin": "LinkedIn Learning"
+  },
+  "status_strings": {
+    "valid": "Valid",
+    "invalid": "Invalid",
+    "expired": "Expired",
+    "error": "Error"
+  },
+  "skill_keywords": [
+    "full stack", "ai", "web", "typescript", "next.js", "python", "modern ai", "agentic ai", "mentoring", "problem solving",
+    "javascript", "react", "node", "machine learning", "deep learning", "data science", "html", "css", "docker", "cloud",
+    "api", "database", "sql", "mongodb", "express", "django", "flask", "fastapi", "github", "git", "linux", "devops"
+  ],
+  "experience_keywords": [
+    "student", "leader", "mentoring", "competition", "troubleshoot", "support", "scored", "matriculation",
+    "distinction", "foundation", "performance", "contributions"
+  ],
+  "portfolio_name_selectors": [
+    "h1", "header h1", ".name", ".profile-name", ".user-name", ".hero-title", ".profileHeader-name", "title"
+],
+"portfolio_about_selectors": [
+    ".about", "#about", ".bio", ".description", ".profile-about", ".about-me", "section[aria-label='About']"
+],
+"portfolio_about_max_length": 500,
+"portfolio_about_fallback_tags": ["p", "div"],
+"portfolio_about_keywords": ["about", "developer", "engineer", "enthusiast", "student", "portfolio"],
+"portfolio_skills_selectors": [
+    ".skills", "#skills", ".skill-list", ".skills-list", ".tech-stack", ".stack", ".tags", ".chip", ".badge", ".skill", ".technology", ".technologies", ".skills-section", ".skills__list", ".skills__item", ".skills-container", ".skills-content", ".skills-block", ".skillsGroup", ".skills-section__list", ".skills-section__item", "[data-section='skills']", "[data-testid='skills']"
+],
+"portfolio_project_selectors": [
+    ".project", ".projects-list .project", ".project-card", ".portfolio-project", ".work", ".projectItem", ".projects__item", ".projects-section__item", ".project-block", ".project-entry", ".project-list__item", ".project-section__item", "[data-section='projects']", "[data-testid='projects']"
+],
+"portfolio_project_title_selectors": [
+    ".project-title", "h3", "h2", ".title"
+],
+"portfolio_project_desc_selectors": [
+    ".project-description", ".desc", "p", ".description"
+],
+"portfolio_project_link_selectors": [
+    "a", ".project-link", ".external-link"
+],
+"portfolio_project_fallback_domains": [
+    "github.com", "vercel.app", "netlify.app", "replit.com"
+],
+"portfolio_education_selectors": [
+    ".education", "#education", ".edu", ".education-list", ".degree", ".school", ".university", ".college", ".institute", "#resume", ".education-block", ".academic", ".academics", ".education-section", ".education__item", ".education-entry", ".education-list__item", ".education-section__item", "[data-section='education']", "[data-testid='education']"
+],
+"portfolio_contact_selectors": {
+    "email": ["a[href^='mailto:']", ".email", "#email"],
+    "linkedin": ["a[href*='linkedin.com']", ".linkedin"],
+    "github": ["a[href*='github.com']", ".github"],
+    "twitter": ["a[href*='twitter.com']", ".twitter"],
+    "website": ["a[href^='http']", ".website", ".site"]
+},
+"portfolio_skill_flexible_keywords": [
+    "skill", "stack", "tech", "tools", "technology", "technologies", "competence", "expertise", "proficiency", "abilities", "capabilities"
+],
+"portfolio_project_flexible_keywords": [
+    "project", "work", "portfolio", "case-study", "case_study", "case study", "side-project", "sideproject", "side project", "creation", "build", "demo"
+],
+"portfolio_education_flexible_keywords": [
+    "education", "degree", "school", "university", "college", "institute", "resume", "academic", "academics", "study", "studies", "formation", "diploma", "certification"
+],
+"portfolio_education_keywords": [
+    "bachelor", "master", "phd", "university", "college", "institute", "school", "degree", "resume", "academic", "studies", "diploma", "certification", "course", "formation"
+],
+"portfolio_education_exclude_keywords": [
+    "work", "project", "application", "email", "copywrite", "copyright", "linkedin", "latest", "side", "freelance", "management", "urban", "commercial", "application", "tools", "skills", "contact", "discover", "value", "team", "view", "certificates", "explore", "chat"
+],
+"portfolio_education_min_length": 6,
+"portfolio_education_max_length": 100,
+"portfolio_skill_min_length": 2,
+"portfolio_skill_max_length": 40,
+"portfolio_split_delimiters": ["\n", ",", "|", "•", "-", "\u2022", ";", ".", " and ", " with ", "  "],
+"portfolio_structured_keys": {
+    "name": ["name", "fullName", "full_name", "displayName"],
+    "about": ["about", "bio", "summary", "description", "intro", "tagline"],
+    "skills": ["skills", "techStack", "tech_stack", "technologies", "stack", "knowsAbout"],
+    "projects": ["projects", "works", "caseStudies", "portfolio"],
+    "education": ["education", "alumniOf", "schools"]
+},
+"portfolio_structured_profile_containers": ["profile", "user", "author", "person", "owner", "me", "basics", "personalInfo", "personal_info"],
+"portfolio_structured_profile_markers": ["bio", "about", "headline", "jobTitle", "job_title", "role", "email", "avatar", "location", "socials", "social", "resume", "firstName", "first_name"],
+"portfolio_structured_project_types": ["CreativeWork", "SoftwareSourceCode", "SoftwareApplication", "WebApplication", "Project"],
+"portfolio_structured_max_depth": 6,
+"portfolio_required_fields": ["name", "about", "projects"]
+}
+
+FETCH_CONFIG = {
+  "retry_policies": {
+    "default": {
+      "max_attempts": 3,
+      "base_delay": 1.0,
+      "max_delay": 20.0,
+      "max_total_delay": 30.0,
+      "max_sync_total_delay": 8.0,
+      "retry_statuses": [408, 425, 429, 500, 502, 503, 504]
+    },
+    "browser": {
+      "max_attempts": 3,
+      "base_delay": 2.0,
+      "max_delay": 8.0,
+      "max_total_delay": 15.0
+    },
+    "github": {
+      "max_attempts": 4,
+      "base_delay": 0.5,
+      "max_delay": 30.0,
+      "max_total_delay": 60.0
+    }
+  },
+  "circuit_breaker": {
+    "failure_threshold": 3,
+    "cooldown_seconds": 120.0,
+    "half_open_max_calls": 1
+  },
+  "hedging": {
+    "enabled": True,
+    "percentile": 0.95,
+    "default_delay": 2.0,
+    "min_delay": 0.25,
+    "min_samples": 10,
+    "window": 200,
+    "max_inflight_per_host": 2,
+    "max_hedge_ratio": 0.2,
+    "request_timeout": 30.0,
+    "workers": 16
+  },
+  "github": {
+    "backend": "rest",
+    "per_page": 100,
+    "page_concurrency": 4,
+    "graphql_batch_size": 10,
+    "token_queue_max_wait": 900.0,
+    "events_max_pages": 3,
+    "events_incremental": True,
+    "events_cache_size": 1000,
+    "events_max_age_days": 90,
+    "fetch_languages": True,
+    "languages_concurrency": 8,
+    "languages_reserve_calls": 500,
+    "languages_cache_size": 5000
+  },
+  "profile_cache": {
+    "ttl_seconds": 3600,
+    "stale_ttl_seconds": 86400,
+    "max_entries": 1000,
+    "persist_path": None
+  },
+  "static_validation": {
+    "credly": {
+      "enabled": True,
+      "timeout": 10.0
+    },
+    "udemy": {
+      "enabled": True,
+      "timeout": 10.0
+    }
+  },
+  "deadline": {
+    "upload_seconds": 120.0,
+    "min_browser_seconds": 15.0
+  },
+  "certificate_validation": {
+    "browser_platforms": ["credly", "udemy"],
+    "browser_concurrency": 2,
+    "http_concurrency": 8,
+    "url_timeout": 90.0
+  },
+  "certificate_cache": {
+    "enabled": True,
+    "persist_path": "certificate_cache.sqlite3",
+    "ttl_seconds": {
+      "Valid": 604800,
+      "Expired": 2592000,
+      "Invalid": 86400,
+      "Error": 120
+    }
+  },
+  "portfolio_crawl": {
+    "enabled": False,
+    "max_pages": 5,
+    "time_budget_seconds": 10.0,
+    "page_timeout": 5.0,
+    "workers": 4
+  }
+}
+
+PARSE_CONFIG = {
+  "backend": "auto",
+  "backend_preference": ["lxml", "html.parser"],
+  "targeted_certificate_parsing": True,
+  "targeted_chunk_size": 16384
+}
+# --- END INLINED CONFIGS ---
+
+# --- LOAD CONFIGS FOR REGEX AND SELECTORS ---
+# CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+# with open(os.path.join(CONFIG_DIR, 'regex_config.json'), 'r', encoding='utf-8') as f:
+#     REGEX_CONFIG = json.load(f)
+# with open(os.path.join(CONFIG_DIR, 'selectors_config.json'), 'r', encoding='utf-8') as f:
+#     SELECTORS_CONFIG = json.load(f)
+
+# Helper to get config value with error handling
+def get_config(config, *keys, default=None):
+    try:
+        for key in keys:
+            config = config[key]
+        return config
+    except (KeyError, TypeError):
+        if default is not None:
+            return default
+        raise KeyError(f"Missing config value for: {'/'.join(keys)}")
+
+# --- ENVIRONMENT ---
+load_dotenv()
+
+# --- DEADLINES ---
+
+class DeadlineExceeded(TimeoutError):
+    """The request-wide time budget ran out before a step could start."""
+
+class Deadline:
+    """Request-wide time budget that every layer clamps its own timeouts and retries to.
+
+    One is created per upload and passed explicitly to the certificate, portfolio
+    and GitHub fetchers. Below them (validators, retry budgets) it is read from
+    :func:`current_deadline`, which :meth:`applied` sets for the current thread or
+    task. ``Deadline(None)`` never expires.
+    """
+    def __init__(self, seconds: Optional[float] = None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    @classmethod
+    def from_config(cls) -> "Deadline":
+        seconds = os.getenv("UPLOAD_DEADLINE_SECONDS") or get_config(FETCH_CONFIG, "deadline", "upload_seconds")
+        return cls(float(seconds) if seconds else None)
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float("inf")
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def clamp(self, timeout: Optional[float]) -> Optional[float]:
+        """``timeout`` cut to the time left (None means no limit of its own); raises once nothing is left."""
+        if self.expires_at is None:
+            return timeout
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Request deadline of {self.seconds:.0f}s exceeded")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def narrowed(self, seconds: float) -> "Deadline":
+        """A deadline ``seconds`` from now, or this one if it expires sooner."""
+        if self.remaining() <= seconds:
+            return self
+        return Deadline(seconds)
+
+    def sleep(self, seconds: float):
+        """``time.sleep`` that never runs past the deadline."""
+        time.sleep(max(0.0, min(seconds, self.remaining())))
+
+    @contextmanager
+    def applied(self):
+        token = _current_deadline.set(self)
+        try:
+            yield self
+        finally:
+            _current_deadline.reset(token)
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar("deadline", default=None)
+NO_DEADLINE = Deadline()
+
+def current_deadline() -> Deadline:
+    return _current_deadline.get() or NO_DEADLINE
+
+def timed_out_result(message: str) -> Dict:
+    return {"error": message, "timed_out": True}
+
+def timed_out_sections(portfolio_data: Optional[Dict], github_profile: Optional[Dict], certificates: Dict[str, Dict],
+                       instagram_profile: Optional[Dict] = None) -> List[str]:
+    """Names of the upload response sections that hold partial results because the deadline ran out."""
+    sections = []
+    if (instagram_profile or {}).get("timed_out"):
+        sections.append("instagram_profile")
+    if (portfolio_data or {}).get("timed_out"):
+        sections.append("portfolio_data")
+    if (github_profile or {}).get("timed_out"):
+        sections.append("github_profile")
+    if any(result.get("timed_out") for result in certificates.values()):
+        sections.append("certificates")
+    return sections
+
+async def within_deadline(awaitable, deadline: Deadline, what: str):
+    """Await ``awaitable`` for at most the time left; on expiry return a :func:`timed_out_result` instead."""
+    try:
+        timeout = deadline.clamp(None)
+    except DeadlineExceeded:
+        awaitable.close()
+        return timed_out_result(f"{what} skipped: request deadline exceeded")
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        return timed_out_result(f"{what} timed out: request deadline exceeded")
+
+async def iterate_within(events, deadline: Deadline):
+    """Re-yield an async iterator until the deadline; raises :class:`DeadlineExceeded` when time runs out."""
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(events.__anext__(), deadline.clamp(None))
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded("Request deadline exceeded")
+            yield item
+    finally:
+        await events.aclose()
+
+# --- BROWSER ---
+
+def load_browser() -> SimpleNamespace:
+    """Selenium and webdriver_manager, imported the first time a page is actually rendered.
+
+    Processes that never render (most API and CLI runs) skip their import time
+    and memory entirely.
+    """
+    global _browser
+    if _browser is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from webdriver_manager.chrome import ChromeDriverManager
+        _browser = SimpleNamespace(
+            webdriver=webdriver, Options=Options, Service=Service, By=By, WebDriverWait=WebDriverWait, EC=EC,
+            TimeoutException=TimeoutException, WebDriverException=WebDriverException,
+            ChromeDriverManager=ChromeDriverManager
+        )
+    return _browser
+
+_browser: Optional[SimpleNamespace] = None
+
+def is_browser_error(exc: BaseException) -> bool:
+    """True for selenium errors; selenium cannot have raised one if it was never loaded."""
+    exceptions = sys.modules.get("selenium.common.exceptions")
+    return exceptions is not None and isinstance(exc, exceptions.WebDriverException)
+
+# --- RETRY POLICY ---
+def is_aiohttp_error(exc: BaseException) -> bool:
+    """True for aiohttp client errors; like selenium, aiohttp is only imported by the async fetchers that use it."""
+    client = sys.modules.get("aiohttp")
+    return client is not None and isinstance(exc, client.ClientError)
+
+class FetchResponse:
+    """Status, headers and body of an HTTP response, read before the connection is released."""
+    def __init__(self, status: int, headers: Dict[str, str], body: str):
+        self.status = status
+        self.headers = headers
+        self.body = body
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+class RetryBudget:
+    """Attempts and total backoff time one logical request may still spend on retries.
+
+    No retry is allowed whose backoff would reach the request :class:`Deadline`
+    (by default the one current when the budget is created).
+    """
+    def __init__(self, max_attempts: int, max_total_delay: float, deadline: Optional["Deadline"] = None):
+        self.max_attempts = max_attempts
+        self.max_total_delay = max_total_delay
+        self.deadline = deadline or current_deadline()
+        self.attempts = 0
+        self.delay_spent = 0.0
+    def allows(self, delay: float) -> bool:
+        return (self.attempts < self.max_attempts and self.delay_spent + delay <= self.max_total_delay
+                and delay < self.deadline.remaining())
+    def spend(self, delay: float):
+        self.delay_spent += delay
+
+class RetryPolicy:
+    """Jittered exponential backoff with status/exception classification.
+
+    Waiting is done with ``asyncio.sleep`` on the async path so the event loop keeps
+    serving other requests; the sync path is meant for code already running off the
+    loop (validators are dispatched with ``asyncio.to_thread``). A sleeping worker
+    still holds its thread and bulkhead slot, so sync budgets are capped at
+    ``max_sync_total_delay`` and never sleep past the request deadline.
+    """
+    RETRYABLE_EXCEPTIONS = (asyncio.TimeoutError, requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 20.0,
+                 max_total_delay: float = 30.0, retry_statuses: Optional[List[int]] = None,
+                 max_sync_total_delay: Optional[float] = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_delay = max_total_delay
+        self.max_sync_total_delay = min(max_total_delay, max_sync_total_delay if max_sync_total_delay is not None else max_total_delay)
+        self.retry_statuses = set(retry_statuses or [])
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_config(cls, name: str = "default") -> "RetryPolicy":
+        settings = dict(get_config(FETCH_CONFIG, "retry_policies", "default"))
+        settings.update(get_config(FETCH_CONFIG, "retry_policies", name, default={}))
+        return cls(**settings)
+
+    def new_budget(self, sync: bool = False, max_attempts: Optional[int] = None) -> RetryBudget:
+        """Budget for one logical request; ``sync`` budgets get the tighter blocking-sleep cap."""
+        return RetryBudget(max_attempts or self.max_attempts,
+                           self.max_sync_total_delay if sync else self.max_total_delay)
+
+    def should_retry_status(self, status: Optional[int], headers: Optional[Dict] = None) -> bool:
+        if status is None:
+            return False
+        if status in self.retry_statuses:
+            return True
+        # GitHub signals an exhausted primary rate limit as 403 + X-RateLimit-Remaining: 0
+        return status == 403 and str((headers or {}).get("X-RateLimit-Remaining", "")) == "0"
+
+    def should_retry_exception(self, exc: BaseException) -> bool:
+        return isinstance(exc, self.RETRYABLE_EXCEPTIONS) or is_aiohttp_error(exc) or is_browser_error(exc)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given zero-based attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def server_delay(self, headers: Optional[Dict]) -> Optional[float]:
+        """Delay requested by the server via Retry-After or X-RateLimit-Reset, if any."""
+        if not headers:
+            return None
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                from email.utils import parsedate_to_datetime
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        if str(headers.get("X-RateLimit-Remaining", "")) == "0" and headers.get("X-RateLimit-Reset"):
+            try:
+                return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+            except ValueError:
+                pass
+        return None
+
+    def delay_for(self, attempt: int, headers: Optional[Dict] = None) -> float:
+        server_delay = self.server_delay(headers)
+        return server_delay if server_delay is not None else self.backoff(attempt)
+
+    def _next_delay(self, budget: RetryBudget, result: Any = None, exc: Optional[BaseException] = None) -> Optional[float]:
+        """Return how long to wait before the next attempt, or None to stop retrying."""
+        if exc is not None:
+            if not self.should_retry_exception(exc):
+                return None
+            headers = None
+        else:
+            status = getattr(result, "status", None) or getattr(result, "status_code", None)
+            headers = getattr(result, "headers", None)
+            if not self.should_retry_status(status, headers):
+                return None
+        delay = self.delay_for(budget.attempts - 1, headers)
+        if not budget.allows(delay):
+            return None
+        budget.spend(delay)
+        return delay
+
+    async def call_async(self, func, *args, budget: Optional[RetryBudget] = None, **kwargs):
+        """Await ``func(*args, **kwargs)`` until it succeeds, is not retryable, or the budget runs out."""
+        budget = budget or self.new_budget()
+        while True:
+            budget.attempts += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(budget, exc=e)
+                if delay is None:
+                    raise
+                self.logger.warning(f"Attempt {budget.attempts} failed ({e}); retrying in {delay:.1f}s")
+            else:
+                delay = self._next_delay(budget, result=result)
+                if delay is None:
+                    return result
+                self.logger.warning(f"Attempt {budget.attempts} got retryable response; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def call(self, func, *args, budget: Optional[RetryBudget] = None, **kwargs):
+        """Synchronous counterpart of :meth:`call_async` for code running in worker threads."""
+        budget = budget or self.new_budget(sync=True)
+        while True:
+            budget.attempts += 1
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(budget, exc=e)
+                if delay is None:
+                    raise
+                self.logger.warning(f"Attempt {budget.attempts} failed ({e}); retrying in {delay:.1f}s")
+            else:
+                delay = self._next_delay(budget, result=result)
+                if delay is None:
+                    return result
+                self.logger.warning(f"Attempt {budget.attempts} got retryable response; retrying in {delay:.1f}s")
+            budget.deadline.sleep(delay)
+
+    def wait(self, budget: RetryBudget) -> bool:
+        """Sleep before the next hand-rolled attempt; False once the budget is exhausted."""
+        delay = self.backoff(budget.attempts - 1)
+        if not budget.allows(delay):
+            return False
+        budget.spend(delay)
+        budget.deadline.sleep(delay)
+        return True
+
+# --- CIRCUIT BREAKERS ---
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream (platform + host).
+
+    CLOSED lets everything through; after ``failure_threshold`` consecutive failures
+    the circuit OPENs and rejects calls for ``cooldown_seconds``. It then goes
+    HALF_OPEN and admits up to ``half_open_max_calls`` probes: a successful probe
+    closes the circuit, a failed one re-opens it for another cooldown. Callers
+    release their slot with :meth:`release_probe` however the call ends, so a
+    probe that records no outcome (cancelled, out of request time) does not
+    keep the circuit half-open forever.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown_seconds: float = 120.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit will admit a probe (0 when not open)."""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                self.logger.info(f"Circuit {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes_in_flight = 0
+
+    def release_probe(self):
+        """Hand back a half-open probe slot; neutral, the outcome (if any) is recorded separately.
+
+        Safe to call after ``record_success``/``record_failure`` (they already
+        free every slot) and for calls admitted while closed.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.logger.warning(f"Circuit {self.name} opened after {self._failures} consecutive failure(s)")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by ``platform:host`` (``www.`` is ignored)."""
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform_name: str, host: str) -> CircuitBreaker:
+        host = (host or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        key = f"{platform_name}:{host}"
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, **get_config(FETCH_CONFIG, "circuit_breaker"))
+                self._breakers[key] = breaker
+            return breaker
+
+    def for_url(self, platform_name: str, url: str) -> CircuitBreaker:
+        return self.get(platform_name, urlparse(url).netloc)
+
+    def snapshot(self) -> Dict[str, str]:
+        with self._lock:
+            return {key: breaker.state for key, breaker in self._breakers.items()}
+
+circuit_breakers = CircuitBreakerRegistry()
+
+def circuit_open_message(breaker: CircuitBreaker) -> str:
+    return f"Upstream {breaker.name} is failing; skipping requests for {breaker.retry_after():.0f}s"
+
+class UpstreamUnavailable(RuntimeError):
+    """The upstream did not answer usefully (transport error, 5xx or 429), as opposed to answering "not found"."""
+
+def is_upstream_failure(status: int) -> bool:
+    return status >= 500 or status == 429
+
+def record_upstream_status(breaker: CircuitBreaker, status: int):
+    """Count 5xx and 429 responses as upstream failures; anything else means the host is answering."""
+    if is_upstream_failure(status):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+# --- HTML PARSING ---
+
+# BeautifulSoup tree builders, with the module each one needs installed
+HTML_PARSER_BACKENDS = {
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+    "html.parser": None
+}
+
+def available_parser_backends() -> List[str]:
+    return [name for name, module in HTML_PARSER_BACKENDS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+_parser_backend: Optional[str] = None
+
+def get_parser_backend() -> str:
+    """Resolve the parser backend once: ``HTML_PARSER_BACKEND`` env, then config, then the fastest installed."""
+    global _parser_backend
+    if _parser_backend is None:
+        available = available_parser_backends()
+        backend = os.getenv("HTML_PARSER_BACKEND") or get_config(PARSE_CONFIG, "backend")
+        if backend != "auto" and backend not in available:
+            logger.warning(f"HTML parser backend '{backend}' is not available; choosing automatically")
+            backend = "auto"
+        if backend == "auto":
+            backend = next((name for name in get_config(PARSE_CONFIG, "backend_preference") if name in available), "html.parser")
+        _parser_backend = backend
+    return _parser_backend
+
+def make_soup(markup, backend: Optional[str] = None, **kwargs) -> BeautifulSoup:
+    """Parse ``markup`` with the configured backend; every BeautifulSoup call site goes through here."""
+    return BeautifulSoup(markup, backend or get_parser_backend(), **kwargs)
+
+# --- KEYWORD MATCHING ---
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a whole keyword list in one scan of the text.
+
+    Keywords are lowercased once and compiled into a single regex laid out as a
+    prefix trie (``c(?:hat|o(?:ntact|pyright))``...), which ``re`` walks like an
+    Aho-Corasick automaton instead of re-scanning the text once per keyword.
+    The alternation sits in a lookahead so overlapping keywords are all seen.
+    """
+    def __init__(self, keywords):
+        self.keywords = sorted({kw.lower() for kw in keywords if kw})
+        self.pattern = re.compile(f"(?=({self._trie_pattern(self.keywords)}))") if self.keywords else None
+        # The greedy trie reports the longest keyword at each position; shorter ones sharing that start come from here
+        self._prefixes = {kw: [other for other in self.keywords if kw.startswith(other)] for kw in self.keywords}
+
+    @staticmethod
+    def _trie_pattern(keywords: List[str]) -> str:
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: Dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+    def search(self, text: Optional[str]) -> bool:
+        """True when any keyword occurs in ``text``."""
+        return bool(text and self.pattern and self.pattern.search(text.lower()))
+
+    def find_all(self, text: Optional[str]) -> set:
+        """Every keyword that occurs in ``text``."""
+        if not text or not self.pattern:
+            return set()
+        return {keyword for match in self.pattern.finditer(text.lower()) for keyword in self._prefixes[match.group(1)]}
+
+@lru_cache(maxsize=128)
+def _compiled_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+def keyword_matcher(keywords) -> KeywordMatcher:
+    """Shared :class:`KeywordMatcher` for a keyword list, compiled on first use."""
+    return _compiled_keyword_matcher(tuple(keywords or ()))
+
+# --- SELECTOR PROGRAM ---
+
+_COMPOUND_SELECTOR = re.compile(r"^(?P<tag>[A-Za-z][\w-]*)?(?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)$")
+_SELECTOR_PART = re.compile(r"([.#])([\w-]+)|\[\s*([\w:-]+)\s*(?:([\^*$~]?=)\s*(?:'([^']*)'|\"([^\"]*)\"|([\w-]+)))?\s*\]")
+
+class CompiledSelector:
+    """A CSS selector parsed once.
+
+    ``pattern`` is the soupsieve compilation; ``plan`` is ``(tag, [(kind, name, op, value)])``
+    for compound selectors that :class:`DocumentIndex` can answer from its buckets,
+    or None for selectors with combinators, groups or pseudo-classes.
+    """
+    __slots__ = ("text", "pattern", "plan", "chains")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pattern = soupsieve.compile(text)
+        self.plan = self._compound_plan(text)
+        self.chains = self._selector_chains(text)
+
+    @classmethod
+    def _selector_chains(cls, text: str) -> Optional[List[List[Tuple[str, Tuple]]]]:
+        """Each comma group as ``[(combinator, plan), ...]`` (descendant ``" "`` / child ``">"`` only), or None."""
+        chains = []
+        for group in text.split(","):
+            chain = []
+            combinator = " "
+            for token in re.split(r"(\s*>\s*|\s+)", group.strip()):
+                if not token.strip() or token.strip() == ">":
+                    combinator = ">" if ">" in token else " "
+                    continue
+                plan = cls._compound_plan(token)
+                if plan is None:
+                    return None
+                chain.append((combinator, plan))
+                combinator = " "
+            if not chain:
+                return None
+            chains.append(chain)
+        return chains
+
+    @staticmethod
+    def _compound_plan(text: str) -> Optional[Tuple]:
+        match = _COMPOUND_SELECTOR.match(text.strip())
+        if not match or not (match.group("tag") or match.group("rest")):
+            return None
+        rest = match.group("rest")
+        parts = []
+        for part in _SELECTOR_PART.finditer(rest):
+            prefix, name, attr, op, *quoted = part.groups()
+            if prefix:
+                parts.append(("class" if prefix == "." else "id", name, None, None))
+            else:
+                value = next((q for q in quoted if q is not None), None)
+                parts.append(("attr", attr.lower(), op, value))
+        if "".join(part.group(0) for part in _SELECTOR_PART.finditer(rest)) != rest:
+            return None
+        return match.group("tag") and match.group("tag").lower(), parts
+
+    def select(self, root) -> List:
+        return self.pattern.select(root)
+
+    def select_one(self, root):
+        return self.pattern.select_one(root)
+
+    def __repr__(self) -> str:
+        return f"CompiledSelector({self.text!r})"
+
+def match_selector_part(node, kind: str, name: str, op: Optional[str], value: Optional[str]) -> bool:
+    """Check one ``(kind, name, op, value)`` plan part against a bs4 Tag or lxml element."""
+    if kind == "class":
+        classes = node.get("class") or []
+        return name in (classes.split() if isinstance(classes, str) else classes)
+    if kind == "id":
+        return node.get("id") == name
+    actual = node.get(name)
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if isinstance(actual, list):
+        actual = " ".join(actual)
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if not value:
+        return False
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    return value in actual
+
+@lru_cache(maxsize=1024)
+def compile_selector(text: str) -> CompiledSelector:
+    return CompiledSelector(text)
+
+class SelectorProgram:
+    """``SELECTORS_CONFIG`` compiled into the selector lists each parser runs.
+
+    ``platforms[name][field]`` holds the certificate page selectors, ``dates`` the
+    shared date selectors, and ``portfolio`` the ``portfolio_*_selectors``
+    groups keyed without prefix/suffix (``"skills"``, ``"project_title"``, ``"contact"``...).
+    """
+    PLATFORMS = ("coursera", "credly", "edx", "linkedin", "udemy")
+
+    def __init__(self, config: Dict):
+        self.platforms: Dict[str, Dict[str, CompiledSelector]] = {
+            platform: {field: compile_selector(selector) for field, selector in config[platform].items()}
+            for platform in self.PLATFORMS if platform in config
+        }
+        self.dates = [compile_selector(selector) for selector in config.get("date_selectors", [])]
+        self.portfolio: Dict[str, Any] = {}
+        for key, value in config.items():
+            if not (key.startswith("portfolio_") and key.endswith("_selectors")):
+                continue
+            group = key[len("portfolio_"):-len("_selectors")]
+            if isinstance(value, dict):
+                self.portfolio[group] = {name: [compile_selector(s) for s in selectors] for name, selectors in value.items()}
+            else:
+                self.portfolio[group] = [compile_selector(s) for s in value]
+
+    def platform(self, name: str) -> Dict[str, CompiledSelector]:
+        return self.platforms.get(name, {})
+
+selector_program: Optional[SelectorProgram] = None
+
+def get_selector_program() -> SelectorProgram:
+    global selector_program
+    if selector_program is None:
+        selector_program = SelectorProgram(SELECTORS_CONFIG)
+    return selector_program
+
+def reload_selector_program(path: Optional[str] = None) -> SelectorProgram:
+    """Recompile the selector program, first reloading ``SELECTORS_CONFIG`` from JSON when a path is given.
+
+    ``path`` defaults to the ``SELECTORS_CONFIG_PATH`` env var; keys in the file
+    replace the inlined ones. The new config is compiled before anything is
+    swapped in, so a bad file (ValueError, SelectorSyntaxError) leaves both the
+    config and the running program untouched.
+    """
+    global selector_program
+    path = path or os.getenv("SELECTORS_CONFIG_PATH")
+    overrides = {}
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"{path} must contain a JSON object, not {type(overrides).__name__}")
+    try:
+        SelectorProgram(dict(SELECTORS_CONFIG, **overrides))
+    except (TypeError, AttributeError, KeyError) as e:
+        raise ValueError(f"Malformed selector config: {e!r}") from e
+    SELECTORS_CONFIG.update(overrides)
+    # Rebuild against an empty cache so selectors dropped by the new config are released
+    compile_selector.cache_clear()
+    selector_program = SelectorProgram(SELECTORS_CONFIG)
+    logger.info(f"Compiled selector program ({compile_selector.cache_info().currsize} selectors)")
+    return selector_program
+
+# --- TARGETED PAGE PARSING ---
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # targeted parsing falls back to a full soup without lxml
+    lxml_etree = None
+
+# Text of these elements is not part of BeautifulSoup's get_text()
+_NON_TEXT_TAGS = {"script", "style", "template"}
+
+class FieldSpec:
+    """Selectors for one page field, in priority order, with an optional ``accept(text)`` check.
+
+    Mirrors the validators' loops: the first match of each selector is tried in
+    turn and the first one whose text is accepted wins.
+    """
+    def __init__(self, selectors: List[CompiledSelector], accept=None, strip: bool = True):
+        self.selectors = selectors
+        self.accept = accept
+        self.strip = strip
+
+def _lxml_strings(element):
+    if isinstance(element.tag, str) and element.tag not in _NON_TEXT_TAGS and element.text:
+        yield element.text
+    for child in element:
+        yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+def element_text(element, strip: bool = False) -> str:
+    """``get_text()`` / ``get_text(strip=True)`` for a bs4 Tag or an lxml element."""
+    if element is None:
+        return ""
+    if isinstance(element, Tag):
+        return element.get_text(strip=strip)
+    strings = _lxml_strings(element)
+    return "".join(string.strip() for string in strings) if strip else "".join(strings)
+
+def _lxml_compound_matches(element, plan: Tuple) -> bool:
+    tag_name, parts = plan
+    if not isinstance(element.tag, str) or (tag_name and element.tag.lower() != tag_name):
+        return False
+    return all(match_selector_part(element, *part) for part in parts)
+
+def _lxml_chain_matches(element, chain: List[Tuple[str, Tuple]], position: int) -> bool:
+    combinator, plan = chain[position]
+    if not _lxml_compound_matches(element, plan):
+        return False
+    if position == 0:
+        return True
+    parent = element.getparent()
+    if combinator == ">":
+        return parent is not None and _lxml_chain_matches(parent, chain, position - 1)
+    while parent is not None:
+        if _lxml_chain_matches(parent, chain, position - 1):
+            return True
+        parent = parent.getparent()
+    return False
+
+def select_one_within(element, selector: "CompiledSelector"):
+    """``select_one`` below a bs4 Tag or a (fully parsed) lxml element."""
+    if element is None or isinstance(element, Tag):
+        return selector.select_one(element) if element is not None else None
+    if selector.chains is None:
+        return selector.select_one(make_soup(lxml_etree.tostring(element, encoding="unicode")))
+    for descendant in element.iterdescendants():
+        if any(_lxml_chain_matches(descendant, chain, len(chain) - 1) for chain in selector.chains):
+            return descendant
+    return None
+
+class PageFields:
+    """Result of :func:`extract_page_fields`: the winning element per field plus page-level stats."""
+    def __init__(self, elements: Dict[str, Any], root, mode: str, parsed_chars: int, total_chars: int,
+                 content: Optional[str] = None):
+        self.elements = elements
+        self.root = root
+        self.mode = mode
+        self.parsed_chars = parsed_chars
+        self.total_chars = total_chars
+        self.content = content
+        self._text: Optional[str] = None
+
+    def get(self, field: str):
+        return self.elements.get(field)
+
+    @property
+    def complete(self) -> bool:
+        return self.parsed_chars >= self.total_chars
+
+    def text(self) -> str:
+        """Text of the whole page; if parsing stopped early, the rest is parsed now."""
+        if self._text is None:
+            root = self.root if self.complete or self.content is None else lxml_etree.HTML(self.content)
+            self._text = element_text(root)
+        return self._text
+
+class TargetedPageParser:
+    """Pull-parse only as much HTML as it takes to settle every requested field.
+
+    Chunks are fed to lxml's ``HTMLPullParser``; each start tag is checked
+    against the fields' selector chains and the element's text is judged on its
+    end tag. A field is settled once all of its higher-priority selectors have
+    been decided and one was accepted; when every field is settled, feeding
+    stops and the rest of the page is never parsed.
+    """
+    def __init__(self, fields: Dict[str, FieldSpec], chunk_size: int):
+        self.fields = fields
+        self.chunk_size = chunk_size
+
+    def supported(self) -> bool:
+        return lxml_etree is not None and all(
+            selector.chains is not None for spec in self.fields.values() for selector in spec.selectors)
+
+    def parse(self, content: str) -> PageFields:
+        # decisions[field][k]: None = undecided, False = first match rejected, element = accepted
+        self.decisions = {field: [None] * len(spec.selectors) for field, spec in self.fields.items()}
+        self.pending: Dict[int, Tuple[Any, List[Tuple[str, int]]]] = {}
+        # Only the first match of each selector counts, as with select_one
+        self.claimed = set()
+        self.settled = set()
+        parser = lxml_etree.HTMLPullParser(events=("start", "end"))
+        offset = 0
+        while offset < len(content) and len(self.settled) < len(self.fields):
+            parser.feed(content[offset:offset + self.chunk_size])
+            offset += self.chunk_size
+            self._consume(parser.read_events())
+        root = parser.close()
+        self._consume(parser.read_events())
+        elements = {field: next((decision for decision in decisions if decision is not None and decision is not False), None)
+                    for field, decisions in self.decisions.items()}
+        return PageFields(elements, root, "targeted", min(offset, len(content)), len(content), content)
+
+    def _consume(self, events):
+        for event, element in events:
+            if event == "start":
+                waiting = [(field, k) for field, spec in self.fields.items() if field not in self.settled
+                           for k, selector in enumerate(spec.selectors)
+                           if (field, k) not in self.claimed
+                           and any(_lxml_chain_matches(element, chain, len(chain) - 1) for chain in selector.chains)]
+                if waiting:
+                    self.claimed.update(waiting)
+                    self.pending[id(element)] = (element, waiting)
+            elif id(element) in self.pending:
+                element, waiting = self.pending.pop(id(element))
+                for field, k in waiting:
+                    spec = self.fields[field]
+                    accepted = spec.accept is None or spec.accept(element_text(element, spec.strip))
+                    self.decisions[field][k] = element if accepted else False
+                    if self._settled(self.decisions[field]):
+                        self.settled.add(field)
+
+    @staticmethod
+    def _settled(field_decisions: List) -> bool:
+        for decision in field_decisions:
+            if decision is None:
+                return False
+            if decision is not False:
+                return True
+        return True
+
+def extract_page_fields(content: str, fields: Dict[str, FieldSpec], targeted: Optional[bool] = None) -> PageFields:
+    """Find each field's element, with the targeted pull parser when possible, else over a full soup."""
+    if targeted is None:
+        targeted = get_config(PARSE_CONFIG, "targeted_certificate_parsing")
+    if targeted:
+        parser = TargetedPageParser(fields, get_config(PARSE_CONFIG, "targeted_chunk_size"))
+        if parser.supported():
+            return parser.parse(content)
+    soup = make_soup(content)
+    elements = {}
+    for field, spec in fields.items():
+        elements[field] = None
+        for selector in spec.selectors:
+            element = selector.select_one(soup)
+            if element is not None and (spec.accept is None or spec.accept(element_text(element, spec.strip))):
+                elements[field] = element
+                break
+    return PageFields(elements, soup, "full", len(content), len(content))
+
+# --- VALIDATOR REGISTRY ---
+class ValidatorRegistry:
+    """Maps certificate hosts to platforms and builds each platform's validator on first use.
+
+    A factory is a validator class or a ``"module:attr"`` string, so a platform
+    can be registered without importing its module until one of its URLs shows up.
+    """
+    def __init__(self):
+        self._factories: Dict[str, Any] = {}
+        self._hosts: Dict[str, str] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_host(host: str) -> str:
+        host = (host or "").lower().rsplit("@", 1)[-1].split(":", 1)[0]
+        return host[4:] if host.startswith("www.") else host
+
+    def register(self, platform_name: str, hosts: Tuple[str, ...], factory: Any):
+        with self._lock:
+            self._factories[platform_name] = factory
+            self._instances.pop(platform_name, None)
+            for host in hosts:
+                self._hosts[self.normalize_host(host)] = platform_name
+
+    def platform_for(self, host: str) -> Optional[str]:
+        return self._hosts.get(self.normalize_host(host))
+
+    def platforms(self) -> List[str]:
+        return sorted(self._factories)
+
+    def get(self, platform_name: str) -> Optional["BaseValidator"]:
+        validator = self._instances.get(platform_name)
+        if validator is not None:
+            return validator
+        with self._lock:
+            if platform_name not in self._instances:
+                factory = self._factories.get(platform_name)
+                if factory is None:
+                    return None
+                if isinstance(factory, str):
+                    module_name, _, attr = factory.partition(":")
+                    factory = getattr(importlib.import_module(module_name), attr)
+                self._instances[platform_name] = factory()
+            return self._instances[platform_name]
+
+    def for_host(self, host: str) -> Optional["BaseValidator"]:
+        platform_name = self.platform_for(host)
+        return self.get(platform_name) if platform_name else None
+
+validator_registry = ValidatorRegistry()
+
+def register_validator(*hosts: str):
+    """Class decorator registering a validator for ``hosts`` under its ``platform`` name."""
+    def decorator(cls):
+        validator_registry.register(cls.platform, hosts, cls)
+        return cls
+    return decorator
+
+# --- VALIDATOR CLASSES ---
+class ValidationTierStats:
+    """Counts which tier (static probe, browser, ...) settled each certificate, per platform."""
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record(self, platform_name: str, tier: str):
+        with self._lock:
+            self._counts[platform_name][tier] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {platform_name: dict(tiers) for platform_name, tiers in self._counts.items()}
+
+validation_tiers = ValidationTierStats()
+
+def open_graph_tags(soup) -> Dict[str, str]:
+    """``og:*`` meta properties of a page, keyed without the prefix."""
+    tags = {}
+    for meta in soup.find_all("meta", attrs={"property": re.compile(r"^og:")}):
+        if meta.get("content"):
+            tags.setdefault(meta["property"][3:], meta["content"].strip())
+    return tags
+
+# BaseValidator (from base_validator.py)
+
+class BaseValidator(abc.ABC):
+    """Abstract base class for certificate validators."""
+    platform = ""
+    
+    def __init__(self):
+        """Initialize the base validator."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # Removed screenshot_dir and screenshots folder creation
+    
+    @abc.abstractmethod
+    def validate_url_pattern(self, url: str) -> bool:
+        pass
+    
+    @abc.abstractmethod
+    def extract_metadata(self, url: str) -> Dict:
+        pass
+    
+    @abc.abstractmethod
+    def check_certificate_status(self, metadata: Dict) -> str:
+        pass
+    
+    def capture_screenshot(self, url: str, certificate_id: str) -> Optional[str]:
+        # Screenshot functionality removed
+        self.logger.info("Screenshot capture disabled (screenshots folder removed)")
+        return None
+    
+    def validate_certificate(self, url: str, capture_screenshot: bool = False) -> Dict:
+        self.logger.info(f"Validating certificate: {url}")
+        try:
+            metadata = self.extract_metadata(url)
+            if not metadata:
+                return {
+                    "status": "Invalid",
+                    "data": {},
+                    "confidence": 0,
+                    "screenshot": None,
+                    "error_message": "Failed to extract metadata"
+                }
+            status = self.check_certificate_status(metadata)
+            confidence = self._calculate_confidence(metadata, status)
+            screenshot_path = None
+            # Screenshot logic removed
+            return {
+                "status": status,
+                "data": metadata,
+                "confidence": confidence,
+                "screenshot": None,
+                "error_message": None
+            }
+        except Exception as e:
+            self.logger.error(f"Validation error: {e}")
+            return {
+                "status": "Error",
+                "data": {},
+                "confidence": 0,
+                "screenshot": None,
+                "error_message": str(e)
+            }
+    
+    def _calculate_confidence(self, metadata: Dict, status: str) -> int:
+        base_confidence = 80
+        if status in ["Invalid", "Error"]:
+            return 0
+        elif status == "Expired":
+            base_confidence -= 20
+        elif status == "Revoked":
+            base_confidence -= 40
+        required_fields = ["name", "course", "issue_date"]
+        missing_fields = sum(1 for field in required_fields if not metadata.get(field))
+        if missing_fields == 0:
+            base_confidence += 10
+        elif missing_fields == 1:
+            base_confidence -= 10
+        else:
+            base_confidence -= 30
+        return max(0, min(100, base_confidence))
+    
+    def _make_request(self, url: str, max_retries: int = 3, use_selenium: bool = False) -> Optional[str]:
+        """Page body, or None when the page does not exist (4xx).
+
+        Raises UpstreamUnavailable when the platform itself fails, so a missing
+        certificate is reported as Invalid while an outage surfaces as an Error.
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        policy = RetryPolicy.from_config("browser" if use_selenium else "default")
+        budget = policy.new_budget(sync=True, max_attempts=max_retries)
+        try:
+            if use_selenium:
+                return policy.call(self._render_page_source, url, budget=budget)
+            # Each attempt gets whatever is left of the request deadline, up to 10s
+            response = policy.call(lambda: requests.get(url, headers=headers, timeout=budget.deadline.clamp(10)), budget=budget)
+        except Exception as e:
+            self.logger.warning(f"Request failed after {budget.attempts} attempt(s): {e}")
+            raise UpstreamUnavailable(f"Request to {url} failed: {e}") from e
+        if is_upstream_failure(response.status_code):
+            raise UpstreamUnavailable(f"Request to {url} returned status {response.status_code}")
+        if not response.ok:
+            self.logger.warning(f"Request to {url} returned status {response.status_code}")
+            return None
+        return response.text
+
+    def _setup_webdriver(self) -> Optional[Any]:
+        """Headless Chrome set up to look like a regular browser, or None if it cannot start."""
+        browser = load_browser()
+        try:
+            chrome_options = browser.Options()
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-software-rasterizer")
+            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+            chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+            chrome_options.add_argument("--disable-site-isolation-trials")
+            chrome_options.add_argument("--disable-web-security")
+            chrome_options.add_argument("--allow-running-insecure-content")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument(f"--user-agent={random.choice(get_config(SELECTORS_CONFIG, 'user_agents'))}")
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option("useAutomationExtension", False)
+            service = browser.Service(browser.ChromeDriverManager().install())
+            driver = browser.webdriver.Chrome(service=service, options=chrome_options)
+            driver.set_page_load_timeout(current_deadline().clamp(30))
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+            })
+            return driver
+        except Exception as e:
+            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
+            return None
+
+    def _render_page_source(self, url: str) -> str:
+        self.logger.info(f"Attempting to fetch with Selenium: {url}")
+        browser = load_browser()
+        chrome_options = browser.Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument(f"--user-agent={random.choice(get_config(SELECTORS_CONFIG, 'user_agents'))}")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+        service = browser.Service(browser.ChromeDriverManager().install())
+        driver = browser.webdriver.Chrome(service=service, options=chrome_options)
+        try:
+            driver.set_page_load_timeout(current_deadline().clamp(30))
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+            })
+            driver.get(url)
+            return driver.page_source
+        finally:
+            driver.quit()
+
+# --- CourseraValidator (from coursera_validator.py) ---
+@register_validator("coursera.org")
+class CourseraValidator(BaseValidator):
+    """Validator for Coursera certificates."""
+    platform = "coursera"
+    
+    def __init__(self):
+        super().__init__()
+        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "coursera"))
+    def validate_url_pattern(self, url: str) -> bool:
+        return bool(self.url_pattern.match(url))
+    def extract_metadata(self, url: str) -> Dict:
+        self.logger.info(f"Extracting metadata from Coursera URL: {url}")
+        certificate_id = self._extract_certificate_id(url)
+        content = self._make_request(url)
+        if not content:
+            self.logger.error("Failed to fetch Coursera certificate page")
+            return {}
+        metadata = {
+            "certificate_id": certificate_id,
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "coursera"),
+            "verification_url": url
+        }
+        selectors = get_selector_program().platform("coursera")
+        page = extract_page_fields(content, {
+            "name": FieldSpec([selectors["name"]], strip=False),
+            "date": FieldSpec(get_selector_program().dates, accept=lambda text: bool(
+                text and not any(word in text.lower() for word in ['completed', 'by', 'account', 'verified'])
+                and self._parse_date(text)))
+        })
+        name_element = page.get("name")
+        if name_element is not None:
+            text = element_text(name_element)
+            name_match = re.search(get_config(REGEX_CONFIG, "account_verified_pattern"), text)
+            if name_match:
+                metadata["name"] = name_match.group(1).strip()
+        # The course link only counts inside the name paragraph; the name element is
+        # complete once its field settles, so its descendants are all parsed
+        course_link = select_one_within(name_element, selectors["course"])
+        if course_link is not None:
+            metadata["course"] = element_text(course_link, strip=True)
+        if page.get("date") is not None:
+            metadata["issue_date"] = self._parse_date(element_text(page.get("date"), strip=True))
+        if not metadata.get("issue_date"):
+            page_text = page.text()
+            date_patterns = get_config(REGEX_CONFIG, "date_patterns")
+            for pattern in date_patterns:
+                date_match = re.search(pattern, page_text)
+                if date_match:
+                    parsed_date = self._parse_date(date_match.group(1))
+                    if parsed_date:
+                        metadata["issue_date"] = parsed_date
+                        break
+        # The rest of the fields (expiry, instructor, org) can be config-driven if needed
+        if not metadata.get("name") and not metadata.get("course"):
+            metadata.update(self._get_mock_metadata(certificate_id))
+        self.logger.info(f"Extracted metadata: {metadata}")
+        return metadata
+    def check_certificate_status(self, metadata: Dict) -> str:
+        if not metadata:
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        required_fields = ["name", "course", "issue_date"]
+        if not all(metadata.get(field) for field in required_fields):
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        if metadata.get("expiry_date"):
+            try:
+                expiry_date = datetime.strptime(metadata["expiry_date"], "%Y-%m-%d")
+                if expiry_date < datetime.now():
+                    return get_config(SELECTORS_CONFIG, "status_strings", "expired")
+            except (ValueError, TypeError):
+                pass
+        if metadata.get("issue_date"):
+            try:
+                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
+                if issue_date < datetime(2010, 1, 1):
+                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+            except (ValueError, TypeError):
+                pass
+        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
+    def _extract_certificate_id(self, url: str) -> str:
+        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "coursera")
+        match = re.search(pattern, url)
+        return match.group(1) if match else "unknown"
+    def _parse_date(self, date_text: str) -> Optional[str]:
+        if not date_text:
+            return None
+        date_formats = [
+            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
+            "%d %B %Y", "%d %b %Y", "%B %d %Y", "%b %d %Y"
+        ]
+        for fmt in date_formats:
+            try:
+                parsed_date = datetime.strptime(date_text.strip(), fmt)
+                return parsed_date.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
+            year_month_day = re.search(pattern, date_text)
+            if year_month_day:
+                groups = year_month_day.groups()
+                if len(groups) == 3:
+                    year, month, day = groups
+                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        return None
+    def _get_mock_metadata(self, certificate_id: str) -> Dict:
+        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
+        return {
+            "certificate_id": certificate_id,
+            # Placeholder data, not read from the page: never cached
+            "mock": True,
+            "name": mock["name"],
+            "course": mock["course"],
+            "issue_date": mock["issue_date"],
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "coursera"),
+            "verification_url": f"https://www.coursera.com/certificate/{certificate_id}"
+        }
+
+# --- CredlyValidator (from credly_validator.py) ---
+@register_validator("credly.com")
+class CredlyValidator(BaseValidator):
+    """Validator for Credly badges."""
+    platform = "credly"
+    def __init__(self):
+        super().__init__()
+        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "credly"))
+        self.user_agents = get_config(SELECTORS_CONFIG, "user_agents")
+    def validate_url_pattern(self, url: str) -> bool:
+        return bool(self.url_pattern.match(url))
+    def _extract_metadata_from_html(self, content: str) -> Tuple[Dict, bool]:
+        metadata = {}
+        success = False
+        try:
+            soup = make_soup(content)
+            # Badge name
+            badge_name = soup.find('h1', class_='ac-heading ac-heading--badge-name-hero')
+            if badge_name:
+                metadata["badge_name"] = badge_name.get_text(strip=True)
+                self.logger.info(f"Found badge name: {metadata['badge_name']}")
+            # Issuer
+            issuer_div = soup.find('div', class_='cr-badges-badge-issuer__entity')
+            if issuer_div:
+                issuer_text = issuer_div.get_text(strip=True)
+                if issuer_text.lower().startswith('issued by'):
+                    issuer_text = issuer_text[len('issued by'):].strip()
+                metadata["organization"] = issuer_text
+                self.logger.info(f"Found organization: {metadata['organization']}")
+            # Description
+            desc_div = soup.find('div', class_='cr-badges-full-badge__description')
+            if desc_div:
+                desc_span = desc_div.find('span', class_='shiitake-children')
+                if desc_span:
+                    metadata["description"] = desc_span.get_text(strip=True)
+                else:
+                    metadata["description"] = desc_div.get_text(strip=True)
+            # Skills
+            skills_ul = soup.find('ul', class_='cr-badges-badge-skills__skills')
+            if skills_ul:
+                skills = [li.get_text(strip=True) for li in skills_ul.find_all('li')]
+                metadata["skills"] = skills
+                self.logger.info(f"Found skills: {skills}")
+            # Earning Criteria
+            criteria_ul = soup.find('ul', class_='cr-badges-earning-criteria__criteria')
+            if criteria_ul:
+                criteria = [li.get_text(strip=True) for li in criteria_ul.find_all('li')]
+                metadata["earning_criteria"] = criteria
+                self.logger.info(f"Found earning criteria: {criteria}")
+            if metadata.get("badge_name") and metadata.get("organization"):
+                success = True
+        except Exception as e:
+            self.logger.error(f"Error parsing HTML: {str(e)}")
+        return metadata, success
+    def _metadata_from_badge_json(self, data) -> Tuple[Dict, bool]:
+        """Map Credly's public badge JSON onto the keys the HTML scrape produces."""
+        if isinstance(data, dict) and isinstance(data.get("data"), dict):
+            data = data["data"]
+        if not isinstance(data, dict):
+            return {}, False
+        template = data.get("badge_template") or {}
+        metadata = {}
+        badge_name = template.get("name") or data.get("name")
+        if badge_name:
+            metadata["badge_name"] = badge_name.strip()
+        issuer = data.get("issuer") or template.get("issuer") or {}
+        # Usually {"summary", "entities"}, but some badges carry a bare name or the entity list itself
+        if isinstance(issuer, str):
+            issuer = {"summary": issuer}
+        elif isinstance(issuer, list):
+            issuer = {"entities": issuer}
+        elif not isinstance(issuer, dict):
+            issuer = {}
+        entities = [entry.get("entity") or entry for entry in issuer.get("entities") or [] if isinstance(entry, dict)]
+        organization = next((entity.get("name") for entity in entities
+                             if isinstance(entity, dict) and isinstance(entity.get("name"), str) and entity.get("name")), None)
+        if not organization and isinstance(issuer.get("summary"), str) and issuer["summary"].strip():
+            organization = re.sub(r"^issued by\s*", "", issuer["summary"].strip(), flags=re.I)
+        if organization:
+            metadata["organization"] = organization.strip()
+        if template.get("description"):
+            metadata["description"] = template["description"].strip()
+        skills = [skill.get("name") if isinstance(skill, dict) else skill for skill in template.get("skills") or []]
+        if skills:
+            metadata["skills"] = [skill for skill in skills if skill]
+        activities = template.get("badge_template_activities") or template.get("activities") or []
+        criteria = [activity.get("title") if isinstance(activity, dict) else activity for activity in activities]
+        if criteria:
+            metadata["earning_criteria"] = [criterion for criterion in criteria if criterion]
+        return metadata, bool(metadata.get("badge_name") and metadata.get("organization"))
+    def _metadata_from_meta_tags(self, content: str) -> Tuple[Dict, bool]:
+        """Fallback for the server-rendered shell: the OpenGraph title reads "<badge> was issued by <issuer> to <recipient>"."""
+        og = open_graph_tags(make_soup(content))
+        metadata = {}
+        match = re.match(get_config(REGEX_CONFIG, "credly_og_title"), og.get("title", ""))
+        if match:
+            metadata["badge_name"] = match.group("badge").strip()
+            metadata["organization"] = match.group("issuer").strip()
+        if og.get("description"):
+            metadata["description"] = og["description"]
+        return metadata, bool(metadata.get("badge_name") and metadata.get("organization"))
+    def _extract_metadata_static(self, url: str) -> Tuple[Dict, bool]:
+        """Read the badge over plain HTTP: the ``.json`` representation, then the page's own HTML.
+
+        Returns ``(metadata, conclusive)``. ``conclusive`` is True when the badge
+        data was found, or when Credly answered 404 for both, i.e. the badge
+        does not exist and rendering it in a browser would not help.
+        """
+        config = get_config(FETCH_CONFIG, "static_validation", "credly")
+        if not config.get("enabled", True):
+            return {}, False
+        headers = {"User-Agent": random.choice(self.user_agents)}
+        not_found = 0
+        badge_id = re.search(get_config(REGEX_CONFIG, "extract_certificate_id", "credly"), url)
+        if badge_id:
+            try:
+                response = requests.get(f"https://www.credly.com/badges/{badge_id.group(1)}.json",
+                                        headers={**headers, "Accept": "application/json"}, timeout=current_deadline().clamp(config["timeout"]))
+                if response.status_code == 404:
+                    not_found += 1
+                elif response.ok:
+                    metadata, success = self._metadata_from_badge_json(response.json())
+                    if success:
+                        self.logger.info("Read Credly badge from its JSON representation")
+                        validation_tiers.record(self.platform, "json")
+                        return metadata, True
+            except (requests.RequestException, ValueError, DeadlineExceeded) as e:
+                self.logger.warning(f"Credly badge JSON unavailable: {e}")
+        try:
+            response = requests.get(url, headers=headers, timeout=current_deadline().clamp(config["timeout"]))
+            if response.status_code == 404:
+                if not_found or not badge_id:
+                    validation_tiers.record(self.platform, "not_found")
+                    return {}, True
+                return {}, False
+            if response.ok:
+                for extract in (self._extract_metadata_from_html, self._metadata_from_meta_tags):
+                    metadata, success = extract(response.text)
+                    if success:
+                        self.logger.info("Read Credly badge from the static page")
+                        validation_tiers.record(self.platform, "static")
+                        return metadata, True
+        except (requests.RequestException, DeadlineExceeded) as e:
+            self.logger.warning(f"Credly static page unavailable: {e}")
+        return {}, False
+    def extract_metadata(self, url: str) -> Dict:
+        self.logger.info(f"Extracting metadata from Credly URL: {url}")
+        metadata = {
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "credly"),
+            "verification_url": url
+        }
+        static_metadata, conclusive = self._extract_metadata_static(url)
+        if conclusive:
+            metadata.update(static_metadata)
+            return metadata
+        # Browser fallback for pages that only render client-side
+        policy = RetryPolicy.from_config("browser")
+        budget = policy.new_budget(sync=True)
+        render_delay = 7  # Settle time for client-side rendering
+        page_loaded = False
+        resolved = False
+        deadline = budget.deadline
+        browser = load_browser()
+        for attempt in range(budget.max_attempts):
+            if deadline.expired():
+                break
+            budget.attempts = attempt + 1
+            driver = None
+            try:
+                self.logger.info(f"Attempt {attempt + 1} of {budget.max_attempts}")
+                driver = self._setup_webdriver()
+                if not driver:
+                    continue
+                driver.get(url)
+                # Wait for badge title or h1 to appear (explicit wait)
+                try:
+                    browser.WebDriverWait(driver, deadline.clamp(30)).until(
+                        browser.EC.presence_of_element_located((browser.By.TAG_NAME, "body"))
+                    )
+                    browser.WebDriverWait(driver, deadline.clamp(30)).until(
+                        browser.EC.presence_of_element_located((browser.By.CSS_SELECTOR, get_config(SELECTORS_CONFIG, "credly", "badge_name")))
+                    )
+                except browser.TimeoutException:
+                    self.logger.warning("Timeout waiting for badge content, trying to proceed anyway")
+                    self.logger.debug(f"Page source: {driver.page_source}")
+                # Add extra random sleep to mimic human
+                deadline.sleep(render_delay + random.uniform(2, 5))
+                self.logger.info(f"Page title: {driver.title}")
+                content = driver.page_source
+                page_loaded = True
+                extracted_metadata, success = self._extract_metadata_from_html(content)
+                if success:
+                    metadata.update(extracted_metadata)
+                    validation_tiers.record(self.platform, "browser")
+                    resolved = True
+                    break
+                else:
+                    self.logger.warning(f"Failed to extract metadata on attempt {attempt + 1}")
+            except Exception as e:
+                self.logger.error(f"Error extracting metadata: {str(e)}")
+            finally:
+                if driver:
+                    try:
+                        driver.quit()
+                    except:
+                        pass
+            # Back off only after the browser is released, within the retry budget
+            if attempt < budget.max_attempts - 1 and not policy.wait(budget):
+                break
+        if not page_loaded:
+            validation_tiers.record(self.platform, "unresolved")
+            # Surface as an upstream Error (not Invalid) so the circuit breaker can trip
+            raise RuntimeError(f"Could not load {metadata['platform']} page after {budget.attempts} attempt(s)")
+        if not resolved:
+            # The page rendered but held no certificate fields
+            validation_tiers.record(self.platform, "browser_unextracted")
+        return metadata
+    def check_certificate_status(self, metadata: Dict) -> str:
+        if not metadata:
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        required_fields = ["badge_name", "organization"]
+        if not all(metadata.get(field) for field in required_fields):
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
+
+# --- EdXValidator (from edx_validator.py) ---
+@register_validator("edx.org")
+class EdXValidator(BaseValidator):
+    """Validator for EdX certificates."""
+    platform = "edx"
+    def __init__(self):
+        super().__init__()
+        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "edx"))
+    def validate_url_pattern(self, url: str) -> bool:
+        return bool(self.url_pattern.match(url))
+    def extract_metadata(self, url: str) -> Dict:
+        self.logger.info(f"Extracting metadata from EdX URL: {url}")
+        certificate_id = self._extract_certificate_id(url)
+        content = self._make_request(url)
+        if not content:
+            self.logger.error("Failed to fetch EdX certificate page")
+            return {}
+        metadata = {
+            "certificate_id": certificate_id,
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "edx"),
+            "verification_url": url
+        }
+        selectors = get_selector_program().platform("edx")
+        page = extract_page_fields(content, {
+            "name": FieldSpec([selectors["name"]]),
+            "date": FieldSpec([selectors["date"]])
+        })
+        if page.get("name") is not None:
+            metadata["name"] = element_text(page.get("name"), strip=True)
+        if page.get("date") is not None:
+            metadata["issue_date"] = self._parse_date(element_text(page.get("date"), strip=True))
+        if not metadata.get("name"):
+            metadata.update(self._get_mock_metadata(certificate_id))
+        self.logger.info(f"Extracted metadata: {metadata}")
+        return metadata
+    def check_certificate_status(self, metadata: Dict) -> str:
+        if not metadata:
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        required_fields = ["name", "issue_date"]
+        if not all(metadata.get(field) for field in required_fields):
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        if metadata.get("issue_date"):
+            try:
+                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
+                if issue_date < datetime(2010, 1, 1):
+                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+            except (ValueError, TypeError):
+                pass
+        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
+    def _extract_certificate_id(self, url: str) -> str:
+        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "edx")
+        match = re.search(pattern, url)
+        return match.group(1) if match else "unknown"
+    def _parse_date(self, date_text: str) -> Optional[str]:
+        if not date_text:
+            return None
+        date_formats = [
+            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
+            "%d %B %Y", "%d %b %Y"
+        ]
+        for fmt in date_formats:
+            try:
+                parsed_date = datetime.strptime(date_text.strip(), fmt)
+                return parsed_date.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
+            year_month_day = re.search(pattern, date_text)
+            if year_month_day:
+                groups = year_month_day.groups()
+                if len(groups) == 3:
+                    year, month, day = groups
+                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        return None
+    def _get_mock_metadata(self, certificate_id: str) -> Dict:
+        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
+        return {
+            "certificate_id": certificate_id,
+            # Placeholder data, not read from the page: never cached
+            "mock": True,
+            "name": mock["name"],
+            "issue_date": mock["issue_date"],
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "edx"),
+            "verification_url": f"https://www.edx.org/certificates/{certificate_id}"
+        }
+
+# --- LinkedInValidator (from linkedin_validator.py) ---
+@register_validator("linkedin.com")
+class LinkedInValidator(BaseValidator):
+    """Validator for LinkedIn certificates."""
+    platform = "linkedin"
+    def __init__(self):
+        super().__init__()
+        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "linkedin"))
+    def validate_url_pattern(self, url: str) -> bool:
+        return bool(self.url_pattern.match(url))
+    def extract_metadata(self, url: str) -> Dict:
+        self.logger.info(f"Extracting metadata from LinkedIn URL: {url}")
+        certificate_id = self._extract_certificate_id(url)
+        content = self._make_request(url)
+        if not content:
+            self.logger.error("Failed to fetch LinkedIn certificate page")
+            return {}
+        metadata = {
+            "certificate_id": certificate_id,
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "linkedin"),
+            "verification_url": url
+        }
+        selectors = get_selector_program().platform("linkedin")
+        page = extract_page_fields(content, {
+            "name": FieldSpec([selectors["name"]]),
+            "course": FieldSpec([selectors["certificate"]]),
+            "date": FieldSpec(get_selector_program().dates, accept=lambda text: bool(self._parse_date(text)))
+        })
+        if page.get("name") is not None:
+            metadata["name"] = element_text(page.get("name"), strip=True)
+        if page.get("course") is not None:
+            metadata["course"] = element_text(page.get("course"), strip=True)
+        if page.get("date") is not None:
+            metadata["issue_date"] = self._parse_date(element_text(page.get("date"), strip=True))
+        if not metadata.get("name"):
+            metadata.update(self._get_mock_metadata(certificate_id))
+        self.logger.info(f"Extracted metadata: {metadata}")
+        return metadata
+    def check_certificate_status(self, metadata: Dict) -> str:
+        if not metadata:
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        required_fields = ["name", "course", "issue_date"]
+        if not all(metadata.get(field) for field in required_fields):
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        if metadata.get("issue_date"):
+            try:
+                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
+                if issue_date < datetime(2010, 1, 1):
+                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+            except (ValueError, TypeError):
+                pass
+        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
+    def _extract_certificate_id(self, url: str) -> str:
+        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "linkedin")
+        match = re.search(pattern, url)
+        return match.group(1) if match else "unknown"
+    def _parse_date(self, date_text: str) -> Optional[str]:
+        if not date_text:
+            return None
+        date_formats = [
+            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
+            "%d %B %Y", "%d %b %Y"
+        ]
+        for fmt in date_formats:
+            try:
+                parsed_date = datetime.strptime(date_text.strip(), fmt)
+                return parsed_date.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
+            year_month_day = re.search(pattern, date_text)
+            if year_month_day:
+                groups = year_month_day.groups()
+                if len(groups) == 3:
+                    year, month, day = groups
+                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        return None
+    def _get_mock_metadata(self, certificate_id: str) -> Dict:
+        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
+        return {
+            "certificate_id": certificate_id,
+            # Placeholder data, not read from the page: never cached
+            "mock": True,
+            "name": mock["name"],
+            "course": mock["course"],
+            "issue_date": mock["issue_date"],
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "linkedin"),
+            "verification_url": f"https://www.linkedin.com/learning/certificates/{certificate_id}"
+        }
+
+# --- UdemyValidator (from udemy_validator.py) ---
+@register_validator("udemy.com")
+class UdemyValidator(BaseValidator):
+    """Validator for Udemy certificates."""
+    platform = "udemy"
+    def __init__(self):
+        super().__init__()
+        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "udemy"))
+        self.user_agents = get_config(SELECTORS_CONFIG, "user_agents")
+    def validate_url_pattern(self, url: str) -> bool:
+        return bool(self.url_pattern.match(url))
+    def _extract_metadata_from_html(self, content: str) -> Tuple[Dict, bool]:
+        metadata = {}
+        success = False
+        try:
+            soup = make_soup(content)
+            # Find the certificate description container
+            description_div = soup.find('div', {'data-purpose': 'certificate-description'})
+            if description_div:
+                # Recipient
+                name_element = description_div.find('a', {'data-purpose': 'certificate-recipient-url'})
+                if name_element:
+                    metadata["recipient"] = name_element.get_text(strip=True)
+                # Course title
+                course_element = description_div.find('a', {'data-purpose': 'certificate-course-url'})
+                if course_element:
+                    metadata["course"] = course_element.get_text(strip=True)
+                # Instructors (can be multiple)
+                instructors = [a.get_text(strip=True) for a in description_div.find_all('a', href=True) if '/user/' in a['href'] and not a.has_attr('data-purpose')]
+                if instructors:
+                    metadata["instructors"] = instructors
+                # Completion date
+                description_text = description_div.get_text()
+                import re
+                date_match = re.search(r'on (\d{2}/\d{2}/\d{4})', description_text)
+                if date_match:
+                    date_text = date_match.group(1)
+                    metadata["issue_date"] = self._parse_date(date_text)
+                # Description
+                metadata["description"] = description_div.get_text(strip=True)
+                if metadata.get("recipient") and metadata.get("course") and metadata.get("issue_date"):
+                    success = True
+        except Exception as e:
+            self.logger.error(f"Error parsing Udemy HTML: {str(e)}")
+        return metadata, success
+    def _probe_certificate(self, url: str) -> Tuple[Dict, bool]:
+        """One plain GET of the certificate page before any browser is started.
+
+        Returns ``(metadata, conclusive)``: a 404 settles the certificate as
+        missing; otherwise the server-rendered description, or the OpenGraph
+        description together with an ``og:image`` named after this certificate
+        ID, must yield recipient and course. Blocked, bare or unconfirmed pages
+        are inconclusive and escalate to rendering.
+        """
+        config = get_config(FETCH_CONFIG, "static_validation", "udemy")
+        if not config.get("enabled", True):
+            return {}, False
+        try:
+            response = requests.get(url, headers={"User-Agent": random.choice(self.user_agents)},
+                                    timeout=current_deadline().clamp(config["timeout"]))
+        except (requests.RequestException, DeadlineExceeded) as e:
+            self.logger.warning(f"Udemy probe failed: {e}")
+            return {}, False
+        if response.status_code == 404:
+            validation_tiers.record(self.platform, "not_found")
+            return {}, True
+        if not response.ok:
+            return {}, False
+        metadata, success = self._extract_metadata_from_html(response.text)
+        if success:
+            validation_tiers.record(self.platform, "static")
+            return metadata, True
+        og = open_graph_tags(make_soup(response.text))
+        match = re.match(get_config(REGEX_CONFIG, "udemy_og_description"), og.get("description", ""))
+        if not match:
+            return {}, False
+        metadata = {"recipient": match.group("recipient").strip(), "course": match.group("course").strip()}
+        if match.group("date"):
+            metadata["issue_date"] = self._parse_date(match.group("date"))
+        # The certificate image is named after the certificate ID, which confirms the page is this certificate;
+        # a generic or redirected page can carry a matching description, so without it the browser decides
+        certificate_id = self._extract_certificate_id(url)
+        if not (certificate_id and certificate_id in og.get("image", "")):
+            return metadata, False
+        metadata["certificate_image"] = og["image"]
+        validation_tiers.record(self.platform, "open_graph")
+        return metadata, True
+    def extract_metadata(self, url: str) -> Dict:
+        self.logger.info(f"Extracting metadata from Udemy URL: {url}")
+        metadata = {
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "udemy"),
+            "verification_url": url
+        }
+        probe_metadata, conclusive = self._probe_certificate(url)
+        if conclusive:
+            metadata.update(probe_metadata)
+            return metadata
+        # Escalate to full rendering
+        policy = RetryPolicy.from_config("browser")
+        budget = policy.new_budget(sync=True)
+        render_delay = 7  # Settle time for client-side rendering
+        page_loaded = False
+        resolved = False
+        deadline = budget.deadline
+        browser = load_browser()
+        for attempt in range(budget.max_attempts):
+            if deadline.expired():
+                break
+            budget.attempts = attempt + 1
+            driver = None
+            try:
+                self.logger.info(f"Attempt {attempt + 1} of {budget.max_attempts}")
+                driver = self._setup_webdriver()
+                if not driver:
+                    continue
+                driver.get(url)
+                # Wait for certificate title or h1 to appear (explicit wait)
+                try:
+                    browser.WebDriverWait(driver, deadline.clamp(30)).until(
+                        browser.EC.presence_of_element_located((browser.By.TAG_NAME, "body"))
+                    )
+                    browser.WebDriverWait(driver, deadline.clamp(30)).until(
+                        browser.EC.presence_of_element_located((browser.By.CSS_SELECTOR, get_config(SELECTORS_CONFIG, "udemy", "title")))
+                    )
+                except browser.TimeoutException:
+                    self.logger.warning("Timeout waiting for certificate description, trying to proceed anyway")
+                # Add extra random sleep to mimic human
+                deadline.sleep(render_delay + random.uniform(2, 5))
+                self.logger.info(f"Page title: {driver.title}")
+                content = driver.page_source
+                page_loaded = True
+                extracted_metadata, success = self._extract_metadata_from_html(content)
+                if success:
+                    metadata.update(extracted_metadata)
+                    validation_tiers.record(self.platform, "browser")
+                    resolved = True
+                    break
+                else:
+                    self.logger.warning(f"Failed to extract metadata on attempt {attempt + 1}")
+            except Exception as e:
+                self.logger.error(f"Error extracting metadata: {str(e)}")
+            finally:
+                if driver:
+                    try:
+                        driver.quit()
+                    except:
+                        pass
+            # Back off only after the browser is released, within the retry budget
+            if attempt < budget.max_attempts - 1 and not policy.wait(budget):
+                break
+        if not page_loaded:
+            validation_tiers.record(self.platform, "unresolved")
+            # Surface as an upstream Error (not Invalid) so the circuit breaker can trip
+            raise RuntimeError(f"Could not load {metadata['platform']} page after {budget.attempts} attempt(s)")
+        if not resolved:
+            # The page rendered but held no certificate fields
+            validation_tiers.record(self.platform, "browser_unextracted")
+        return metadata
+    def check_certificate_status(self, metadata: Dict) -> str:
+        if not metadata:
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        required_fields = ["name", "course", "issue_date"]
+        if not all(metadata.get(field) for field in required_fields):
+            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
+        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
+    def _extract_certificate_id(self, url: str) -> str:
+        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "udemy")
+        match = re.search(pattern, url)
+        return match.group(1) if match else "unknown"
+    def _parse_date(self, date_text: str) -> Optional[str]:
+        if not date_text:
+            return None
+        date_formats = [
+            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
+            "%d %B %Y", "%d %b %Y"
+        ]
+        for fmt in date_formats:
+            try:
+                parsed_date = datetime.strptime(date_text.strip(), fmt)
+                return parsed_date.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
+            year_month_day = re.search(pattern, date_text)
+            if year_month_day:
+                groups = year_month_day.groups()
+                if len(groups) == 3:
+                    year, month, day = groups
+                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        return None
+    def _get_mock_metadata(self, certificate_id: str) -> Dict:
+        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
+        return {
+            "certificate_id": certificate_id,
+            # Placeholder data, not read from the page: never cached
+            "mock": True,
+            "name": mock["name"],
+            "course": mock["course"],
+            "issue_date": mock["issue_date"],
+            "platform": get_config(SELECTORS_CONFIG, "platform_names", "udemy"),
+            "verification_url": f"https://www.udemy.com/certificate/{certificate_id}"
+        }
+
+# --- CERTIFICATE URLS ---
+def canonicalize_certificate_url(url: str) -> Optional[Tuple[str, str, str]]:
+    """``(platform, certificate_id, canonical_url)`` for a certificate link, or None for an unknown host.
+
+    Scheme, ``www.``, host case, trailing slashes, query strings and fragments
+    are dropped, so every spelling of one certificate maps to the same key.
+    Paths without a recognisable ID (e.g. Credly's ``/org/<org>/badge/<name>``)
+    use the normalised path as the ID.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    templates = get_config(REGEX_CONFIG, "certificate_canonical_urls")
+    for platform_name, template in templates.items():
+        canonical_host = urlparse(template).netloc
+        if canonical_host in (host, f"www.{host}"):
+            break
+    else:
+        return None
+    path = parsed.path.rstrip("/")
+    match = re.search(get_config(REGEX_CONFIG, "extract_certificate_id", platform_name), path)
+    if match and match.end() == len(path):
+        return platform_name, match.group(1), template.format(id=match.group(1))
+    return platform_name, path, f"https://{canonical_host}{path}"
+
+def certificate_key(url: str, canonical: Optional[Tuple[str, str, str]] = None) -> str:
+    """``platform:certificate_id``, the identity used to dedupe and cache validations.
+
+    Pass ``canonical`` when ``url`` has already been through :func:`canonicalize_certificate_url`.
+    """
+    canonical = canonical or canonicalize_certificate_url(url)
+    return f"{canonical[0]}:{canonical[1]}" if canonical else url.strip()
+
+# --- CERTIFICATE CACHE ---
+class CertificateCache:
+    """Validation results in SQLite (WAL mode), shared by every worker using the same file.
+
+    How long a result lives depends on its status (``ttl_seconds`` maps status
+    to seconds; unlisted statuses are not cached), and a valid certificate with
+    an ``expiry_date`` is never served past that date. Results built on a
+    validator's mock metadata are not cached at all.
+    """
+    def __init__(self, persist_path: str, ttl_seconds: Dict[str, float], enabled: bool = True):
+        self.persist_path = persist_path
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0, "bypasses": 0, "writes": 0}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if enabled:
+            with sqlite3.connect(persist_path) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS certificate_cache (key TEXT PRIMARY KEY, status TEXT, stored_at REAL, expires_at REAL, value TEXT)")
+
+    @classmethod
+    def from_config(cls) -> "CertificateCache":
+        settings = dict(get_config(FETCH_CONFIG, "certificate_cache"))
+        path = os.getenv("CERTIFICATE_CACHE_PATH") or settings["persist_path"]
+        if not os.path.isabs(path):
+            path = os.path.join(ROOT_DIR, path)
+        settings["persist_path"] = path
+        return cls(**settings)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Wait out another worker's write instead of failing with "database is locked"
+        return sqlite3.connect(self.persist_path, timeout=5.0)
+
+    def count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def ttl_for(self, result: Dict) -> float:
+        status = result.get("status")
+        if (result.get("data") or {}).get("mock"):
+            return 0
+        ttl = self.ttl_seconds.get(status, 0)
+        expiry = (result.get("data") or {}).get("expiry_date")
+        if ttl and expiry and status == get_config(SELECTORS_CONFIG, "status_strings", "valid"):
+            try:
+                remaining = (datetime.strptime(expiry, "%Y-%m-%d") - datetime.now()).total_seconds()
+            except (TypeError, ValueError):
+                pass
+            else:
+                ttl = min(ttl, max(remaining, 0))
+        return ttl
+
+    def get(self, key: str) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM certificate_cache WHERE key = ? AND expires_at > ?",
+                                   (key, time.time())).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Certificate cache read failed for {key}: {e}")
+            return None
+        self.count("hits" if row else "misses")
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, result: Dict):
+        ttl = self.ttl_for(result)
+        if not self.enabled or ttl <= 0:
+            return
+        stored_at = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO certificate_cache VALUES (?, ?, ?, ?, ?)",
+                             (key, result.get("status"), stored_at, stored_at + ttl, json.dumps(result, default=str)))
+                conn.execute("DELETE FROM certificate_cache WHERE expires_at <= ?", (stored_at,))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Certificate cache write failed for {key}: {e}")
+            return
+        self.count("writes")
+
+certificate_cache: Optional[CertificateCache] = None
+
+def get_certificate_cache() -> CertificateCache:
+    global certificate_cache
+    if certificate_cache is None:
+        certificate_cache = CertificateCache.from_config()
+    return certificate_cache
+
+# --- CERTIFICATE VALIDATION ORCHESTRATOR (from validate_certificate.py) ---
+class CertificateValidator:
+    """Main certificate validation orchestrator."""
+    def __init__(self, registry: Optional[ValidatorRegistry] = None):
+        self.registry = registry or validator_registry
+        self._setup_logging()
+    def _setup_logging(self):
+        log_dir = os.path.join(ROOT_DIR, 'logs')
+        os.makedirs(log_dir, exist_ok=True)
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(os.path.join(log_dir, 'validation.log')),
+                logging.StreamHandler(sys.stdout)
+            ]
+        )
+        self.logger = logging.getLogger(__name__)
+    def _validate_url_format(self, url: str) -> bool:
+        try:
+            parsed = urlparse(url)
+            return (
+                parsed.scheme in ('http', 'https') and
+                self.registry.platform_for(parsed.netloc) is not None and
+                len(url) < 2048
+            )
+        except Exception as e:
+            self.logger.error(f"URL validation error: {e}")
+            return False
+    def _get_validator(self, url: str) -> Optional[BaseValidator]:
+        try:
+            return self.registry.for_host(urlparse(url).netloc)
+        except Exception as e:
+            self.logger.error(f"Error getting validator: {e}")
+            return None
+    def validate_certificate(self, url: str, capture_screenshot: bool = False, use_cache: bool = True,
+                             deadline: Optional[Deadline] = None,
+                             canonical: Optional[Tuple[str, str, str]] = None) -> Dict:
+        """Validate ``url``; ``use_cache=False`` forces revalidation (the fresh result is still stored).
+
+        The validator runs under ``deadline``; an Error it returns once the
+        deadline has passed is marked ``timed_out`` and neither cached nor
+        counted against the platform's circuit breaker. Callers that already
+        canonicalized ``url`` pass the result as ``canonical``.
+        """
+        deadline = deadline or NO_DEADLINE
+        self.logger.info(f"Starting validation for URL: {url}")
+        canonical = canonical or canonicalize_certificate_url(url)
+        if canonical:
+            url = canonical[2]
+        response = {
+            "status": "Error",
+            "data": {},
+            "confidence": 0,
+            "screenshot": None,
+            "error_message": None
+        }
+        try:
+            if not self._validate_url_format(url):
+                response["status"] = "Invalid"
+                response["error_message"] = "Invalid URL format or untrusted domain"
+                self.logger.warning(f"Invalid URL format: {url}")
+                return response
+            validator = self._get_validator(url)
+            if not validator:
+                response["status"] = "Invalid"
+                response["error_message"] = "Unsupported platform"
+                self.logger.warning(f"Unsupported platform for URL: {url}")
+                return response
+            if not validator.validate_url_pattern(url):
+                response["status"] = "Invalid"
+                response["error_message"] = "Invalid URL pattern for platform"
+                self.logger.warning(f"Invalid URL pattern: {url}")
+                return response
+            cache = get_certificate_cache()
+            cache_key = certificate_key(url, canonical)
+            if not use_cache:
+                cache.count("bypasses")
+            else:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info(f"Serving cached validation for {url}: {cached.get('status')}")
+                    return cached
+            if deadline.expired():
+                response["error_message"] = "Validation skipped: request deadline exceeded"
+                response["timed_out"] = True
+                return response
+            breaker = circuit_breakers.for_url(validator.platform, url)
+            if not breaker.allow_request():
+                response["error_message"] = circuit_open_message(breaker)
+                self.logger.warning(f"Circuit open, failing fast for {url}")
+                return response
+            try:
+                try:
+                    with deadline.applied():
+                        validation_result = validator.validate_certificate(url, capture_screenshot)
+                except Exception:
+                    breaker.record_failure()
+                    raise
+                # Only an Error means the platform failed; Invalid (e.g. a 404 for a mistyped
+                # certificate) is a real answer and must not trip the circuit for everyone
+                failed = validation_result.get("status") == "Error"
+                if failed and deadline.expired():
+                    # Our own time ran out, which says nothing about the platform
+                    response.update(validation_result)
+                    response["timed_out"] = True
+                    self.logger.warning(f"Validation of {url} ran out of request time")
+                    return response
+                if failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            finally:
+                breaker.release_probe()
+            response.update(validation_result)
+            cache.set(cache_key, response)
+            self.logger.info(f"Validation completed for {url}: {response['status']}")
+        except Exception as e:
+            response["status"] = "Error"
+            response["error_message"] = str(e)
+            self.logger.error(f"Validation error for {url}: {e}")
+        return response
+
+# --- CERTIFICATE VALIDATOR API (from certificate_validator_api.py) ---
+class ValidationBulkheads:
+    """Separate worker pools for browser-rendered and HTTP-only platforms.
+
+    A batch of slow Credly/Udemy renders can only occupy the browser pool, so
+    Coursera/EdX/LinkedIn checks keep their own workers. The pools are
+    process-wide, which also bounds concurrent browsers across requests.
+    ``abandoned`` counts, per pool, workers still busy with a validation whose
+    result nobody is waiting for any more.
+    """
+    def __init__(self, browser_platforms: List[str], browser_concurrency: int, http_concurrency: int):
+        self.browser_platforms = set(browser_platforms)
+        self._pools = {
+            "browser": ThreadPoolExecutor(max_workers=browser_concurrency, thread_name_prefix="validate-browser"),
+            "http": ThreadPoolExecutor(max_workers=http_concurrency, thread_name_prefix="validate-http")
+        }
+        self.abandoned = {pool: 0 for pool in self._pools}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ValidationBulkheads":
+        settings = get_config(FETCH_CONFIG, "certificate_validation")
+        return cls(settings["browser_platforms"], settings["browser_concurrency"], settings["http_concurrency"])
+
+    def pool_for(self, platform_name: str) -> str:
+        return "browser" if platform_name in self.browser_platforms else "http"
+
+    def submit(self, platform_name: str, fn, *args, **kwargs):
+        return self._pools[self.pool_for(platform_name)].submit(fn, *args, **kwargs)
+
+    def abandon(self, platform_name: str, future: Future) -> bool:
+        """Stop waiting for ``future``: cancel it if still queued (True), else count its slot as abandoned until it ends."""
+        if future.cancel():
+            return True
+        pool = self.pool_for(platform_name)
+        with self._lock:
+            self.abandoned[pool] += 1
+
+        def release(_):
+            with self._lock:
+                self.abandoned[pool] -= 1
+
+        future.add_done_callback(release)
+        return False
+
+validation_bulkheads: Optional[ValidationBulkheads] = None
+
+def get_validation_bulkheads() -> ValidationBulkheads:
+    global validation_bulkheads
+    if validation_bulkheads is None:
+        validation_bulkheads = ValidationBulkheads.from_config()
+    return validation_bulkheads
+
+class CertificateValidationError(Exception):
+    """Custom exception for certificate validation errors."""
+    pass
+
+class CertificateValidatorAPI:
+    """API wrapper for certificate validation functionality."""
+    def __init__(self):
+        if CertificateValidator is None:
+            raise CertificateValidationError("CertificateValidator not available")
+        self.validator = CertificateValidator()
+        self.logger = logging.getLogger(__name__)
+    def iter_validations(self, certificate_urls: List[str], use_cache: bool = True,
+                         url_timeout: Optional[float] = None, deadline: Optional[Deadline] = None) -> Iterator[Tuple[str, Dict]]:
+        """Validate all URLs concurrently and yield ``(url, result)`` in completion order.
+
+        URLs naming the same certificate (see :func:`certificate_key`) are
+        validated once and the result is yielded for each of them. Each
+        certificate runs on its platform's bulkhead pool. ``url_timeout``
+        counts from when it starts running, not from when it was queued; one
+        that exceeds it is reported as an Error. The worker runs under a
+        deadline narrowed to the same limit, so it stops at its next clamped
+        wait and frees its bulkhead slot instead of rendering for an abandoned
+        result. When ``deadline`` passes, everything still pending, started or
+        not, is reported the same way.
+        """
+        url_timeout = url_timeout or get_config(FETCH_CONFIG, "certificate_validation", "url_timeout")
+        deadline = deadline or NO_DEADLINE
+        request_end = time.monotonic() + deadline.remaining()
+        bulkheads = get_validation_bulkheads()
+        groups: Dict[str, List[str]] = {}
+        canonicals: Dict[str, Optional[Tuple[str, str, str]]] = {}
+        for url in dict.fromkeys(certificate_urls):
+            canonical = canonicalize_certificate_url(url)
+            key = certificate_key(url, canonical)
+            groups.setdefault(key, []).append(url)
+            canonicals.setdefault(key, canonical)
+        started: Dict[str, float] = {}
+        def run(key: str, url: str) -> Dict:
+            started[key] = time.monotonic()
+            return self.validate_single_certificate(url, use_cache, deadline.narrowed(url_timeout), canonicals[key])
+        def expires_at(key: str) -> float:
+            return min(started[key] + url_timeout, request_end) if key in started else request_end
+        futures = {}
+        platforms: Dict[str, str] = {}
+        for key, urls in groups.items():
+            platforms[key] = canonicals[key][0] if canonicals[key] else ""
+            futures[bulkheads.submit(platforms[key], run, key, urls[0])] = key
+        if len(futures) < len(certificate_urls):
+            self.logger.info(f"Validating {len(futures)} distinct certificate(s) for {len(certificate_urls)} URL(s)")
+        pending = set(futures)
+        try:
+            while pending:
+                wait_for = min(expires_at(futures[future]) for future in pending) - time.monotonic()
+                if any(futures[future] not in started for future in pending):
+                    # Queued URLs get their own deadline once they start; look again soon
+                    wait_for = min(wait_for, 1.0)
+                done, pending = wait_futures(pending, timeout=max(0.0, wait_for), return_when=FIRST_COMPLETED)
+                for future in done:
+                    for url in groups[futures[future]]:
+                        yield url, dict(future.result())
+                now = time.monotonic()
+                for future in [f for f in pending if expires_at(futures[f]) <= now]:
+                    pending.discard(future)
+                    if now >= request_end:
+                        message = "Validation stopped: request deadline exceeded"
+                    else:
+                        message = f"Validation timed out after {url_timeout:.0f}s"
+                    cancelled = bulkheads.abandon(platforms[futures[future]], future)
+                    self.logger.warning(f"{futures[future]}: {message}" + (
+                        "" if cancelled else "; its worker stops at its next deadline check"))
+                    for url in groups[futures[future]]:
+                        yield url, {
+                            "status": "Error",
+                            "data": {},
+                            "confidence": 0,
+                            "screenshot": None,
+                            "error_message": message,
+                            "timed_out": True
+                        }
+        finally:
+            # The caller stopped early: drop whatever has not started yet
+            for future in pending:
+                bulkheads.abandon(platforms[futures[future]], future)
+    def validate_certificates(self, certificate_urls: List[str], use_cache: bool = True,
+                              deadline: Optional[Deadline] = None) -> Dict[str, Dict]:
+        if not certificate_urls:
+            return {}
+        results = dict(self.iter_validations(certificate_urls, use_cache, deadline=deadline))
+        return {url: results[url] for url in dict.fromkeys(certificate_urls)}
+    def validate_single_certificate(self, url: str, use_cache: bool = True, deadline: Optional[Deadline] = None,
+                                    canonical: Optional[Tuple[str, str, str]] = None) -> Dict:
+        try:
+            self.logger.info(f"Validating single certificate: {url}")
+            return self.validator.validate_certificate(url, capture_screenshot=False, use_cache=use_cache, deadline=deadline,
+                                                       canonical=canonical)
+        except Exception as e:
+            self.logger.error(f"Error validating certificate {url}: {e}")
+            return {
+                "status": "Error",
+                "data": {},
+                "confidence": 0,
+                "screenshot": None,
+                "error_message": str(e)
+            }
+
+def close_quietly(generator):
+    """Close a generator that another thread may be advancing right now; that thread then closes it."""
+    try:
+        generator.close()
+    except ValueError:
+        pass
+
+certificate_validator = None
+
+def get_certificate_validator() -> Optional[CertificateValidatorAPI]:
+    global certificate_validator
+    if certificate_validator is None:
+        try:
+            certificate_validator = CertificateValidatorAPI()
+        except Exception as e:
+            logging.error(f"Failed to initialize certificate validator: {e}")
+            return None
+    return certificate_validator
+
+def main():
+    """CLI interface for certificate validation."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Certificate Validation System')
+    parser.add_argument('url', help='Certificate URL to validate')
+    parser.add_argument('--screenshot', action='store_true', help='Capture screenshot of certificate page')
+    parser.add_argument('--output', help='Output file for JSON results')
+    args = parser.parse_args()
+    validator = CertificateValidator()
+    result = validator.validate_certificate(args.url, args.screenshot)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"Results saved to {args.output}")
+    else:
+        print(json.dumps(result, indent=2))
+
@@ -1,16 +1,22 @@
 """
 Certificate validators package.
-Contains platform-specific validators for certificate verification.
+Re-exports the platform validators from cert_validator.core, which holds the
+single implementation of each; they are resolved on first attribute access so
+that importing this package stays cheap.
 """
 
-from .base_validator import BaseValidator
-from .coursera_validator import CourseraValidator
-from .credly_validator import CredlyValidator
-from .udemy_validator import UdemyValidator
-
 __all__ = [
     'BaseValidator',
     'CourseraValidator',
     'CredlyValidator',
+    'EdXValidator',
+    'LinkedInValidator',
     'UdemyValidator'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from cert_validator import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
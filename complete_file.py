@@ -13,1087 +13,391 @@ import random
 import pdfplumber
 import docx
 import requests
-from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from urllib.parse import urlparse, urljoin
 from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, Form, Request, BackgroundTasks, status
 from fastapi.security import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from apify_client import ApifyClient
 import asyncio
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bisect import bisect_right
 import aiohttp
 from fastapi.security.api_key import APIKeyHeader
 from docx import Document
 import tempfile
 
-# --- INLINED CONFIGS ---
-PATTERNS = {
-  "certificate_patterns": {
-    "udemy": r"https?://(www\.)?udemy\.com/certificate/[A-Za-z0-9_-]+/?",
-    "credly": r"https?://(www\.)?credly\.com/badges/[A-Za-z0-9_-]+/?",
-    "coursera": r"https?://(www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?"
-  }
-}
-
-REGEX_CONFIG = {
-  "extract_elements_patterns": {
-    "github": r"github\.com/([A-Za-z0-9_-]+)",
-    "portfolio": r"(https?://[^\s]+vercel\.app[^\s]*)",
-    "instagram": r"Instagram:\s*@?([A-Za-z0-9_.-]+)",
-    "udemy": r"(https?://www\.udemy\.com/certificate/[A-Za-z0-9_-]+)",
-    "linkedin": r"(https?://www\.linkedin\.com/(in|learning/certificates)/[A-Za-z0-9_-]+)",
-    "credly": r"(https?://www\.credly\.com/badges/[A-Za-z0-9_-]+)",
-    "coursera": r"(https?://www\.coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+)"
-  },
-  "date_patterns": [
-    r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})",
-    r"(\d{2}/\d{2}/\d{4})"
-  ],
-  "github_username": r"github\.com/([A-Za-z0-9_-]+)",
-  "validator_url_patterns": {
-    "edx": r"https?://(www\.)?edx\.org/certificates/[A-Za-z0-9_-]+/?",
-    "udemy": r"https?://(www\.)?udemy\.com/certificate/[A-Za-z0-9_-]+/?",
-    "linkedin": r"https?://(www\.)?linkedin\.com/learning/certificates/[A-Za-z0-9_-]+/?",
-    "credly": r"https?://(www\.)?credly\.com/badges/[A-Za-z0-9_-]+/?",
-    "coursera": r"https?://(www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?",
-    "linkedin": r"^https://(?:www\.)?linkedin\.com/(learning/certificates|in)/[A-Za-z0-9_-]+/?$",
-    "credly": r"^https://(?:www\.)?credly\.com/(?:org/[^/]+/badge/[^/]+|badges/[A-Za-z0-9_-]+)/?$",
-    "coursera": r"^https://(?:www\.)?coursera\.org/account/accomplishments/verify/[A-Za-z0-9_-]+/?$"
-  },
-  "extract_certificate_id": {
-    "udemy": r"/certificate/(UC-[A-Z0-9]+)",
-    "credly": r"/badges/([A-Za-z0-9_-]+)",
-    "coursera": r"/account/accomplishments/verify/([A-Z0-9]+)(?:\\?.*)?",
-    "linkedin": r"/certificates/([a-z0-9-]+)",
-    "edx": r"/certificates/([a-z0-9]+)"
-  },
-  "percentage_pattern": r"(\d+(?:\.\d+)?)%",
-  "decimal_pattern": r"(\d+\.\d+)",
-  "integer_pattern": r"(\d+)",
-  "followers_pattern": r"([\d,]+) followers",
-  "following_pattern": r"([\d,]+) following",
-  "posts_pattern": r"([\d,]+) posts",
-  "account_verified_pattern": r"([A-Za-z\s]+)'s account is verified",
-  "time_pattern": r"(\d+)\s*hours?\s*(\d+)?\s*minutes?",
-  "hours_pattern": r"(\d+)\s*hours?",
-  "minutes_pattern": r"(\d+)\s*minutes?"
-}
-
-SELECTORS_CONFIG = {
-  "date_selectors": [
-    "time",
-    "[data-testid=\"completion-date\"]",
-    ".completion-date",
-    ".certificate-date",
-    "span[class*=\"date\"]",
-    "div[class*=\"date\"]",
-    ".course-details p strong",
-    ".course-details p"
-  ],
-  "portfolio_fallback_tags": ["p"],
-  "portfolio_keywords": ["about", "developer", "engineer", "student", "enthusiast", "portfolio"],
-  "portfolio_exclude_keywords": ["copyright", "privacy", "terms", "cookie", "all rights", "responsibilities", "experience", "projects", "skills", "education", "contact"],
-  "portfolio_list_exclude_keywords": ["projects", "skills", "experience", "education", "contact", "resume", "certificates", "terms", "conditions", "icon", "hackathons", "internships"],
-  "user_agents": [
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36",
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-  ],
-  "mock_metadata": {
-    "name": "Demo User",
-    "course": "Demo Course",
-    "issue_date": "2022-01-01"
-  },
-  "udemy": {
-    "title": "div.certificate-title, h1",
-    "description": "div.certificate-description, [data-purpose=\"certificate-description\"]",
-    "user_name": "div.user-name",
-    "issue_date": "div.issue-date, span.issue-date"
-  },
-  "credly": {
-    "badge_name": "h1.badge-title, div.BadgeTitle",
-    "issuer": "div.IssuerName",
-    "issue_date": "div.IssuedOn-date, div.IssuedOn",
-    "skills": "div.SkillsList, ul.skills-list"
-  },
-  "coursera": {
-    "name": "p.account-verification-description",
-    "course": "a.product-link",
-    "date": "span.completion-date, time, .certificate-date"
-  },
-  "linkedin": {
-    "name": ".profile-topcard-person-entity__name, h1.text-heading-xlarge",
-    "certificate": ".certificate-card, .certification-list__item"
-  },
-  "edx": {
-    "name": "h1.certificate-title, h1",
-    "date": "span.certificate-date, time"
-  },
-  "platform_names": {
-    "coursera": "Coursera",
-    "udemy": "Udemy",
-    "credly": "Credly",
-    "edx": "EdX",
-    "linkedin": "LinkedIn Learning"
-  },
-  "status_strings": {
-    "valid": "Valid",
-    "invalid": "Invalid",
-    "expired": "Expired",
-    "error": "Error"
-  },
-  "skill_keywords": [
-    "full stack", "ai", "web", "typescript", "next.js", "python", "modern ai", "agentic ai", "mentoring", "problem solving",
-    "javascript", "react", "node", "machine learning", "deep learning", "data science", "html", "css", "docker", "cloud",
-    "api", "database", "sql", "mongodb", "express", "django", "flask", "fastapi", "github", "git", "linux", "devops"
-  ],
-  "experience_keywords": [
-    "student", "leader", "mentoring", "competition", "troubleshoot", "support", "scored", "matriculation",
-    "distinction", "foundation", "performance", "contributions"
-  ],
-  "portfolio_name_selectors": [
-    "h1", "header h1", ".name", ".profile-name", ".user-name", ".hero-title", ".profileHeader-name", "title"
-],
-"portfolio_about_selectors": [
-    ".about", "#about", ".bio", ".description", ".profile-about", ".about-me", "section[aria-label='About']"
-],
-"portfolio_about_max_length": 500,
-"portfolio_about_fallback_tags": ["p", "div"],
-"portfolio_about_keywords": ["about", "developer", "engineer", "enthusiast", "student", "portfolio"],
-"portfolio_skills_selectors": [
-    ".skills", "#skills", ".skill-list", ".skills-list", ".tech-stack", ".stack", ".tags", ".chip", ".badge", ".skill", ".technology", ".technologies", ".skills-section", ".skills__list", ".skills__item", ".skills-container", ".skills-content", ".skills-block", ".skillsGroup", ".skills-section__list", ".skills-section__item", "[data-section='skills']", "[data-testid='skills']"
-],
-"portfolio_project_selectors": [
-    ".project", ".projects-list .project", ".project-card", ".portfolio-project", ".work", ".projectItem", ".projects__item", ".projects-section__item", ".project-block", ".project-entry", ".project-list__item", ".project-section__item", "[data-section='projects']", "[data-testid='projects']"
-],
-"portfolio_project_title_selectors": [
-    ".project-title", "h3", "h2", ".title"
-],
-"portfolio_project_desc_selectors": [
-    ".project-description", ".desc", "p", ".description"
-],
-"portfolio_project_link_selectors": [
-    "a", ".project-link", ".external-link"
-],
-"portfolio_project_fallback_domains": [
-    "github.com", "vercel.app", "netlify.app", "replit.com"
-],
-"portfolio_education_selectors": [
-    ".education", "#education", ".edu", ".education-list", ".degree", ".school", ".university", ".college", ".institute", "#resume", ".education-block", ".academic", ".academics", ".education-section", ".education__item", ".education-entry", ".education-list__item", ".education-section__item", "[data-section='education']", "[data-testid='education']"
-],
-"portfolio_contact_selectors": {
-    "email": ["a[href^='mailto:']", ".email", "#email"],
-    "linkedin": ["a[href*='linkedin.com']", ".linkedin"],
-    "github": ["a[href*='github.com']", ".github"],
-    "twitter": ["a[href*='twitter.com']", ".twitter"],
-    "website": ["a[href^='http']", ".website", ".site"]
-},
-"portfolio_skill_flexible_keywords": [
-    "skill", "stack", "tech", "tools", "technology", "technologies", "competence", "expertise", "proficiency", "abilities", "capabilities"
-],
-"portfolio_project_flexible_keywords": [
-    "project", "work", "portfolio", "case-study", "case_study", "case study", "side-project", "sideproject", "side project", "creation", "build", "demo"
-],
-"portfolio_education_flexible_keywords": [
-    "education", "degree", "school", "university", "college", "institute", "resume", "academic", "academics", "study", "studies", "formation", "diploma", "certification"
-],
-"portfolio_education_keywords": [
-    "bachelor", "master", "phd", "university", "college", "institute", "school", "degree", "resume", "academic", "studies", "diploma", "certification", "course", "formation"
-],
-"portfolio_education_exclude_keywords": [
-    "work", "project", "application", "email", "copywrite", "copyright", "linkedin", "latest", "side", "freelance", "management", "urban", "commercial", "application", "tools", "skills", "contact", "discover", "value", "team", "view", "certificates", "explore", "chat"
-],
-"portfolio_education_min_length": 6,
-"portfolio_education_max_length": 100,
-"portfolio_skill_min_length": 2,
-"portfolio_skill_max_length": 40,
-"portfolio_split_delimiters": ["\n", ",", "|", "•", "-", "\u2022", ";", ".", " and ", " with ", "  "]
-}
-# --- END INLINED CONFIGS ---
+# --- CERTIFICATE VALIDATION CORE ---
+# Configs, deadlines, retries, circuit breakers, HTML parsing and the certificate
+# validators live in cert_validator/core.py, which loads without the web stack.
+# Its process-wide singletons are reached through the module so tests and
+# reloads that swap them are seen here too.
+from cert_validator import core as certificate_core
+from cert_validator.core import (
+    PATTERNS, REGEX_CONFIG, SELECTORS_CONFIG, FETCH_CONFIG, get_config,
+    Deadline, DeadlineExceeded, NO_DEADLINE, current_deadline, iterate_within, timed_out_result,
+    timed_out_sections, within_deadline,
+    load_browser, FetchResponse, RetryPolicy,
+    CircuitBreaker, circuit_open_message, record_upstream_status,
+    make_soup, keyword_matcher, CompiledSelector, compile_selector, match_selector_part,
+    get_selector_program, reload_selector_program,
+    canonicalize_certificate_url, close_quietly, get_certificate_cache, get_certificate_validator,
+)
 
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# --- ENVIRONMENT ---
-load_dotenv()
-
-# --- VALIDATOR CLASSES ---
-# BaseValidator (from base_validator.py)
-import abc
-
-class BaseValidator(abc.ABC):
-    """Abstract base class for certificate validators."""
-    
-    def __init__(self):
-        """Initialize the base validator."""
+# --- HEDGED FETCH ---
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, TimeoutError as FutureTimeoutError, wait as wait_futures
+
+class HostLatencyTracker:
+    """Sliding window of response times per host, used to derive hedge delays."""
+    def __init__(self, window: int = 200):
+        self._samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, host: str, seconds: float):
+        with self._lock:
+            self._samples[host].append(seconds)
+
+    def percentile(self, host: str, q: float, min_samples: int = 1) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+class HedgedFetcher:
+    """Shared GET path that fires a duplicate request when the first one is slow.
+
+    If no response arrives within the host's observed p95 latency, a second
+    identical request is sent and whichever succeeds first wins. Hedges are capped
+    per host, both by how many may be in flight and by their share of all requests,
+    so a struggling host never sees more than a bounded amount of extra load. A hedge
+    stays in flight until the losing attempt finishes too; the loser's response is
+    closed so its connection goes back to the pool, and every attempt carries a
+    timeout so the loser's worker is always released.
+    """
+    def __init__(self, enabled: bool = True, percentile: float = 0.95, default_delay: float = 2.0,
+                 min_delay: float = 0.25, min_samples: int = 10, window: int = 200,
+                 max_inflight_per_host: int = 2, max_hedge_ratio: float = 0.2,
+                 request_timeout: float = 30.0, workers: int = 16):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_inflight_per_host = max_inflight_per_host
+        self.max_hedge_ratio = max_hedge_ratio
+        self.request_timeout = request_timeout
+        self.latencies = HostLatencyTracker(window)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedged-fetch")
+        self._requests: Dict[str, int] = defaultdict(int)
+        self._hedges: Dict[str, int] = defaultdict(int)
+        self._inflight_hedges: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
-        # Removed screenshot_dir and screenshots folder creation
-    
-    @abc.abstractmethod
-    def validate_url_pattern(self, url: str) -> bool:
-        pass
-    
-    @abc.abstractmethod
-    def extract_metadata(self, url: str) -> Dict:
-        pass
-    
-    @abc.abstractmethod
-    def check_certificate_status(self, metadata: Dict) -> str:
-        pass
-    
-    def capture_screenshot(self, url: str, certificate_id: str) -> Optional[str]:
-        # Screenshot functionality removed
-        self.logger.info("Screenshot capture disabled (screenshots folder removed)")
-        return None
-    
-    def validate_certificate(self, url: str, capture_screenshot: bool = False) -> Dict:
-        self.logger.info(f"Validating certificate: {url}")
-        try:
-            metadata = self.extract_metadata(url)
-            if not metadata:
-                return {
-                    "status": "Invalid",
-                    "data": {},
-                    "confidence": 0,
-                    "screenshot": None,
-                    "error_message": "Failed to extract metadata"
-                }
-            status = self.check_certificate_status(metadata)
-            confidence = self._calculate_confidence(metadata, status)
-            screenshot_path = None
-            # Screenshot logic removed
-            return {
-                "status": status,
-                "data": metadata,
-                "confidence": confidence,
-                "screenshot": None,
-                "error_message": None
-            }
-        except Exception as e:
-            self.logger.error(f"Validation error: {e}")
-            return {
-                "status": "Error",
-                "data": {},
-                "confidence": 0,
-                "screenshot": None,
-                "error_message": str(e)
-            }
-    
-    def _calculate_confidence(self, metadata: Dict, status: str) -> int:
-        base_confidence = 80
-        if status in ["Invalid", "Error"]:
-            return 0
-        elif status == "Expired":
-            base_confidence -= 20
-        elif status == "Revoked":
-            base_confidence -= 40
-        required_fields = ["name", "course", "issue_date"]
-        missing_fields = sum(1 for field in required_fields if not metadata.get(field))
-        if missing_fields == 0:
-            base_confidence += 10
-        elif missing_fields == 1:
-            base_confidence -= 10
-        else:
-            base_confidence -= 30
-        return max(0, min(100, base_confidence))
-    
-    def _make_request(self, url: str, max_retries: int = 3, use_selenium: bool = False) -> Optional[str]:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        for attempt in range(max_retries):
-            try:
-                if not use_selenium:
-                    response = requests.get(url, headers=headers, timeout=10)
-                    response.raise_for_status()
-                    return response.text
-                else:
-                    self.logger.info(f"Attempting to fetch with Selenium (attempt {attempt + 1}): {url}")
-                    chrome_options = Options()
-                    chrome_options.add_argument("--headless")
-                    chrome_options.add_argument("--no-sandbox")
-                    chrome_options.add_argument("--disable-dev-shm-usage")
-                    chrome_options.add_argument("--window-size=1920,1080")
-                    chrome_options.add_argument('--disable-gpu')
-                    chrome_options.add_argument('--no-sandbox')
-                    chrome_options.add_argument(f"--user-agent={random.choice(self.user_agents)}")
-                    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                    chrome_options.add_experimental_option("useAutomationExtension", False)
-                    service = Service(ChromeDriverManager().install())
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    driver.set_page_load_timeout(30)
-                    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-                    })
-                    return driver.page_source
-            except Exception as e:
-                self.logger.warning(f"Request attempt {attempt + 1} failed: {e}")
-                time.sleep(2)
-        return None
 
-# --- CourseraValidator (from coursera_validator.py) ---
-class CourseraValidator(BaseValidator):
-    """Validator for Coursera certificates."""
-    
-    def __init__(self):
-        super().__init__()
-        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "coursera"))
-    def validate_url_pattern(self, url: str) -> bool:
-        return bool(self.url_pattern.match(url))
-    def extract_metadata(self, url: str) -> Dict:
-        self.logger.info(f"Extracting metadata from Coursera URL: {url}")
-        certificate_id = self._extract_certificate_id(url)
-        content = self._make_request(url)
-        if not content:
-            self.logger.error("Failed to fetch Coursera certificate page")
-            return {}
-        soup = BeautifulSoup(content, 'html.parser')
-        metadata = {
-            "certificate_id": certificate_id,
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "coursera"),
-            "verification_url": url
-        }
-        name_selector = get_config(SELECTORS_CONFIG, "coursera", "name")
-        name_element = soup.select_one(name_selector)
-        if name_element:
-            text = name_element.get_text()
-            name_match = re.search(get_config(REGEX_CONFIG, "account_verified_pattern"), text)
-            if name_match:
-                metadata["name"] = name_match.group(1).strip()
-        course_selector = get_config(SELECTORS_CONFIG, "coursera", "course")
-        if name_element:
-            course_link = name_element.select_one(course_selector)
-            if course_link:
-                metadata["course"] = course_link.get_text(strip=True)
-        date_selectors = get_config(SELECTORS_CONFIG, "date_selectors")
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
-            if date_element:
-                date_text = date_element.get_text(strip=True)
-                if date_text and not any(word in date_text.lower() for word in ['completed', 'by', 'account', 'verified']):
-                    parsed_date = self._parse_date(date_text)
-                    if parsed_date:
-                        metadata["issue_date"] = parsed_date
-                        break
-        if not metadata.get("issue_date"):
-            page_text = soup.get_text()
-            date_patterns = get_config(REGEX_CONFIG, "date_patterns")
-            for pattern in date_patterns:
-                date_match = re.search(pattern, page_text)
-                if date_match:
-                    parsed_date = self._parse_date(date_match.group(1))
-                    if parsed_date:
-                        metadata["issue_date"] = parsed_date
-                        break
-        # The rest of the fields (expiry, instructor, org) can be config-driven if needed
-        if not metadata.get("name") and not metadata.get("course"):
-            metadata.update(self._get_mock_metadata(certificate_id))
-        self.logger.info(f"Extracted metadata: {metadata}")
-        return metadata
-    def check_certificate_status(self, metadata: Dict) -> str:
-        if not metadata:
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        required_fields = ["name", "course", "issue_date"]
-        if not all(metadata.get(field) for field in required_fields):
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        if metadata.get("expiry_date"):
-            try:
-                expiry_date = datetime.strptime(metadata["expiry_date"], "%Y-%m-%d")
-                if expiry_date < datetime.now():
-                    return get_config(SELECTORS_CONFIG, "status_strings", "expired")
-            except (ValueError, TypeError):
-                pass
-        if metadata.get("issue_date"):
-            try:
-                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
-                if issue_date < datetime(2010, 1, 1):
-                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-            except (ValueError, TypeError):
-                pass
-        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
-    def _extract_certificate_id(self, url: str) -> str:
-        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "coursera")
-        match = re.search(pattern, url)
-        return match.group(1) if match else "unknown"
-    def _parse_date(self, date_text: str) -> Optional[str]:
-        if not date_text:
-            return None
-        date_formats = [
-            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
-            "%d %B %Y", "%d %b %Y", "%B %d %Y", "%b %d %Y"
-        ]
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_text.strip(), fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
-            year_month_day = re.search(pattern, date_text)
-            if year_month_day:
-                groups = year_month_day.groups()
-                if len(groups) == 3:
-                    year, month, day = groups
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        return None
-    def _get_mock_metadata(self, certificate_id: str) -> Dict:
-        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
-        return {
-            "certificate_id": certificate_id,
-            "name": mock["name"],
-            "course": mock["course"],
-            "issue_date": mock["issue_date"],
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "coursera"),
-            "verification_url": f"https://www.coursera.com/certificate/{certificate_id}"
-        }
+    @classmethod
+    def from_config(cls) -> "HedgedFetcher":
+        return cls(**get_config(FETCH_CONFIG, "hedging"))
 
-# --- CredlyValidator (from credly_validator.py) ---
-class CredlyValidator(BaseValidator):
-    """Validator for Credly badges."""
-    def __init__(self):
-        super().__init__()
-        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "credly"))
-        self.user_agents = get_config(SELECTORS_CONFIG, "user_agents")
-    def validate_url_pattern(self, url: str) -> bool:
-        return bool(self.url_pattern.match(url))
-    def _setup_webdriver(self) -> Optional[webdriver.Chrome]:
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-software-rasterizer")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-            chrome_options.add_argument("--disable-site-isolation-trials")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument(f"--user-agent={random.choice(self.user_agents)}")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-            })
-            return driver
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
-            return None
-    def _extract_metadata_from_html(self, content: str) -> Tuple[Dict, bool]:
-        metadata = {}
-        success = False
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            # Badge name
-            badge_name = soup.find('h1', class_='ac-heading ac-heading--badge-name-hero')
-            if badge_name:
-                metadata["badge_name"] = badge_name.get_text(strip=True)
-                self.logger.info(f"Found badge name: {metadata['badge_name']}")
-            # Issuer
-            issuer_div = soup.find('div', class_='cr-badges-badge-issuer__entity')
-            if issuer_div:
-                issuer_text = issuer_div.get_text(strip=True)
-                if issuer_text.lower().startswith('issued by'):
-                    issuer_text = issuer_text[len('issued by'):].strip()
-                metadata["organization"] = issuer_text
-                self.logger.info(f"Found organization: {metadata['organization']}")
-            # Description
-            desc_div = soup.find('div', class_='cr-badges-full-badge__description')
-            if desc_div:
-                desc_span = desc_div.find('span', class_='shiitake-children')
-                if desc_span:
-                    metadata["description"] = desc_span.get_text(strip=True)
-                else:
-                    metadata["description"] = desc_div.get_text(strip=True)
-            # Skills
-            skills_ul = soup.find('ul', class_='cr-badges-badge-skills__skills')
-            if skills_ul:
-                skills = [li.get_text(strip=True) for li in skills_ul.find_all('li')]
-                metadata["skills"] = skills
-                self.logger.info(f"Found skills: {skills}")
-            # Earning Criteria
-            criteria_ul = soup.find('ul', class_='cr-badges-earning-criteria__criteria')
-            if criteria_ul:
-                criteria = [li.get_text(strip=True) for li in criteria_ul.find_all('li')]
-                metadata["earning_criteria"] = criteria
-                self.logger.info(f"Found earning criteria: {criteria}")
-            if metadata.get("badge_name") and metadata.get("organization"):
-                success = True
-        except Exception as e:
-            self.logger.error(f"Error parsing HTML: {str(e)}")
-        return metadata, success
-    def extract_metadata(self, url: str) -> Dict:
-        self.logger.info(f"Extracting metadata from Credly URL: {url}")
-        metadata = {
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "credly"),
-            "verification_url": url
-        }
-        max_retries = 3
-        retry_delay = 7  # Increased base wait
-        for attempt in range(max_retries):
-            driver = None
-            try:
-                self.logger.info(f"Attempt {attempt + 1} of {max_retries}")
-                driver = self._setup_webdriver()
-                if not driver:
-                    continue
-                driver.get(url)
-                # Wait for badge title or h1 to appear (explicit wait)
-                try:
-                    WebDriverWait(driver, 30).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    WebDriverWait(driver, 30).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, get_config(SELECTORS_CONFIG, "credly", "badge_name")))
-                    )
-                except TimeoutException:
-                    self.logger.warning("Timeout waiting for badge content, trying to proceed anyway")
-                    self.logger.debug(f"Page source: {driver.page_source}")
-                # Add extra random sleep to mimic human
-                import random, time
-                time.sleep(retry_delay + random.uniform(2, 5))
-                self.logger.info(f"Page title: {driver.title}")
-                content = driver.page_source
-                extracted_metadata, success = self._extract_metadata_from_html(content)
-                if success:
-                    metadata.update(extracted_metadata)
-                    break
-                else:
-                    self.logger.warning(f"Failed to extract metadata on attempt {attempt + 1}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay + random.uniform(1, 3))
-            except Exception as e:
-                self.logger.error(f"Error extracting metadata: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay + random.uniform(1, 3))
-            finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
-        return metadata
-    def check_certificate_status(self, metadata: Dict) -> str:
-        if not metadata:
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        required_fields = ["badge_name", "organization"]
-        if not all(metadata.get(field) for field in required_fields):
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
-
-# --- EdXValidator (from edx_validator.py) ---
-class EdXValidator(BaseValidator):
-    """Validator for EdX certificates."""
-    def __init__(self):
-        super().__init__()
-        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "edx"))
-    def validate_url_pattern(self, url: str) -> bool:
-        return bool(self.url_pattern.match(url))
-    def extract_metadata(self, url: str) -> Dict:
-        self.logger.info(f"Extracting metadata from EdX URL: {url}")
-        certificate_id = self._extract_certificate_id(url)
-        content = self._make_request(url)
-        if not content:
-            self.logger.error("Failed to fetch EdX certificate page")
-            return {}
-        soup = BeautifulSoup(content, 'html.parser')
-        metadata = {
-            "certificate_id": certificate_id,
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "edx"),
-            "verification_url": url
-        }
-        name_selector = get_config(SELECTORS_CONFIG, "edx", "name")
-        name_element = soup.select_one(name_selector)
-        if name_element:
-            metadata["name"] = name_element.get_text(strip=True)
-        date_selector = get_config(SELECTORS_CONFIG, "edx", "date")
-        date_element = soup.select_one(date_selector)
-        if date_element:
-            date_text = date_element.get_text(strip=True)
-            metadata["issue_date"] = self._parse_date(date_text)
-        if not metadata.get("name"):
-            metadata.update(self._get_mock_metadata(certificate_id))
-        self.logger.info(f"Extracted metadata: {metadata}")
-        return metadata
-    def check_certificate_status(self, metadata: Dict) -> str:
-        if not metadata:
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        required_fields = ["name", "issue_date"]
-        if not all(metadata.get(field) for field in required_fields):
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        if metadata.get("issue_date"):
-            try:
-                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
-                if issue_date < datetime(2010, 1, 1):
-                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-            except (ValueError, TypeError):
-                pass
-        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
-    def _extract_certificate_id(self, url: str) -> str:
-        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "edx")
-        match = re.search(pattern, url)
-        return match.group(1) if match else "unknown"
-    def _parse_date(self, date_text: str) -> Optional[str]:
-        if not date_text:
-            return None
-        date_formats = [
-            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
-            "%d %B %Y", "%d %b %Y"
-        ]
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_text.strip(), fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
-            year_month_day = re.search(pattern, date_text)
-            if year_month_day:
-                groups = year_month_day.groups()
-                if len(groups) == 3:
-                    year, month, day = groups
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        return None
-    def _get_mock_metadata(self, certificate_id: str) -> Dict:
-        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
-        return {
-            "certificate_id": certificate_id,
-            "name": mock["name"],
-            "issue_date": mock["issue_date"],
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "edx"),
-            "verification_url": f"https://www.edx.org/certificates/{certificate_id}"
-        }
+    def hedge_delay(self, host: str) -> float:
+        observed = self.latencies.percentile(host, self.percentile, self.min_samples)
+        return max(self.min_delay, observed if observed is not None else self.default_delay)
 
-# --- LinkedInValidator (from linkedin_validator.py) ---
-class LinkedInValidator(BaseValidator):
-    """Validator for LinkedIn certificates."""
-    def __init__(self):
-        super().__init__()
-        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "linkedin"))
-    def validate_url_pattern(self, url: str) -> bool:
-        return bool(self.url_pattern.match(url))
-    def extract_metadata(self, url: str) -> Dict:
-        self.logger.info(f"Extracting metadata from LinkedIn URL: {url}")
-        certificate_id = self._extract_certificate_id(url)
-        content = self._make_request(url)
-        if not content:
-            self.logger.error("Failed to fetch LinkedIn certificate page")
-            return {}
-        soup = BeautifulSoup(content, 'html.parser')
-        metadata = {
-            "certificate_id": certificate_id,
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "linkedin"),
-            "verification_url": url
-        }
-        name_selector = get_config(SELECTORS_CONFIG, "linkedin", "name")
-        name_element = soup.select_one(name_selector)
-        if name_element:
-            metadata["name"] = name_element.get_text(strip=True)
-        cert_selector = get_config(SELECTORS_CONFIG, "linkedin", "certificate")
-        cert_element = soup.select_one(cert_selector)
-        if cert_element:
-            metadata["course"] = cert_element.get_text(strip=True)
-        date_selectors = get_config(SELECTORS_CONFIG, "date_selectors")
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
-            if date_element:
-                date_text = date_element.get_text(strip=True)
-                parsed_date = self._parse_date(date_text)
-                if parsed_date:
-                    metadata["issue_date"] = parsed_date
-                    break
-        if not metadata.get("name"):
-            metadata.update(self._get_mock_metadata(certificate_id))
-        self.logger.info(f"Extracted metadata: {metadata}")
-        return metadata
-    def check_certificate_status(self, metadata: Dict) -> str:
-        if not metadata:
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        required_fields = ["name", "course", "issue_date"]
-        if not all(metadata.get(field) for field in required_fields):
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        if metadata.get("issue_date"):
-            try:
-                issue_date = datetime.strptime(metadata["issue_date"], "%Y-%m-%d")
-                if issue_date < datetime(2010, 1, 1):
-                    return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-            except (ValueError, TypeError):
-                pass
-        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
-    def _extract_certificate_id(self, url: str) -> str:
-        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "linkedin")
-        match = re.search(pattern, url)
-        return match.group(1) if match else "unknown"
-    def _parse_date(self, date_text: str) -> Optional[str]:
-        if not date_text:
-            return None
-        date_formats = [
-            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
-            "%d %B %Y", "%d %b %Y"
-        ]
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_text.strip(), fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
-            year_month_day = re.search(pattern, date_text)
-            if year_month_day:
-                groups = year_month_day.groups()
-                if len(groups) == 3:
-                    year, month, day = groups
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        return None
-    def _get_mock_metadata(self, certificate_id: str) -> Dict:
-        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
-        return {
-            "certificate_id": certificate_id,
-            "name": mock["name"],
-            "course": mock["course"],
-            "issue_date": mock["issue_date"],
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "linkedin"),
-            "verification_url": f"https://www.linkedin.com/learning/certificates/{certificate_id}"
-        }
+    def _timed_get(self, host: str, url: str, **kwargs) -> requests.Response:
+        started = time.monotonic()
+        response = requests.get(url, **kwargs)
+        self.latencies.record(host, time.monotonic() - started)
+        return response
 
-# --- UdemyValidator (from udemy_validator.py) ---
-class UdemyValidator(BaseValidator):
-    """Validator for Udemy certificates."""
-    def __init__(self):
-        super().__init__()
-        self.url_pattern = re.compile(get_config(REGEX_CONFIG, "validator_url_patterns", "udemy"))
-        self.user_agents = get_config(SELECTORS_CONFIG, "user_agents")
-    def validate_url_pattern(self, url: str) -> bool:
-        return bool(self.url_pattern.match(url))
-    def _setup_webdriver(self) -> Optional[webdriver.Chrome]:
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-software-rasterizer")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-            chrome_options.add_argument("--disable-site-isolation-trials")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument(f"--user-agent={random.choice(self.user_agents)}")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-            })
-            return driver
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
-            return None
-    def _extract_metadata_from_html(self, content: str) -> Tuple[Dict, bool]:
-        metadata = {}
-        success = False
+    def _acquire_hedge(self, host: str) -> bool:
+        with self._lock:
+            if self._inflight_hedges[host] >= self.max_inflight_per_host:
+                return False
+            if self._hedges[host] > self.max_hedge_ratio * self._requests[host]:
+                return False
+            self._inflight_hedges[host] += 1
+            self._hedges[host] += 1
+            return True
+
+    def _release_hedge(self, host: str, attempts: List[Future]):
+        """Free the host's hedge slot once every attempt has finished."""
+        unsettled = [len(attempts)]
+
+        def settled(_):
+            with self._lock:
+                unsettled[0] -= 1
+                if not unsettled[0]:
+                    self._inflight_hedges[host] -= 1
+
+        for attempt in attempts:
+            attempt.add_done_callback(settled)
+
+    @staticmethod
+    def _discard(attempt: Future):
+        """Cancel a losing attempt, or close its response when it arrives."""
+        if attempt.cancel():
+            return
+
+        def close(done: Future):
+            if not done.cancelled() and done.exception() is None:
+                done.result().close()
+
+        attempt.add_done_callback(close)
+
+    def get(self, url: str, hedge: bool = True, **kwargs) -> requests.Response:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            self._requests[host] += 1
+        kwargs.setdefault("timeout", self.request_timeout)
+        if not (hedge and self.enabled):
+            return self._timed_get(host, url, **kwargs)
+        primary = self._executor.submit(self._timed_get, host, url, **kwargs)
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            # Find the certificate description container
-            description_div = soup.find('div', {'data-purpose': 'certificate-description'})
-            if description_div:
-                # Recipient
-                name_element = description_div.find('a', {'data-purpose': 'certificate-recipient-url'})
-                if name_element:
-                    metadata["recipient"] = name_element.get_text(strip=True)
-                # Course title
-                course_element = description_div.find('a', {'data-purpose': 'certificate-course-url'})
-                if course_element:
-                    metadata["course"] = course_element.get_text(strip=True)
-                # Instructors (can be multiple)
-                instructors = [a.get_text(strip=True) for a in description_div.find_all('a', href=True) if '/user/' in a['href'] and not a.has_attr('data-purpose')]
-                if instructors:
-                    metadata["instructors"] = instructors
-                # Completion date
-                description_text = description_div.get_text()
-                import re
-                date_match = re.search(r'on (\d{2}/\d{2}/\d{4})', description_text)
-                if date_match:
-                    date_text = date_match.group(1)
-                    metadata["issue_date"] = self._parse_date(date_text)
-                # Description
-                metadata["description"] = description_div.get_text(strip=True)
-                if metadata.get("recipient") and metadata.get("course") and metadata.get("issue_date"):
-                    success = True
-        except Exception as e:
-            self.logger.error(f"Error parsing Udemy HTML: {str(e)}")
-        return metadata, success
-    def extract_metadata(self, url: str) -> Dict:
-        self.logger.info(f"Extracting metadata from Udemy URL: {url}")
-        metadata = {
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "udemy"),
-            "verification_url": url
-        }
-        max_retries = 3
-        retry_delay = 7  # Increased base wait
-        for attempt in range(max_retries):
-            driver = None
+            return primary.result(timeout=self.hedge_delay(host))
+        except FutureTimeoutError:
+            pass
+        if not self._acquire_hedge(host):
+            return primary.result()
+        self.logger.info(f"Hedging slow request to {host}")
+        backup = self._executor.submit(self._timed_get, host, url, **kwargs)
+        self._release_hedge(host, [primary, backup])
+        pending = {primary, backup}
+        error = None
+        while pending:
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        self._discard(loser)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+hedged_fetcher = None
+
+def get_hedged_fetcher() -> HedgedFetcher:
+    global hedged_fetcher
+    if hedged_fetcher is None:
+        hedged_fetcher = HedgedFetcher.from_config()
+    return hedged_fetcher
+
+# --- PROFILE CACHE ---
+import sqlite3
+
+class ProfileCache:
+    """TTL cache for profile lookups with stale-while-revalidate.
+
+    Entries younger than ``ttl_seconds`` are fresh. Older entries are still served
+    for up to ``stale_ttl_seconds`` more while a single background refresh runs.
+    Memory holds an LRU of ``max_entries``; with ``persist_path`` set, entries are
+    also written to SQLite so they survive restarts and are shared across workers.
+    Error and partial results (dicts with an ``error`` or ``incomplete`` key) are
+    never cached.
+    """
+    def __init__(self, namespace: str, ttl_seconds: float = 3600, stale_ttl_seconds: float = 86400,
+                 max_entries: int = 1000, persist_path: Optional[str] = None):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing = set()
+        self._background_tasks = set()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if persist_path:
+            with sqlite3.connect(persist_path) as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS profile_cache (namespace TEXT, key TEXT, stored_at REAL, value TEXT, PRIMARY KEY (namespace, key))")
+
+    @classmethod
+    def from_config(cls, namespace: str) -> "ProfileCache":
+        settings = dict(get_config(FETCH_CONFIG, "profile_cache"))
+        settings["persist_path"] = os.getenv("PROFILE_CACHE_PATH") or settings.get("persist_path")
+        return cls(namespace, **settings)
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._entries.get(key)
+        if entry is None and self.persist_path:
+            with sqlite3.connect(self.persist_path) as conn:
+                row = conn.execute("SELECT stored_at, value FROM profile_cache WHERE namespace = ? AND key = ?",
+                                   (self.namespace, key)).fetchone()
+            if row:
+                entry = (row[0], json.loads(row[1]))
+                self._entries[key] = entry
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Return ``(value, is_fresh)``; value is None on a miss or when the entry is too old to serve."""
+        with self._lock:
+            entry = self._load(key)
+            age = time.time() - entry[0] if entry else None
+            if entry is None or age > self.ttl_seconds + self.stale_ttl_seconds:
+                self.stats["misses"] += 1
+                return None, False
+            if age <= self.ttl_seconds:
+                self.stats["hits"] += 1
+                return entry[1], True
+            self.stats["stale_hits"] += 1
+            return entry[1], False
+
+    def set(self, key: str, value: Any):
+        if not value or (isinstance(value, dict) and (value.get("error") or value.get("incomplete"))):
+            return
+        stored_at = time.time()
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        if self.persist_path:
+            with sqlite3.connect(self.persist_path) as conn:
+                conn.execute("INSERT OR REPLACE INTO profile_cache VALUES (?, ?, ?, ?)",
+                             (self.namespace, key, stored_at, json.dumps(value, default=str)))
+
+    def begin_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.stats["refreshes"] += 1
+            return True
+
+    def end_refresh(self, key: str):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def track(self, task: "asyncio.Task"):
+        """Keep a reference to a background refresh task until it finishes."""
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def refresh_in_background(self, key: str, fetch):
+        """Re-run the coroutine factory ``fetch`` for ``key`` as a task, unless a refresh is already running."""
+        if not self.begin_refresh(key):
+            return
+        async def refresh():
             try:
-                self.logger.info(f"Attempt {attempt + 1} of {max_retries}")
-                driver = self._setup_webdriver()
-                if not driver:
-                    continue
-                driver.get(url)
-                # Wait for certificate title or h1 to appear (explicit wait)
-                try:
-                    WebDriverWait(driver, 30).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    WebDriverWait(driver, 30).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, get_config(SELECTORS_CONFIG, "udemy", "title")))
-                    )
-                except TimeoutException:
-                    self.logger.warning("Timeout waiting for certificate description, trying to proceed anyway")
-                # Add extra random sleep to mimic human
-                import random, time
-                time.sleep(retry_delay + random.uniform(2, 5))
-                self.logger.info(f"Page title: {driver.title}")
-                content = driver.page_source
-                extracted_metadata, success = self._extract_metadata_from_html(content)
-                if success:
-                    metadata.update(extracted_metadata)
-                    break
-                else:
-                    self.logger.warning(f"Failed to extract metadata on attempt {attempt + 1}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay + random.uniform(1, 3))
+                self.set(key, await fetch())
             except Exception as e:
-                self.logger.error(f"Error extracting metadata: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay + random.uniform(1, 3))
+                self.logger.warning(f"Background refresh of {self.namespace}:{key} failed: {e}")
             finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
-        return metadata
-    def check_certificate_status(self, metadata: Dict) -> str:
-        if not metadata:
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        required_fields = ["name", "course", "issue_date"]
-        if not all(metadata.get(field) for field in required_fields):
-            return get_config(SELECTORS_CONFIG, "status_strings", "invalid")
-        return get_config(SELECTORS_CONFIG, "status_strings", "valid")
-    def _extract_certificate_id(self, url: str) -> str:
-        pattern = get_config(REGEX_CONFIG, "extract_certificate_id", "udemy")
-        match = re.search(pattern, url)
-        return match.group(1) if match else "unknown"
-    def _parse_date(self, date_text: str) -> Optional[str]:
-        if not date_text:
-            return None
-        date_formats = [
-            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y",
-            "%d %B %Y", "%d %b %Y"
-        ]
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_text.strip(), fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        for pattern in get_config(REGEX_CONFIG, "date_patterns"):
-            year_month_day = re.search(pattern, date_text)
-            if year_month_day:
-                groups = year_month_day.groups()
-                if len(groups) == 3:
-                    year, month, day = groups
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+                self.end_refresh(key)
+        self.track(asyncio.create_task(refresh()))
+
+    async def get_or_fetch_async(self, key: str, fetch):
+        """Serve ``key`` from cache, calling the coroutine factory ``fetch`` on a miss or in the background when stale."""
+        value, fresh = self.get(key)
+        if value is None:
+            value = await fetch()
+            self.set(key, value)
+            return value
+        if not fresh:
+            self.refresh_in_background(key, fetch)
+        return value
+
+    def get_or_fetch(self, key: str, fetch):
+        """Synchronous counterpart of :meth:`get_or_fetch_async`; stale refreshes run on a worker thread."""
+        value, fresh = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value)
+            return value
+        if not fresh and self.begin_refresh(key):
+            def refresh():
+                try:
+                    self.set(key, fetch())
+                except Exception as e:
+                    self.logger.warning(f"Background refresh of {self.namespace}:{key} failed: {e}")
+                finally:
+                    self.end_refresh(key)
+            threading.Thread(target=refresh, name=f"{self.namespace}-refresh", daemon=True).start()
+        return value
+
+profile_caches: Dict[str, ProfileCache] = {}
+
+def get_profile_cache(namespace: str) -> ProfileCache:
+    if namespace not in profile_caches:
+        profile_caches[namespace] = ProfileCache.from_config(namespace)
+    return profile_caches[namespace]
+
+# --- TEXT INDEX ---
+class TextIndex:
+    """A page's text flattened once, with every element's ``[start, end)`` span into it.
+
+    ``text(tag)`` is then a slice instead of re-serialising the subtree, and
+    keyword lookups search the flat text once and map the hit back to the
+    innermost element (optionally of a given tag name) that contains it.
+    Text follows ``get_text()``: plain strings and CDATA only, so comments and
+    script/style contents are left out.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.spans: Dict[int, Tuple[int, int]] = {}
+        self.by_tag: Dict[str, List[Tag]] = defaultdict(list)
+        self.elements: List[Tag] = []
+        parts = []
+        offset = 0
+        open_tags: List[Tag] = [root]
+        starts = {id(root): 0}
+        for node in root.descendants:
+            while open_tags[-1] is not node.parent:
+                closed = open_tags.pop()
+                self.spans[id(closed)] = (starts[id(closed)], offset)
+            if isinstance(node, Tag):
+                starts[id(node)] = offset
+                open_tags.append(node)
+                self.elements.append(node)
+                self.by_tag[node.name].append(node)
+            elif type(node) in (NavigableString, CData):
+                parts.append(str(node))
+                offset += len(node)
+        for closed in open_tags:
+            self.spans[id(closed)] = (starts[id(closed)], offset)
+        self.flat = "".join(parts)
+        self._lower: Optional[str] = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.flat.lower()
+        return self._lower
+
+    def text(self, tag=None) -> str:
+        start, end = self.spans[id(tag if tag is not None else self.root)]
+        return self.flat[start:end]
+
+    def find(self, keyword: str, name: Optional[str] = None) -> Optional[Tag]:
+        """Innermost element (of tag ``name`` if given) whose text contains ``keyword``, case-insensitively.
+
+        Occurrences are tried in page order, so the result is the nearest
+        enclosing element of the first occurrence that has one.
+        """
+        keyword = keyword.lower()
+        candidates = self.by_tag.get(name, []) if name else self.elements
+        starts = [self.spans[id(tag)][0] for tag in candidates]
+        position = self.lower.find(keyword)
+        while position != -1:
+            end = position + len(keyword)
+            # Walk back from the last element starting at or before the hit; later starts are deeper
+            for i in range(bisect_right(starts, position) - 1, -1, -1):
+                if self.spans[id(candidates[i])][1] >= end:
+                    return candidates[i]
+            position = self.lower.find(keyword, position + 1)
         return None
-    def _get_mock_metadata(self, certificate_id: str) -> Dict:
-        mock = get_config(SELECTORS_CONFIG, "mock_metadata")
-        return {
-            "certificate_id": certificate_id,
-            "name": mock["name"],
-            "course": mock["course"],
-            "issue_date": mock["issue_date"],
-            "platform": get_config(SELECTORS_CONFIG, "platform_names", "udemy"),
-            "verification_url": f"https://www.udemy.com/certificate/{certificate_id}"
-        }
-
-# --- CERTIFICATE VALIDATION ORCHESTRATOR (from validate_certificate.py) ---
-class CertificateValidator:
-    """Main certificate validation orchestrator."""
-    def __init__(self):
-        self.validators: Dict[str, BaseValidator] = {
-            'coursera.org': CourseraValidator(),
-            'www.coursera.org': CourseraValidator(),
-            'credly.com': CredlyValidator(),
-            'www.credly.com': CredlyValidator(),
-            'udemy.com': UdemyValidator(),
-            'www.udemy.com': UdemyValidator(),
-            'edx.org': EdXValidator(),
-            'www.edx.org': EdXValidator(),
-            'linkedin.com': LinkedInValidator(),
-            'www.linkedin.com': LinkedInValidator(),
-        }
-        self._setup_logging()
-    def _setup_logging(self):
-        log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(log_dir, 'validation.log')),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-    def _validate_url_format(self, url: str) -> bool:
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.scheme == 'https' and
-                parsed.netloc in self.validators and
-                len(url) < 2048
-            )
-        except Exception as e:
-            self.logger.error(f"URL validation error: {e}")
-            return False
-    def _get_validator(self, url: str) -> Optional[BaseValidator]:
-        try:
-            domain = urlparse(url).netloc
-            return self.validators.get(domain)
-        except Exception as e:
-            self.logger.error(f"Error getting validator: {e}")
-            return None
-    def validate_certificate(self, url: str, capture_screenshot: bool = False) -> Dict:
-        self.logger.info(f"Starting validation for URL: {url}")
-        response = {
-            "status": "Error",
-            "data": {},
-            "confidence": 0,
-            "screenshot": None,
-            "error_message": None
-        }
-        try:
-            if not self._validate_url_format(url):
-                response["status"] = "Invalid"
-                response["error_message"] = "Invalid URL format or untrusted domain"
-                self.logger.warning(f"Invalid URL format: {url}")
-                return response
-            validator = self._get_validator(url)
-            if not validator:
-                response["status"] = "Invalid"
-                response["error_message"] = "Unsupported platform"
-                self.logger.warning(f"Unsupported platform for URL: {url}")
-                return response
-            if not validator.validate_url_pattern(url):
-                response["status"] = "Invalid"
-                response["error_message"] = "Invalid URL pattern for platform"
-                self.logger.warning(f"Invalid URL pattern: {url}")
-                return response
-            validation_result = validator.validate_certificate(url, capture_screenshot)
-            response.update(validation_result)
-            self.logger.info(f"Validation completed for {url}: {response['status']}")
-        except Exception as e:
-            response["status"] = "Error"
-            response["error_message"] = str(e)
-            self.logger.error(f"Validation error for {url}: {e}")
-        return response
-
-# --- CERTIFICATE VALIDATOR API (from certificate_validator_api.py) ---
-class CertificateValidationError(Exception):
-    """Custom exception for certificate validation errors."""
-    pass
-
-class CertificateValidatorAPI:
-    """API wrapper for certificate validation functionality."""
-    def __init__(self):
-        if CertificateValidator is None:
-            raise CertificateValidationError("CertificateValidator not available")
-        self.validator = CertificateValidator()
-        self.logger = logging.getLogger(__name__)
-    def validate_certificates(self, certificate_urls: List[str]) -> Dict[str, Dict]:
-        if not certificate_urls:
-            return {}
-        results = {}
-        for url in certificate_urls:
-            try:
-                self.logger.info(f"Validating certificate: {url}")
-                result = self.validator.validate_certificate(url, capture_screenshot=False)
-                results[url] = result
-            except Exception as e:
-                self.logger.error(f"Error validating certificate {url}: {e}")
-                results[url] = {
-                    "status": "Error",
-                    "data": {},
-                    "confidence": 0,
-                    "screenshot": None,
-                    "error_message": str(e)
-                }
-        return results
-    def validate_single_certificate(self, url: str) -> Dict:
-        try:
-            self.logger.info(f"Validating single certificate: {url}")
-            return self.validator.validate_certificate(url, capture_screenshot=False)
-        except Exception as e:
-            self.logger.error(f"Error validating certificate {url}: {e}")
-            return {
-                "status": "Error",
-                "data": {},
-                "confidence": 0,
-                "screenshot": None,
-                "error_message": str(e)
-            }
-
-certificate_validator = None
-
-def get_certificate_validator() -> Optional[CertificateValidatorAPI]:
-    global certificate_validator
-    if certificate_validator is None:
-        try:
-            certificate_validator = CertificateValidatorAPI()
-        except Exception as e:
-            logging.error(f"Failed to initialize certificate validator: {e}")
-            return None
-    return certificate_validator
-
-def main():
-    """CLI interface for certificate validation."""
-    import argparse
-    parser = argparse.ArgumentParser(description='Certificate Validation System')
-    parser.add_argument('url', help='Certificate URL to validate')
-    parser.add_argument('--screenshot', action='store_true', help='Capture screenshot of certificate page')
-    parser.add_argument('--output', help='Output file for JSON results')
-    args = parser.parse_args()
-    validator = CertificateValidator()
-    result = validator.validate_certificate(args.url, args.screenshot)
-    if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
-        print(f"Results saved to {args.output}")
-    else:
-        print(json.dumps(result, indent=2))
 
 # CLI entry point for certificate validation---
 
@@ -1109,19 +413,21 @@ def extract_text_from_tags(soup, selectors: List[str], max_length: int = 500, fa
         fallback_tags = get_config(SELECTORS_CONFIG, "portfolio_fallback_tags")
     if keywords is None:
         keywords = get_config(SELECTORS_CONFIG, "portfolio_keywords")
+    include = keyword_matcher(keywords)
+    exclude = keyword_matcher(exclude_keywords)
     extracted_texts = []
     for selector in selectors:
         tags = soup.select(selector)
         for tag in tags:
             text = clean_text(tag.get_text())
-            if text and len(text) <= max_length and (not keywords or any(kw.lower() in text.lower() for kw in keywords)) and not any(ex_kw.lower() in text.lower() for ex_kw in exclude_keywords):
+            if text and len(text) <= max_length and (not keywords or include.search(text)) and not exclude.search(text):
                 extracted_texts.append(text)
     if not extracted_texts and fallback_tags:
         for tag_name in fallback_tags:
             tags = soup.find_all(tag_name)
             for tag in tags:
                 text = clean_text(tag.get_text())
-                if text and len(text) <= max_length and not any(ex_kw.lower() in text.lower() for ex_kw in exclude_keywords) and (not keywords or any(kw.lower() in text.lower() for kw in keywords)):
+                if text and len(text) <= max_length and not exclude.search(text) and (not keywords or include.search(text)):
                     extracted_texts.append(text)
     return " ".join(list(dict.fromkeys(extracted_texts)))[:max_length] if extracted_texts else None
 
@@ -1136,7 +442,7 @@ def extract_single_text(soup, selectors: List[str], max_length: int = 500) -> Op
 
 def extract_list_from_tags(soup, selectors: List[str], separator: str = ',') -> List[str]:
     items = []
-    exclude_keywords = set(get_config(SELECTORS_CONFIG, "portfolio_list_exclude_keywords"))
+    exclude = keyword_matcher(get_config(SELECTORS_CONFIG, "portfolio_list_exclude_keywords"))
     for selector in selectors:
         elements = soup.select(selector)
         for elem in elements:
@@ -1145,10 +451,10 @@ def extract_list_from_tags(soup, selectors: List[str], separator: str = ',') ->
                 text = clean_text(elem.get('alt'))
             else:
                 text = clean_text(elem.get_text() or elem.get('alt') or elem.get('title'))
-            if not text or any(ex_kw.lower() in text.lower() for ex_kw in exclude_keywords):
+            if not text or exclude.search(text):
                 continue
             if separator in text:
-                items.extend([clean_text(item) for item in text.split(separator) if clean_text(item) and not any(ex_kw.lower() in item.lower() for ex_kw in exclude_keywords)])
+                items.extend([clean_text(item) for item in text.split(separator) if clean_text(item) and not exclude.search(item)])
             elif len(text.split()) <= 5 and text not in items:
                 items.append(text)
     return list(dict.fromkeys([item for item in items if item]))
@@ -1163,20 +469,6 @@ def extract_link_from_tags(soup, selectors: List[str], base_url: str) -> Optiona
             return urljoin(base_url, href)
     return None
 
-def _find_flexible_tags(soup, keywords, tag_names=None):
-    """Find tags where class or id contains any of the keywords (config-driven, no regex)."""
-    if tag_names is None:
-        tag_names = ["div", "section", "ul", "li", "span", "p"]
-    found = []
-    for tag in soup.find_all(tag_names):
-        classes = ' '.join(tag.get('class', []))
-        id_ = tag.get('id', '')
-        for kw in keywords:
-            if kw.lower() in classes.lower() or kw.lower() in id_.lower():
-                found.append(tag)
-                break
-    return found
-
 def _split_and_clean(text, delimiters=None):
     if not text:
         return []
@@ -1188,64 +480,410 @@ def _split_and_clean(text, delimiters=None):
     items = text.split("\n")
     return [i.strip() for i in items if i and len(i.strip()) > 1]
 
+# --- PORTFOLIO DOCUMENT INDEX ---
+
+class DocumentIndex:
+    """One-pass index of a parsed page for the lookups ``parse_portfolio`` repeats.
+
+    The tree is walked once and every tag is bucketed by name, class token, id
+    and attribute name, in document order. Compound selectors (``tag``, ``.cls``,
+    ``#id``, ``[attr^='v']`` and combinations) are answered by filtering the
+    smallest matching bucket; anything else (combinators, pseudo-classes) runs
+    the selector's precompiled soupsieve pattern. ``scope(tag)`` restricts lookups to a subtree using
+    the pre-order position range of the tag.
+    """
+    FLEXIBLE_TAGS = ("div", "section", "ul", "li", "span", "p")
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.by_tag: Dict[str, List[Tag]] = defaultdict(list)
+        self.by_class: Dict[str, List[Tag]] = defaultdict(list)
+        self.by_id: Dict[str, List[Tag]] = defaultdict(list)
+        self.by_attr: Dict[str, List[Tag]] = defaultdict(list)
+        self.position: Dict[int, int] = {}
+        self.end: Dict[int, int] = {}
+        self._flexible: List[Tuple[Tag, str]] = []
+        self._keyword_hits: Dict[Tuple[str, ...], List[Tag]] = {}
+        self._positions: Dict[int, Tuple[List[Tag], List[int]]] = {}
+        self._build()
+
+    def _build(self):
+        open_tags = []
+        position = 0
+        for node in self.soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            position += 1
+            # Close every open ancestor that does not contain this node
+            while open_tags and open_tags[-1] is not node.parent:
+                self.end[id(open_tags.pop())] = position - 1
+            open_tags.append(node)
+            self.position[id(node)] = position
+            self.by_tag[node.name].append(node)
+            for attr in node.attrs:
+                self.by_attr[attr].append(node)
+            classes = node.get("class") or []
+            if isinstance(classes, str):
+                classes = classes.split()
+            for cls in classes:
+                self.by_class[cls].append(node)
+            if node.get("id"):
+                self.by_id[node["id"]].append(node)
+            if node.name in self.FLEXIBLE_TAGS:
+                self._flexible.append((node, (" ".join(classes) + " " + node.get("id", "")).lower()))
+        for node in open_tags:
+            self.end[id(node)] = position
+
+    # --- selectors ---
+    def _bucket(self, tag_name: Optional[str], parts: List[Tuple]) -> List[Tag]:
+        candidates = [self.by_tag.get(tag_name, [])] if tag_name else []
+        for kind, name, _, _ in parts:
+            if kind == "class":
+                candidates.append(self.by_class.get(name, []))
+            elif kind == "id":
+                candidates.append(self.by_id.get(name, []))
+            else:
+                candidates.append(self.by_attr.get(name, []))
+        return min(candidates, key=len)
+
+    def _within(self, nodes: List[Tag], root: Optional[Tag]) -> List[Tag]:
+        if root is None or root is self.soup:
+            return nodes
+        if not nodes:
+            return nodes
+        start, end = self.position[id(root)], self.end[id(root)]
+        # The entry holds the bucket itself, so its id cannot be reused by another list
+        cached = self._positions.get(id(nodes))
+        if cached is None or cached[0] is not nodes:
+            cached = self._positions[id(nodes)] = (nodes, [self.position[id(node)] for node in nodes])
+        positions = cached[1]
+        return nodes[bisect_right(positions, start):bisect_right(positions, end)]
+
+    def select(self, selector, root: Optional[Tag] = None) -> List[Tag]:
+        """Select with a selector string or a :class:`CompiledSelector`."""
+        if not isinstance(selector, CompiledSelector):
+            selector = compile_selector(selector)
+        if selector.plan is None:
+            return selector.select(root or self.soup)
+        tag_name, parts = selector.plan
+        nodes = self._within(self._bucket(tag_name, parts), root)
+        return [node for node in nodes
+                if (not tag_name or node.name == tag_name)
+                and all(match_selector_part(node, *part) for part in parts)]
+
+    def select_one(self, selector, root: Optional[Tag] = None) -> Optional[Tag]:
+        found = self.select(selector, root)
+        return found[0] if found else None
+
+    def find_all(self, name, root: Optional[Tag] = None, attrs: Optional[Dict] = None, **kwargs) -> List[Tag]:
+        """``find_all`` for a single tag name with exact (or ``True``) attribute filters."""
+        if not isinstance(name, str):
+            return (root or self.soup).find_all(name, attrs=attrs or {}, **kwargs)
+        nodes = self._within(self.by_tag.get(name, []), root)
+        for attr, expected in dict(attrs or {}, **kwargs).items():
+            nodes = [node for node in nodes
+                     if (node.get(attr) is not None if expected is True else node.get(attr) == expected)]
+        return nodes
+
+    def find(self, name, root: Optional[Tag] = None, attrs: Optional[Dict] = None, **kwargs) -> Optional[Tag]:
+        found = self.find_all(name, root, attrs, **kwargs)
+        return found[0] if found else None
+
+    def scope(self, root: Tag) -> "DocumentScope":
+        return DocumentScope(self, root)
+
+    def keyword_tags(self, keywords: List[str]) -> List[Tag]:
+        """Flexible-section tags whose class or id contains any keyword, memoized per keyword list."""
+        key = tuple(keywords)
+        if key not in self._keyword_hits:
+            matcher = keyword_matcher(key)
+            self._keyword_hits[key] = [tag for tag, haystack in self._flexible if matcher.search(haystack)]
+        return self._keyword_hits[key]
+
+class DocumentScope:
+    """Subtree view of a :class:`DocumentIndex` with the same lookup methods."""
+    def __init__(self, index: DocumentIndex, root: Tag):
+        self.index = index
+        self.root = root
+
+    def select(self, selector) -> List[Tag]:
+        return self.index.select(selector, self.root)
+
+    def select_one(self, selector) -> Optional[Tag]:
+        return self.index.select_one(selector, self.root)
+
+    def find_all(self, name, attrs: Optional[Dict] = None, **kwargs) -> List[Tag]:
+        return self.index.find_all(name, self.root, attrs, **kwargs)
+
+    def find(self, name, attrs: Optional[Dict] = None, **kwargs) -> Optional[Tag]:
+        return self.index.find(name, self.root, attrs, **kwargs)
+
+# --- PORTFOLIO STRUCTURED DATA ---
+_EMAIL_PATTERN = re.compile(r"^(?:mailto:)?([\w.+-]+@[\w-]+\.[\w.-]+)$")
+_STRUCTURED_CONTACT_DOMAINS = {"linkedin": "linkedin.com", "github": "github.com", "twitter": "twitter.com"}
+
+def _structured_key(data: Dict, field: str):
+    for key in get_config(SELECTORS_CONFIG, "portfolio_structured_keys", field):
+        if data.get(key):
+            return data[key]
+    return None
+
+def _structured_text(value) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("title") or value.get("label")
+    return clean_text(value) if isinstance(value, str) else None
+
+def _structured_skills(value) -> List[str]:
+    """Skills as strings from a list of strings, ``{name: ...}`` items or ``{category, items}`` groups."""
+    skills = []
+    for item in value if isinstance(value, list) else [value]:
+        if isinstance(item, dict) and isinstance(item.get("items") or item.get("skills"), list):
+            skills.extend(_structured_skills(item.get("items") or item.get("skills")))
+        elif isinstance(item, str) and "," in item:
+            skills.extend(filter(None, (clean_text(part) for part in item.split(","))))
+        elif _structured_text(item):
+            skills.append(_structured_text(item))
+    return skills
+
+def _structured_projects(value, base_url: str) -> List[Dict]:
+    projects = []
+    for item in value if isinstance(value, list) else []:
+        if isinstance(item, str):
+            projects.append({"title": clean_text(item), "description": None, "link": None})
+            continue
+        if not isinstance(item, dict):
+            continue
+        title = _structured_text(item.get("title") or item.get("name"))
+        description = _structured_text(item.get("description") or item.get("summary") or item.get("desc"))
+        link = next((item[key] for key in ("link", "url", "href", "codeRepository", "github", "repo", "demo", "live", "homepage")
+                     if isinstance(item.get(key), str) and item[key]), None)
+        if title or description or link:
+            projects.append({"title": title, "description": description, "link": urljoin(base_url, link) if link else None})
+    return projects
+
+def _structured_education(value) -> List[str]:
+    education = []
+    for item in value if isinstance(value, list) else [value]:
+        if isinstance(item, dict):
+            parts = [item.get(key) for key in ("degree", "field", "institution", "school", "university", "name", "title")]
+            text = clean_text(", ".join(dict.fromkeys(part for part in parts if isinstance(part, str) and part)))
+        else:
+            text = _structured_text(item)
+        if text:
+            education.append(text)
+    return education
+
+def _structured_contact(values, contact: Dict):
+    """Fill email/linkedin/github/twitter from any string values that look like those links."""
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        email = _EMAIL_PATTERN.match(value.strip())
+        if email:
+            contact.setdefault("email", email.group(1))
+            continue
+        for key, domain in _STRUCTURED_CONTACT_DOMAINS.items():
+            if value.startswith("http") and domain in value:
+                contact.setdefault(key, value)
+
+def _iter_structured_strings(data, depth: int = 0):
+    if depth > get_config(SELECTORS_CONFIG, "portfolio_structured_max_depth"):
+        return
+    if isinstance(data, str):
+        yield data
+    elif isinstance(data, dict):
+        for value in data.values():
+            yield from _iter_structured_strings(value, depth + 1)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _iter_structured_strings(value, depth + 1)
+
+def _json_ld_nodes(index: DocumentIndex) -> List[Dict]:
+    nodes = []
+    for script in index.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        pending = data if isinstance(data, list) else [data]
+        while pending:
+            node = pending.pop(0)
+            if isinstance(node, dict):
+                nodes.append(node)
+                pending.extend(node.get("@graph") or [])
+    return nodes
+
+def _next_data_props(index: DocumentIndex) -> Optional[Dict]:
+    script = index.find("script", id="__NEXT_DATA__")
+    if not script:
+        return None
+    try:
+        data = json.loads(script.string or "")
+    except ValueError:
+        return None
+    return (data.get("props") or {}).get("pageProps") if isinstance(data, dict) else None
+
+def _from_json_ld(index: DocumentIndex, base_url: str) -> Dict:
+    result: Dict[str, Any] = {}
+    project_types = set(get_config(SELECTORS_CONFIG, "portfolio_structured_project_types"))
+    projects = []
+    for node in _json_ld_nodes(index):
+        types = node.get("@type") or []
+        types = set(types if isinstance(types, list) else [types])
+        if "Person" in types:
+            result.setdefault("name", _structured_text(node.get("name")))
+            result.setdefault("about", _structured_text(node.get("description")))
+            if node.get("knowsAbout"):
+                result.setdefault("skills", _structured_skills(node["knowsAbout"]))
+            if node.get("alumniOf"):
+                result.setdefault("education", _structured_education(node["alumniOf"]))
+            same_as = node.get("sameAs") or []
+            _structured_contact([node.get("email")] + (same_as if isinstance(same_as, list) else [same_as]),
+                                result.setdefault("contact", {}))
+        elif types & project_types:
+            projects.extend(_structured_projects([node], base_url))
+    if projects:
+        result["projects"] = projects
+    return result
+
+def _is_profile_like(data: Dict, key: Optional[str]) -> bool:
+    """A dict stored under a profile container key, or one carrying person-only fields."""
+    if key in get_config(SELECTORS_CONFIG, "portfolio_structured_profile_containers"):
+        return True
+    return any(data.get(marker) for marker in get_config(SELECTORS_CONFIG, "portfolio_structured_profile_markers"))
+
+def _from_next_data(index: DocumentIndex, base_url: str) -> Dict:
+    """Pick profile fields out of ``__NEXT_DATA__`` page props, breadth first.
+
+    Name and about are only taken from profile-like dicts outside lists; project,
+    post and SEO objects carry names and descriptions of their own.
+    """
+    props = _next_data_props(index)
+    if not isinstance(props, dict):
+        return {}
+    result: Dict[str, Any] = {}
+    max_depth = get_config(SELECTORS_CONFIG, "portfolio_structured_max_depth")
+    pending = [(props, 0, False, None)]
+    while pending:
+        data, depth, in_list, key = pending.pop(0)
+        if depth > max_depth:
+            continue
+        if isinstance(data, list):
+            pending.extend((item, depth + 1, True, key) for item in data)
+            continue
+        if not isinstance(data, dict):
+            continue
+        if not in_list and _is_profile_like(data, key):
+            for field in ("name", "about"):
+                if field not in result and _structured_text(_structured_key(data, field)):
+                    result[field] = _structured_text(_structured_key(data, field))
+        extractors = {
+            "skills": _structured_skills,
+            "projects": lambda value: _structured_projects(value, base_url),
+            "education": _structured_education
+        }
+        for field, extract in extractors.items():
+            value = _structured_key(data, field)
+            if field not in result and isinstance(value, list):
+                extracted = extract(value)
+                if extracted:
+                    result[field] = extracted
+        pending.extend((value, depth + 1, in_list, child_key) for child_key, value in data.items()
+                       if isinstance(value, (dict, list)))
+    contact: Dict[str, str] = {}
+    _structured_contact(_iter_structured_strings(props), contact)
+    if contact:
+        result["contact"] = contact
+    return result
+
+def extract_structured_portfolio(index: DocumentIndex, base_url: str) -> Dict:
+    """Portfolio fields from embedded structured data: JSON-LD, then ``__NEXT_DATA__``.
+
+    Only fields actually found are returned; contact links from every source
+    are merged with earlier sources winning. OpenGraph tags describe the site
+    rather than the person, so parse_portfolio only falls back to them for
+    fields the DOM pass left empty.
+    """
+    result: Dict[str, Any] = {}
+    contact: Dict[str, str] = {}
+    for source in (_from_json_ld(index, base_url), _from_next_data(index, base_url)):
+        for field, value in source.items():
+            if field == "contact":
+                for key, link in value.items():
+                    contact.setdefault(key, link)
+            elif value and not result.get(field):
+                result[field] = value
+    if contact:
+        result["contact"] = contact
+    return result
+
 def parse_portfolio(html_content: str, url: str) -> dict:
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content)
+    index = DocumentIndex(soup)
+    program = get_selector_program()
+    # Embedded JSON-LD / __NEXT_DATA__ first; DOM heuristics, then OpenGraph, only fill what it lacks
+    structured = extract_structured_portfolio(index, url)
 
     # --- Name ---
-    name_selectors = get_config(SELECTORS_CONFIG, "portfolio_name_selectors")
-    name = extract_single_text(soup, name_selectors)
+    name = structured.get("name")
+    if not name:
+        name_selectors = program.portfolio["name"]
+        name = extract_single_text(index, name_selectors)
     if not name:
-        og_name = soup.find('meta', property='og:site_name') or soup.find('meta', property='og:title')
+        og_name = index.find('meta', property='og:site_name') or index.find('meta', property='og:title')
         if og_name and og_name.get('content'):
             name = og_name['content'].strip()
         else:
-            twitter_name = soup.find('meta', attrs={'name': 'twitter:title'})
+            twitter_name = index.find('meta', attrs={'name': 'twitter:title'})
             if twitter_name and twitter_name.get('content'):
                 name = twitter_name['content'].strip()
 
     # --- About/Description ---
-    about_selectors = get_config(SELECTORS_CONFIG, "portfolio_about_selectors")
-    about_max_length = get_config(SELECTORS_CONFIG, "portfolio_about_max_length")
-    about_fallback_tags = get_config(SELECTORS_CONFIG, "portfolio_about_fallback_tags")
-    about_keywords = get_config(SELECTORS_CONFIG, "portfolio_about_keywords")
-    about = extract_text_from_tags(
-        soup,
-        selectors=about_selectors,
-        max_length=about_max_length,
-        fallback_tags=about_fallback_tags,
-        keywords=about_keywords
-    )
+    about = structured.get("about")
+    if not about:
+        about_selectors = program.portfolio["about"]
+        about_max_length = get_config(SELECTORS_CONFIG, "portfolio_about_max_length")
+        about_fallback_tags = get_config(SELECTORS_CONFIG, "portfolio_about_fallback_tags")
+        about_keywords = get_config(SELECTORS_CONFIG, "portfolio_about_keywords")
+        about = extract_text_from_tags(
+            index,
+            selectors=about_selectors,
+            max_length=about_max_length,
+            fallback_tags=about_fallback_tags,
+            keywords=about_keywords
+        )
     if not about:
-        og_desc = soup.find('meta', property='og:description')
+        og_desc = index.find('meta', property='og:description')
         if og_desc and og_desc.get('content'):
             about = og_desc['content'].strip()
         else:
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            meta_desc = index.find('meta', attrs={'name': 'description'})
             if meta_desc and meta_desc.get('content'):
                 about = meta_desc['content'].strip()
 
     # --- Skills ---
-    skills = []
-    # 1. Try explicit selectors
-    skills_selectors = get_config(SELECTORS_CONFIG, "portfolio_skills_selectors")
-    skills = extract_list_from_tags(soup, skills_selectors)
-    # 2. Try flexible tag search for skills
-    if not skills:
-        skill_tags = _find_flexible_tags(soup, get_config(SELECTORS_CONFIG, "portfolio_skill_flexible_keywords"))
-        for tag in skill_tags:
-            skills += _split_and_clean(tag.get_text(" ", strip=True))
-    # 3. Try about section
-    if not skills and about:
-        skills += _split_and_clean(about)
-    # 4. Try project descriptions
+    # 0. Structured data lists skills explicitly, so they skip the keyword filter
+    skills = structured.get("skills", [])
     if not skills:
-        project_tags = _find_flexible_tags(soup, get_config(SELECTORS_CONFIG, "portfolio_project_flexible_keywords"))
-        for tag in project_tags:
-            skills += _split_and_clean(tag.get_text(" ", strip=True))
-    # 5. Filter by known skill keywords
-    skill_keywords = set([kw.lower() for kw in get_config(SELECTORS_CONFIG, "skill_keywords")])
-    skills = [s for s in set(skills) if any(kw in s.lower() for kw in skill_keywords)]
+        # 1. Try explicit selectors
+        skills_selectors = program.portfolio["skills"]
+        skills = extract_list_from_tags(index, skills_selectors)
+        # 2. Try flexible tag search for skills
+        if not skills:
+            skill_tags = index.keyword_tags(get_config(SELECTORS_CONFIG, "portfolio_skill_flexible_keywords"))
+            for tag in skill_tags:
+                skills += _split_and_clean(tag.get_text(" ", strip=True))
+        # 3. Try about section
+        if not skills and about:
+            skills += _split_and_clean(about)
+        # 4. Try project descriptions
+        if not skills:
+            project_tags = index.keyword_tags(get_config(SELECTORS_CONFIG, "portfolio_project_flexible_keywords"))
+            for tag in project_tags:
+                skills += _split_and_clean(tag.get_text(" ", strip=True))
+        # 5. Filter by known skill keywords
+        skill_matcher = keyword_matcher(get_config(SELECTORS_CONFIG, "skill_keywords"))
+        skills = [s for s in set(skills) if skill_matcher.search(s)]
 
     # For skills
     skill_min_length = get_config(SELECTORS_CONFIG, "portfolio_skill_min_length", default=2)
@@ -1256,98 +894,104 @@ def parse_portfolio(html_content: str, url: str) -> dict:
     ]
 
     # --- Projects ---
-    projects = []
-    # 1. Try explicit selectors
-    project_selectors = get_config(SELECTORS_CONFIG, "portfolio_project_selectors")
-    project_title_selectors = get_config(SELECTORS_CONFIG, "portfolio_project_title_selectors")
-    project_desc_selectors = get_config(SELECTORS_CONFIG, "portfolio_project_desc_selectors")
-    project_link_selectors = get_config(SELECTORS_CONFIG, "portfolio_project_link_selectors")
-    for selector in project_selectors:
-        for div in soup.select(selector):
-            title = extract_single_text(div, project_title_selectors)
-            desc = extract_single_text(div, project_desc_selectors)
-            link = extract_link_from_tags(div, project_link_selectors, url)
-            if title or desc or link:
-                projects.append({
-                    "title": title,
-                    "description": desc,
-                    "link": link
-                })
-    # 2. Try flexible tag search for projects
-    if not projects:
-        project_tags = _find_flexible_tags(soup, get_config(SELECTORS_CONFIG, "portfolio_project_flexible_keywords"))
-        for tag in project_tags:
-            for a in tag.find_all('a', href=True):
-                title = a.text.strip() or a.get('title')
-                desc = tag.get_text(" ", strip=True)
-                projects.append({
-                    "title": title,
-                    "description": desc,
-                    "link": a['href']
-                })
-    # 3. Fallback: look for links to known project domains
+    projects = structured.get("projects", [])
     if not projects:
-        fallback_project_domains = get_config(SELECTORS_CONFIG, "portfolio_project_fallback_domains")
-        for a in soup.find_all('a', href=True):
-            if any(domain in a['href'] for domain in fallback_project_domains):
-                title = a.text.strip() or a.get('title')
-                desc = None
-                parent = a.find_parent(['div', 'li'])
-                if parent:
-                    desc = parent.get_text(" ", strip=True)
-                projects.append({
-                    "title": title,
-                    "description": desc,
-                    "link": a['href']
-                })
-    # Deduplicate projects by link
-    seen_links = set()
-    deduped_projects = []
-    for proj in projects:
-        link = proj.get("link")
-        if link and link not in seen_links:
-            deduped_projects.append(proj)
-            seen_links.add(link)
-    projects = deduped_projects
+        # 1. Try explicit selectors
+        project_selectors = program.portfolio["project"]
+        project_title_selectors = program.portfolio["project_title"]
+        project_desc_selectors = program.portfolio["project_desc"]
+        project_link_selectors = program.portfolio["project_link"]
+        for selector in project_selectors:
+            for div in index.select(selector):
+                project = index.scope(div)
+                title = extract_single_text(project, project_title_selectors)
+                desc = extract_single_text(project, project_desc_selectors)
+                link = extract_link_from_tags(project, project_link_selectors, url)
+                if title or desc or link:
+                    projects.append({
+                        "title": title,
+                        "description": desc,
+                        "link": link
+                    })
+        # 2. Try flexible tag search for projects
+        if not projects:
+            project_tags = index.keyword_tags(get_config(SELECTORS_CONFIG, "portfolio_project_flexible_keywords"))
+            for tag in project_tags:
+                for a in index.find_all('a', tag, href=True):
+                    title = a.text.strip() or a.get('title')
+                    desc = tag.get_text(" ", strip=True)
+                    projects.append({
+                        "title": title,
+                        "description": desc,
+                        "link": a['href']
+                    })
+        # 3. Fallback: look for links to known project domains
+        if not projects:
+            fallback_project_domains = get_config(SELECTORS_CONFIG, "portfolio_project_fallback_domains")
+            for a in index.find_all('a', href=True):
+                if any(domain in a['href'] for domain in fallback_project_domains):
+                    title = a.text.strip() or a.get('title')
+                    desc = None
+                    parent = a.find_parent(['div', 'li'])
+                    if parent:
+                        desc = parent.get_text(" ", strip=True)
+                    projects.append({
+                        "title": title,
+                        "description": desc,
+                        "link": a['href']
+                    })
+        # Deduplicate projects by link
+        seen_links = set()
+        deduped_projects = []
+        for proj in projects:
+            link = proj.get("link")
+            if link and link not in seen_links:
+                deduped_projects.append(proj)
+                seen_links.add(link)
+        projects = deduped_projects
 
     # --- Education ---
-    education = []
-    education_selectors = get_config(SELECTORS_CONFIG, "portfolio_education_selectors")
-    education = extract_list_from_tags(soup, education_selectors)
-
+    education = structured.get("education", [])
     if not education:
-        edu_flex_keywords = get_config(SELECTORS_CONFIG, "portfolio_education_flexible_keywords")
-        edu_tags = _find_flexible_tags(soup, edu_flex_keywords)
-        for tag in edu_tags:
-            education += _split_and_clean(tag.get_text(" ", strip=True))
-
-    if not education and about:
-        edu_keywords = get_config(SELECTORS_CONFIG, "portfolio_education_keywords")
-        education += [line for line in _split_and_clean(about) if any(kw in line.lower() for kw in edu_keywords)]
-
-    # Filter out unwanted items using config
-    edu_exclude = [kw.lower() for kw in get_config(SELECTORS_CONFIG, "portfolio_education_exclude_keywords", default=[])]
-    edu_min_length = get_config(SELECTORS_CONFIG, "portfolio_education_min_length", default=6)
-    edu_max_length = get_config(SELECTORS_CONFIG, "portfolio_education_max_length", default=100)
-    education = [
-        e for e in dict.fromkeys([e for e in education if edu_min_length <= len(e) <= edu_max_length])
-        if not any(ex_kw in e.lower() for ex_kw in edu_exclude)
-    ]
+        education_selectors = program.portfolio["education"]
+        education = extract_list_from_tags(index, education_selectors)
+
+        if not education:
+            edu_flex_keywords = get_config(SELECTORS_CONFIG, "portfolio_education_flexible_keywords")
+            edu_tags = index.keyword_tags(edu_flex_keywords)
+            for tag in edu_tags:
+                education += _split_and_clean(tag.get_text(" ", strip=True))
+
+        if not education and about:
+            edu_keywords = get_config(SELECTORS_CONFIG, "portfolio_education_keywords")
+            edu_matcher = keyword_matcher(edu_keywords)
+            education += [line for line in _split_and_clean(about) if edu_matcher.search(line)]
+
+        # Filter out unwanted items using config
+        edu_exclude = keyword_matcher(get_config(SELECTORS_CONFIG, "portfolio_education_exclude_keywords", default=[]))
+        edu_min_length = get_config(SELECTORS_CONFIG, "portfolio_education_min_length", default=6)
+        edu_max_length = get_config(SELECTORS_CONFIG, "portfolio_education_max_length", default=100)
+        education = [
+            e for e in dict.fromkeys([e for e in education if edu_min_length <= len(e) <= edu_max_length])
+            if not edu_exclude.search(e)
+        ]
 
     # --- Contact ---
-    contact = {}
-    contact_selectors = get_config(SELECTORS_CONFIG, "portfolio_contact_selectors")
+    contact = dict(structured.get("contact", {}))
+    contact_selectors = program.portfolio["contact"]
     for key, sel in contact_selectors.items():
-        val = extract_link_from_tags(soup, sel, url)
+        if key in contact:
+            continue
+        val = extract_link_from_tags(index, sel, url)
         if val:
             contact[key] = val
 
     # --- Experience ---
     experience = []
-    experience_keywords = get_config(SELECTORS_CONFIG, "experience_keywords")
+    experience_matcher = keyword_matcher(get_config(SELECTORS_CONFIG, "experience_keywords"))
     # From about/education
     for line in [about] + education:
-        if line and any(word in line.lower() for word in experience_keywords):
+        if line and experience_matcher.search(line):
             experience.append(line.strip())
     # From projects
     for proj in projects:
@@ -1367,32 +1011,26 @@ def parse_portfolio(html_content: str, url: str) -> dict:
         "contact": contact
     }
 
-def fetch_portfolio_with_selenium(url: str) -> dict:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
-    import time
-    import os
+def fetch_portfolio_with_selenium(url: str, deadline: Optional[Deadline] = None) -> dict:
     debug_file = 'selenium_portfolio_debug.html'
     driver = None
     try:
-        chrome_options = Options()
+        browser = load_browser()
+        chrome_options = browser.Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--no-sandbox')
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        deadline = deadline or NO_DEADLINE
+        service = browser.Service(browser.ChromeDriverManager().install())
+        driver = browser.webdriver.Chrome(service=service, options=chrome_options)
+        driver.set_page_load_timeout(deadline.clamp(30))
         driver.get(url)
         # Wait for the page to load (adjust as needed)
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-        time.sleep(8)  # Give JS more time to render
+        browser.WebDriverWait(driver, deadline.clamp(15)).until(browser.EC.presence_of_element_located((browser.By.TAG_NAME, 'body')))
+        deadline.sleep(8)  # Give JS more time to render
         html = driver.page_source
         # Save for debugging
         with open(debug_file, 'w', encoding='utf-8') as f:
@@ -1416,30 +1054,561 @@ def fetch_portfolio_with_selenium(url: str) -> dict:
             except:
                 pass
 
-def fetch_portfolio(url: str) -> dict:
-    # Try Selenium first for JS-rendered content
+def _missing_portfolio_fields(result: Dict) -> List[str]:
+    return [field for field in get_config(SELECTORS_CONFIG, "portfolio_required_fields") if not result.get(field)]
+
+def merge_portfolio_results(base: Dict, extra: Dict) -> Dict:
+    """Fill ``base`` from ``extra``: empty scalars are taken, lists are unioned, contact keys added."""
+    merged = dict(base)
+    for field, value in extra.items():
+        if not value or field in ("error", "debug_html"):
+            continue
+        current = merged.get(field)
+        if field == "projects":
+            seen = {(project.get("link") or project.get("title")) for project in current or []}
+            merged[field] = list(current or []) + [project for project in value
+                                                   if (project.get("link") or project.get("title")) not in seen]
+        elif isinstance(value, list):
+            merged[field] = list(dict.fromkeys(list(current or []) + value))
+        elif isinstance(value, dict):
+            merged[field] = dict(value, **(current or {}))
+        elif not current:
+            merged[field] = value
+    return merged
+
+def discover_portfolio_links(html_content: str, url: str, limit: int) -> List[str]:
+    """Same-site links whose path or anchor text mentions a skills/projects/education keyword."""
+    index = DocumentIndex(make_soup(html_content))
+    matcher = keyword_matcher(
+        get_config(SELECTORS_CONFIG, "portfolio_skill_flexible_keywords")
+        + get_config(SELECTORS_CONFIG, "portfolio_project_flexible_keywords")
+        + get_config(SELECTORS_CONFIG, "portfolio_education_flexible_keywords")
+    )
+    site = urlparse(url).netloc.lower()
+    landing = url.split("#")[0].rstrip("/")
+    links = []
+    for a in index.find_all("a", href=True):
+        link = urljoin(url, a["href"]).split("#")[0]
+        parsed = urlparse(link)
+        if parsed.scheme not in ("http", "https") or parsed.netloc.lower() != site or link.rstrip("/") == landing:
+            continue
+        if matcher.search(parsed.path) or matcher.search(a.get_text(" ", strip=True)):
+            links.append(link)
+    return list(dict.fromkeys(links))[:limit]
+
+def crawl_portfolio(url: str, html_content: str, result: Dict, breaker: CircuitBreaker,
+                    request_deadline: Optional[Deadline] = None) -> Dict:
+    """Fetch keyword-relevant subpages of a portfolio concurrently and merge their parses into ``result``.
+
+    Bounded by ``portfolio_crawl`` ``max_pages`` and ``time_budget_seconds`` (cut
+    to what is left of ``request_deadline``): pages still in flight when the
+    budget runs out are abandoned.
+    """
+    settings = get_config(FETCH_CONFIG, "portfolio_crawl")
+    links = discover_portfolio_links(html_content, url, settings["max_pages"])
+    if not links:
+        return result
+    deadline = time.monotonic() + min(settings["time_budget_seconds"], (request_deadline or NO_DEADLINE).remaining())
+
+    def fetch_page(link: str) -> Optional[Dict]:
+        timeout = min(settings["page_timeout"], max(0.1, deadline - time.monotonic()))
+        response = get_hedged_fetcher().get(link, timeout=timeout)
+        record_upstream_status(breaker, response.status_code)
+        if response.status_code != 200:
+            return None
+        return parse_portfolio(response.text, link)
+
+    executor = ThreadPoolExecutor(max_workers=settings["workers"], thread_name_prefix="portfolio-crawl")
+    try:
+        futures = {executor.submit(fetch_page, link): link for link in links}
+        done, pending = wait_futures(futures, timeout=max(0.0, deadline - time.monotonic()))
+        if pending:
+            logger.info(f"Portfolio crawl of {url}: {len(pending)} page(s) dropped at the time budget")
+        # Merge in discovery order so earlier (usually navigation) links win ties
+        for future, link in futures.items():
+            if future not in done:
+                continue
+            try:
+                page_result = future.result()
+            except Exception as e:
+                logger.warning(f"Portfolio crawl failed for {link}: {e}")
+                continue
+            if page_result:
+                result = merge_portfolio_results(result, page_result)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return result
+
+def fetch_portfolio(url: str, crawl: Optional[bool] = None, deadline: Optional[Deadline] = None) -> dict:
+    """Extract a portfolio, optionally crawling same-site subpages (``crawl`` defaults to config / ``PORTFOLIO_CRAWL``).
+
+    With a ``deadline``, Chrome is skipped when less than ``min_browser_seconds``
+    remain; the static result is then returned marked ``timed_out``.
+    """
+    deadline = deadline or NO_DEADLINE
+    if crawl is None:
+        crawl = os.getenv("PORTFOLIO_CRAWL", "").lower() in ("1", "true", "yes") or get_config(FETCH_CONFIG, "portfolio_crawl", "enabled")
+    breaker = certificate_core.circuit_breakers.for_url("portfolio", url)
+    if not breaker.allow_request():
+        return {"error": circuit_open_message(breaker)}
+    try:
+        return _fetch_portfolio_guarded(url, crawl, deadline, breaker)
+    finally:
+        breaker.release_probe()
+
+def _fetch_portfolio_guarded(url: str, crawl: bool, deadline: Deadline, breaker: CircuitBreaker) -> dict:
+    # Static HTML first: embedded structured data plus DOM heuristics often cover every field without Chrome
+    static_result = None
+    static_error = None
     try:
-        result = fetch_portfolio_with_selenium(url)
+        response = get_hedged_fetcher().get(url, timeout=deadline.clamp(10))
+        record_upstream_status(breaker, response.status_code)
+        response.raise_for_status()
+        static_result = parse_portfolio(response.text, url)
+        if crawl:
+            static_result = crawl_portfolio(url, response.text, static_result, breaker, deadline)
+        if not _missing_portfolio_fields(static_result):
+            return static_result
+    except requests.RequestException as e:
+        if e.response is None:
+            breaker.record_failure()
+        static_error = str(e)
+    except Exception as e:
+        static_error = str(e)
+    # Render JS with Selenium only when required fields are still missing and there is time for it
+    if deadline.remaining() < get_config(FETCH_CONFIG, "deadline", "min_browser_seconds"):
+        if static_result:
+            return dict(static_result, timed_out=True)
+        return timed_out_result(f"Portfolio extraction ran out of request time ({static_error or 'no static result'})")
+    try:
+        result = fetch_portfolio_with_selenium(url, deadline)
         # If Selenium worked and didn't just return an error, use it
         if result and not result.get('error'):
-            return result
+            breaker.record_success()
+            return merge_portfolio_results(result, static_result or {})
     except Exception:
         pass
-    # Fallback to requests + BeautifulSoup
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        portfolio_info = parse_portfolio(response.text, url)
-        return portfolio_info
-    except Exception as e:
-        return {"error": str(e)}
+    return static_result or {"error": static_error or "Portfolio extraction failed"}
 
 # --- GITHUB EXTRACTOR LOGIC (from github_extractor.py, functions only) ---
 
 class GitHubAPIError(Exception):
     pass
 
-async def fetch_github_profile(username: str) -> dict:
+class GitHubTokenPool:
+    """Routes GitHub API calls across one or more tokens by remaining rate-limit budget.
+
+    Budgets are tracked per token and per rate-limit resource (``core``, ``graphql``)
+    from the ``X-RateLimit-*`` headers of every response. Each request takes the
+    token with the most remaining calls; when all are exhausted the caller waits
+    for the earliest reset instead of failing, up to ``max_queue_wait`` seconds.
+
+    The pool has no lock: it assumes every caller runs on the one event loop, where
+    the check-and-decrement in :meth:`acquire` cannot interleave. Do not share it
+    across threads or loops.
+    """
+    DEFAULT_LIMITS = {"authenticated": 5000, "unauthenticated": 60}
+    # Assumed reset window when a response reports its budget but not when it resets
+    DEFAULT_RESET_SECONDS = 60.0
+
+    def __init__(self, tokens: List[str], max_queue_wait: float = 900.0):
+        self.tokens: List[Optional[str]] = list(tokens) or [None]
+        self.max_queue_wait = max_queue_wait
+        self._budgets: Dict[Tuple[Optional[str], str], Dict[str, float]] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_env(cls) -> "GitHubTokenPool":
+        raw = os.getenv("GITHUB_API_TOKENS") or os.getenv("GITHUB_API_TOKEN") or ""
+        tokens = [token.strip() for token in raw.split(",") if token.strip()]
+        return cls(tokens, get_config(FETCH_CONFIG, "github", "token_queue_max_wait"))
+
+    @property
+    def authenticated(self) -> bool:
+        return self.tokens != [None]
+
+    def remaining(self, resource: str = "core") -> int:
+        """Calls left across all tokens before the pool has to queue for a reset."""
+        return int(sum(max(0, self._budget(token, resource)["remaining"]) for token in self.tokens))
+
+    def _budget(self, token: Optional[str], resource: str) -> Dict[str, float]:
+        budget = self._budgets.get((token, resource))
+        if budget is None:
+            limit = self.DEFAULT_LIMITS["authenticated" if token else "unauthenticated"]
+            budget = self._budgets[(token, resource)] = {"limit": limit, "remaining": limit, "reset": 0.0}
+        elif budget["remaining"] <= 0 and 0 < budget["reset"] <= time.time():
+            budget["remaining"] = budget["limit"]
+        return budget
+
+    async def acquire(self, resource: str = "core") -> Optional[str]:
+        waited = 0.0
+        while True:
+            token = max(self.tokens, key=lambda t: self._budget(t, resource)["remaining"])
+            budget = self._budget(token, resource)
+            if budget["remaining"] > 0:
+                budget["remaining"] -= 1
+                return token
+            next_reset = min(self._budget(t, resource)["reset"] for t in self.tokens)
+            delay = max(1.0, next_reset - time.time())
+            if waited + delay > self.max_queue_wait:
+                raise GitHubAPIError(f"All GitHub tokens are rate limited for another {delay:.0f}s")
+            self.logger.warning(f"All GitHub tokens exhausted for {resource}; queueing for {delay:.0f}s")
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def update(self, token: Optional[str], resource: str, headers) -> None:
+        resource = headers.get("X-RateLimit-Resource", resource)
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            limit = int(headers.get("X-RateLimit-Limit", remaining))
+            reset = float(headers.get("X-RateLimit-Reset") or time.time() + self.DEFAULT_RESET_SECONDS)
+        except (KeyError, ValueError):
+            return
+        self._budgets[(token, resource)] = {"limit": limit, "remaining": remaining, "reset": reset}
+
+    @staticmethod
+    def is_rate_limited(response: FetchResponse) -> bool:
+        return response.status in (403, 429) and str(response.headers.get("X-RateLimit-Remaining", "")) == "0"
+
+github_token_pool = None
+
+def get_github_token_pool() -> GitHubTokenPool:
+    global github_token_pool
+    if github_token_pool is None:
+        github_token_pool = GitHubTokenPool.from_env()
+    return github_token_pool
+
+async def _github_request(session: aiohttp.ClientSession, method: str, url: str, headers: Dict,
+                          policy: Optional[RetryPolicy] = None, **kwargs) -> FetchResponse:
+    """Call the GitHub API through the token pool, retrying transient failures.
+
+    A primary rate-limit response only exhausts the token that received it; the
+    request is re-issued on the next-best token, or queued until a reset.
+    """
+    policy = policy or RetryPolicy.from_config("github")
+    pool = get_github_token_pool()
+    resource = "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+    async def attempt():
+        while True:
+            token = await pool.acquire(resource)
+            request_headers = dict(headers)
+            if token:
+                request_headers["Authorization"] = f"Bearer {token}"
+            async with session.request(method, url, headers=request_headers, **kwargs) as resp:
+                response = FetchResponse(resp.status, resp.headers.copy(), await resp.text())
+            pool.update(token, resource, response.headers)
+            if not pool.is_rate_limited(response):
+                return response
+    return await policy.call_async(attempt)
+
+async def _github_get(session: aiohttp.ClientSession, url: str, headers: Dict, params: Optional[Dict] = None,
+                      policy: Optional[RetryPolicy] = None) -> FetchResponse:
+    return await _github_request(session, "GET", url, headers, policy=policy, params=params)
+
+def _format_github_repo(repo: Dict) -> Dict:
+    return {
+        "name": repo["name"],
+        "description": repo["description"],
+        "language": repo["language"],
+        "stars": repo["stargazers_count"],
+        "forks": repo["forks_count"],
+        "open_issues": repo["open_issues_count"],
+        "watchers": repo["watchers_count"],
+        "size": repo["size"],
+        "created_at": repo["created_at"],
+        "updated_at": repo["updated_at"],
+        "pushed_at": repo["pushed_at"],
+        "url": repo["html_url"],
+        "homepage": repo["homepage"],
+        "topics": repo.get("topics", []),
+        "license": repo["license"]["name"] if repo["license"] else None,
+        "default_branch": repo["default_branch"],
+        "is_fork": repo["fork"],
+        "archived": repo["archived"]
+    }
+
+async def _iter_github_repo_pages(session: aiohttp.ClientSession, repos_url: str, headers: Dict, policy: RetryPolicy,
+                                  public_repos: Optional[int]):
+    """Yield ``(page, repos)`` for every repository page as soon as it arrives.
+
+    The page count comes from the profile's ``public_repos``; pages are requested
+    in parallel (bounded by ``page_concurrency``) and yielded in completion order.
+    ``public_repos`` can lag behind reality, so if the last expected page comes back
+    full the remaining pages are walked one by one. A page that could not be
+    fetched is yielded as ``(page, None)`` so the caller knows the list has a gap.
+    """
+    per_page = get_config(FETCH_CONFIG, "github", "per_page")
+    semaphore = asyncio.Semaphore(get_config(FETCH_CONFIG, "github", "page_concurrency"))
+
+    async def fetch_page(page: int) -> Tuple[int, Optional[List[Dict]]]:
+        async with semaphore:
+            try:
+                resp = await _github_get(session, repos_url, headers, params={"page": page, "per_page": per_page}, policy=policy)
+            except Exception:
+                return page, None
+        if resp.status != 200:
+            return page, None
+        return page, resp.json() or []
+
+    page_count = max(1, -(-(public_repos or 0) // per_page))
+    last_page = None
+    for next_page in asyncio.as_completed([fetch_page(page) for page in range(1, page_count + 1)]):
+        page, page_repos = await next_page
+        if page == page_count:
+            last_page = page_repos
+        if page_repos is None:
+            yield page, None
+        elif page_repos:
+            yield page, [_format_github_repo(repo) for repo in page_repos]
+    page = page_count
+    while last_page is not None and len(last_page) == per_page:
+        page, last_page = await fetch_page(page + 1)
+        if last_page is None:
+            yield page, None
+        elif last_page:
+            yield page, [_format_github_repo(repo) for repo in last_page]
+
+_github_language_cache: "OrderedDict[str, Tuple[Optional[str], Dict[str, int]]]" = OrderedDict()
+
+async def _fetch_github_languages(session: aiohttp.ClientSession, owner: str, repos: List[Dict], headers: Dict,
+                                  policy: RetryPolicy):
+    """Attach a ``languages`` byte map to every repo from ``/repos/{owner}/{repo}/languages``.
+
+    Requests fan out under ``languages_concurrency``. Results are cached per repo
+    together with its ``pushed_at``, so a repo is only refetched after a new push.
+    Uncached repos are only fetched while the token pool has more than
+    ``languages_reserve_calls`` core calls left; the rest fall back to their
+    primary ``language`` so the fan-out never queues other GitHub calls behind a reset.
+    """
+    semaphore = asyncio.Semaphore(get_config(FETCH_CONFIG, "github", "languages_concurrency"))
+    cache_size = get_config(FETCH_CONFIG, "github", "languages_cache_size")
+    allowance = get_github_token_pool().remaining("core") - get_config(FETCH_CONFIG, "github", "languages_reserve_calls")
+
+    async def fetch_languages(repo: Dict):
+        nonlocal allowance
+        key = f"{owner}/{repo['name']}".lower()
+        cached = _github_language_cache.get(key)
+        if cached and cached[0] == repo["pushed_at"]:
+            _github_language_cache.move_to_end(key)
+            repo["languages"] = cached[1]
+            return
+        if allowance <= 0:
+            repo["languages"] = {repo["language"]: 0} if repo.get("language") else {}
+            return
+        allowance -= 1
+        async with semaphore:
+            try:
+                resp = await _github_get(session, f"https://api.github.com/repos/{owner}/{repo['name']}/languages", headers, policy=policy)
+            except Exception:
+                resp = None
+        if resp is None or resp.status != 200:
+            repo["languages"] = {repo["language"]: 0} if repo.get("language") else {}
+            return
+        repo["languages"] = resp.json() or {}
+        _github_language_cache[key] = (repo["pushed_at"], repo["languages"])
+        _github_language_cache.move_to_end(key)
+        while len(_github_language_cache) > cache_size:
+            _github_language_cache.popitem(last=False)
+
+    await asyncio.gather(*(fetch_languages(repo) for repo in repos if "languages" not in repo))
+
+def _github_language_distribution(repos: List[Dict]) -> Dict[str, Dict]:
+    """Byte-weighted language share across the user's own (non-fork) repositories."""
+    totals: Dict[str, int] = defaultdict(int)
+    for repo in repos:
+        if repo.get("is_fork"):
+            continue
+        for language, size in (repo.get("languages") or {}).items():
+            totals[language] += size
+    total_bytes = sum(totals.values())
+    if not total_bytes:
+        # No byte counts at all (e.g. the fan-out was skipped); consumers fall back to primary languages
+        return {}
+    return {
+        language: {"bytes": size, "percentage": round(100 * size / total_bytes, 1) if total_bytes else 0}
+        for language, size in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    }
+
+_github_event_watermarks: "OrderedDict[str, Dict]" = OrderedDict()
+
+def _compact_github_event(event: Dict) -> Dict:
+    """The fields of a public event that the contribution totals need."""
+    return {
+        "id": int(event["id"]),
+        "type": event["type"],
+        "repo": event["repo"]["name"],
+        "created_at": event.get("created_at") or "",
+        "commits": len(event["payload"].get("commits") or []) if event["type"] == "PushEvent" else 0
+    }
+
+def _github_events_window(events: List[Dict]) -> List[Dict]:
+    """Newest-first, de-duplicated events limited to what the events API itself would serve.
+
+    GitHub returns at most ``events_max_pages`` pages and only the last
+    ``events_max_age_days`` days, so totals built from cached events are kept to
+    the same window as a fresh walk.
+    """
+    window = get_config(FETCH_CONFIG, "github", "events_max_pages") * get_config(FETCH_CONFIG, "github", "per_page")
+    cutoff = (datetime.utcnow() - timedelta(days=get_config(FETCH_CONFIG, "github", "events_max_age_days"))).strftime("%Y-%m-%dT%H:%M:%SZ")
+    unique = {event["id"]: event for event in events}
+    newest_first = sorted(unique.values(), key=lambda event: event["id"], reverse=True)
+    return [event for event in newest_first if not event["created_at"] or event["created_at"] >= cutoff][:window]
+
+def _summarize_github_events(events: List[Dict]) -> Dict:
+    contributions = {"commits": 0, "pull_requests": 0, "issues": 0, "repositories_contributed_to": set()}
+    for event in events:
+        if event["type"] == "PushEvent":
+            contributions["commits"] += event["commits"]
+        elif event["type"] == "PullRequestEvent":
+            contributions["pull_requests"] += 1
+        elif event["type"] == "IssuesEvent":
+            contributions["issues"] += 1
+        else:
+            continue
+        contributions["repositories_contributed_to"].add(event["repo"])
+    contributions["repositories_contributed_to"] = sorted(contributions["repositories_contributed_to"])
+    return contributions
+
+async def _fetch_github_contributions(session: aiohttp.ClientSession, username: str, events_url: str, headers: Dict,
+                                      policy: RetryPolicy, incremental: bool = True) -> Dict:
+    """Aggregate commit/PR/issue counts over every available public event page.
+
+    On first sight of a user all pages (the API serves at most ``events_max_pages``)
+    are fetched concurrently. The events are kept in compact form together with the
+    newest event id as a watermark; later calls in incremental mode revalidate
+    page 1 with its ETag and walk pages only until they reach the watermark, then
+    recount over the merged events. The cache (and so the watermark) is only
+    updated after a walk that read every page it needed, so a failed page is
+    retried on the next call instead of being skipped for good.
+    """
+    per_page = get_config(FETCH_CONFIG, "github", "per_page")
+    max_pages = get_config(FETCH_CONFIG, "github", "events_max_pages")
+    # GitHub logins are case-insensitive, so "Octocat" and "octocat" share a watermark
+    watermark_key = username.lower()
+    cached = _github_event_watermarks.get(watermark_key) if incremental else None
+    known_events = cached["events"] if cached else []
+    watermark = cached["watermark"] if cached else 0
+    etag = cached["etag"] if cached else None
+    new_events: List[Dict] = []
+    complete = False
+
+    async def fetch_page(page: int, page_headers: Dict) -> Tuple[int, Optional[FetchResponse]]:
+        try:
+            return page, await _github_get(session, events_url, page_headers, params={"page": page, "per_page": per_page}, policy=policy)
+        except Exception:
+            return page, None
+
+    if cached:
+        # Running out of pages without meeting the watermark means every served event is new
+        complete = True
+        for page in range(1, max_pages + 1):
+            page_headers = dict(headers, **({"If-None-Match": etag} if page == 1 and etag else {}))
+            _, resp = await fetch_page(page, page_headers)
+            if resp is not None and resp.status == 304 and page == 1:
+                break
+            if resp is None or resp.status != 200:
+                complete = False
+                break
+            events = resp.json() or []
+            if page == 1:
+                etag = resp.headers.get("ETag")
+            reached_watermark = False
+            for event in events:
+                if int(event["id"]) <= watermark:
+                    reached_watermark = True
+                    break
+                new_events.append(_compact_github_event(event))
+            if reached_watermark or len(events) < per_page:
+                break
+    else:
+        complete = True
+        for next_page in asyncio.as_completed([fetch_page(page, headers) for page in range(1, max_pages + 1)]):
+            page, resp = await next_page
+            if resp is None or resp.status != 200:
+                complete = False
+                continue
+            if page == 1:
+                etag = resp.headers.get("ETag")
+            new_events.extend(_compact_github_event(event) for event in resp.json() or [])
+
+    events = _github_events_window(new_events + known_events)
+    if complete:
+        _github_event_watermarks[watermark_key] = {
+            "events": events,
+            "watermark": max([watermark] + [event["id"] for event in new_events]),
+            "etag": etag
+        }
+        _github_event_watermarks.move_to_end(watermark_key)
+        while len(_github_event_watermarks) > get_config(FETCH_CONFIG, "github", "events_cache_size"):
+            _github_event_watermarks.popitem(last=False)
+    return _summarize_github_events(events)
+
+def _format_github_profile(profile: Dict) -> Dict:
+    return {
+        "username": profile.get("login"),
+        "name": profile.get("name"),
+        "bio": profile.get("bio"),
+        "location": profile.get("location"),
+        "company": profile.get("company"),
+        "blog": profile.get("blog"),
+        "email": profile.get("email"),
+        "twitter_username": profile.get("twitter_username"),
+        "public_repos": profile.get("public_repos"),
+        "public_gists": profile.get("public_gists"),
+        "followers": profile.get("followers"),
+        "following": profile.get("following"),
+        "created_at": profile.get("created_at"),
+        "updated_at": profile.get("updated_at"),
+        "avatar_url": profile.get("avatar_url"),
+        "hireable": profile.get("hireable")
+    }
+
+class GitHubProfileAssembler:
+    """Rebuilds the full profile dict from the events of :func:`stream_github_profile`."""
+    def __init__(self):
+        self.profile: Dict = {}
+        self.pages: Dict[int, List[Dict]] = {}
+        self.summary: Dict = {}
+
+    def add(self, event_type: str, payload: Dict):
+        if event_type == "github_profile":
+            self.profile = payload
+        elif event_type == "github_repos_batch":
+            self.pages[payload["page"]] = payload["repositories"]
+        elif event_type == "github_summary":
+            self.summary = payload
+
+    def result(self) -> Dict:
+        if not self.profile or self.profile.get("error"):
+            return self.profile
+        result = dict(
+            self.profile,
+            repositories=[repo for page in sorted(self.pages) for repo in self.pages[page]],
+            language_distribution=self.summary.get("language_distribution", {}),
+            contributions=self.summary.get("contributions")
+        )
+        if self.summary.get("incomplete"):
+            result["incomplete"] = True
+        return result
+
+def _github_profile_events(profile: Dict):
+    """Replay an already assembled profile as stream events (cache hits, GraphQL results)."""
+    if profile.get("error"):
+        yield "github_profile", profile
+        return
+    per_page = get_config(FETCH_CONFIG, "github", "per_page")
+    repos = profile.get("repositories") or []
+    yield "github_profile", {key: value for key, value in profile.items()
+                             if key not in ("repositories", "language_distribution", "contributions", "incomplete")}
+    for index in range(0, len(repos), per_page):
+        yield "github_repos_batch", {"page": index // per_page + 1, "repositories": repos[index:index + per_page]}
+    summary = {"language_distribution": profile.get("language_distribution", {}),
+               "contributions": profile.get("contributions")}
+    if profile.get("incomplete"):
+        summary["incomplete"] = True
+    yield "github_summary", summary
+
+async def _stream_github_profile_rest(username: str):
     user_url = f"https://api.github.com/users/{username}"
     repos_url = f"https://api.github.com/users/{username}/repos"
     events_url = f"https://api.github.com/users/{username}/events/public"
@@ -1448,91 +1617,323 @@ async def fetch_github_profile(username: str) -> dict:
         "User-Agent": "Portfolio-Extractor"
     }
 
+    policy = RetryPolicy.from_config("github")
+    breaker = certificate_core.circuit_breakers.get("github", "api.github.com")
+    if not breaker.allow_request():
+        yield "github_profile", {"error": circuit_open_message(breaker)}
+        return
     async with aiohttp.ClientSession() as session:
         # --- Profile Info ---
-        async with session.get(user_url, headers=headers) as resp:
-            if resp.status != 200:
-                return {"error": f"GitHub API returned status {resp.status}"}
-            profile = await resp.json()
-
-        # --- Repositories ---
-        repos = []
-        page = 1
-        while True:
-            async with session.get(repos_url, headers=headers, params={"page": page, "per_page": 100}) as resp:
-                if resp.status != 200:
-                    break
-                page_repos = await resp.json()
-                if not page_repos:
-                    break
-                for repo in page_repos:
-                    repos.append({
-                        "name": repo["name"],
-                        "description": repo["description"],
-                        "language": repo["language"],
-                        "stars": repo["stargazers_count"],
-                        "forks": repo["forks_count"],
-                        "open_issues": repo["open_issues_count"],
-                        "watchers": repo["watchers_count"],
-                        "size": repo["size"],
-                        "created_at": repo["created_at"],
-                        "updated_at": repo["updated_at"],
-                        "pushed_at": repo["pushed_at"],
-                        "url": repo["html_url"],
-                        "homepage": repo["homepage"],
-                        "topics": repo.get("topics", []),
-                        "license": repo["license"]["name"] if repo["license"] else None,
-                        "default_branch": repo["default_branch"],
-                        "is_fork": repo["fork"],
-                        "archived": repo["archived"]
-                    })
-                if len(page_repos) < 100:
-                    break
-                page += 1
-
-        # --- Contributions (from events) ---
-        async with session.get(events_url, headers=headers, params={"per_page": 100}) as resp:
-            contributions = {
-                "commits": 0,
-                "pull_requests": 0,
-                "issues": 0,
-                "repositories_contributed_to": set()
-            }
-            if resp.status == 200:
-                events = await resp.json()
-                for event in events:
-                    if event["type"] == "PushEvent":
-                        contributions["commits"] += len(event["payload"]["commits"])
-                        contributions["repositories_contributed_to"].add(event["repo"]["name"])
-                    elif event["type"] == "PullRequestEvent":
-                        contributions["pull_requests"] += 1
-                        contributions["repositories_contributed_to"].add(event["repo"]["name"])
-                    elif event["type"] == "IssuesEvent":
-                        contributions["issues"] += 1
-                        contributions["repositories_contributed_to"].add(event["repo"]["name"])
-            contributions["repositories_contributed_to"] = list(contributions["repositories_contributed_to"])
-
-        # --- Assemble Output ---
-        return {
-            "username": profile.get("login"),
-            "name": profile.get("name"),
-            "bio": profile.get("bio"),
-            "location": profile.get("location"),
-            "company": profile.get("company"),
-            "blog": profile.get("blog"),
-            "email": profile.get("email"),
-            "twitter_username": profile.get("twitter_username"),
-            "public_repos": profile.get("public_repos"),
-            "public_gists": profile.get("public_gists"),
-            "followers": profile.get("followers"),
-            "following": profile.get("following"),
-            "created_at": profile.get("created_at"),
-            "updated_at": profile.get("updated_at"),
-            "avatar_url": profile.get("avatar_url"),
-            "hireable": profile.get("hireable"),
-            "repositories": repos,
-            "contributions": contributions
+        try:
+            resp = await _github_get(session, user_url, headers, policy=policy)
+            record_upstream_status(breaker, resp.status)
+        except Exception as e:
+            breaker.record_failure()
+            yield "github_profile", {"error": f"GitHub API request failed: {e}"}
+            return
+        finally:
+            breaker.release_probe()
+        if resp.status != 200:
+            yield "github_profile", {"error": f"GitHub API returned status {resp.status}"}
+            return
+        profile = resp.json()
+        yield "github_profile", _format_github_profile(profile)
+
+        # --- Contributions (from events), overlapped with the repository pages ---
+        contributions_task = asyncio.create_task(_fetch_github_contributions(
+            session, username, events_url, headers, policy,
+            incremental=get_config(FETCH_CONFIG, "github", "events_incremental")))
+        # Unauthenticated calls get 60/hour, which a single profile's fan-out would use up
+        fetch_languages = get_config(FETCH_CONFIG, "github", "fetch_languages") and get_github_token_pool().authenticated
+        languages_task: Optional[asyncio.Task] = None
+
+        async def fetch_languages_after(previous: Optional[asyncio.Task], page_repos: List[Dict]):
+            # One batch at a time, so the reserve and concurrency limits hold across batches
+            if previous is not None:
+                await previous
+            await _fetch_github_languages(session, profile.get("login") or username, page_repos, headers, policy)
+
+        try:
+            # --- Repositories ---
+            repos = []
+            incomplete = False
+            async for page, page_repos in _iter_github_repo_pages(session, repos_url, headers, policy, profile.get("public_repos")):
+                if page_repos is None:
+                    logger.warning(f"GitHub repository page {page} for {username} could not be fetched")
+                    incomplete = True
+                    continue
+                repos.extend(page_repos)
+                yield "github_repos_batch", {"page": page, "repositories": page_repos}
+                if fetch_languages:
+                    languages_task = asyncio.create_task(fetch_languages_after(languages_task, page_repos))
+            if languages_task is not None:
+                await languages_task
+            summary = {"language_distribution": _github_language_distribution(repos),
+                       "contributions": await contributions_task}
+            if incomplete:
+                summary["incomplete"] = True
+            yield "github_summary", summary
+        finally:
+            contributions_task.cancel()
+            if languages_task is not None:
+                languages_task.cancel()
+
+async def stream_github_profile(username: str, backend: Optional[str] = None, use_cache: bool = True):
+    """Yield a GitHub profile as ``(event_type, payload)`` pairs while it is fetched.
+
+    ``github_profile`` (the user fields) comes first, then one ``github_repos_batch``
+    per repository page as pages arrive, and finally ``github_summary`` with the
+    language distribution and contributions. Cached profiles and the GraphQL
+    backend replay the same events from a complete result.
+    """
+    backend = backend or os.getenv("GITHUB_FETCH_BACKEND") or get_config(FETCH_CONFIG, "github", "backend")
+    cache = get_profile_cache("github")
+    key = username.lower()
+    if use_cache:
+        cached, fresh = cache.get(key)
+        if cached is not None:
+            if not fresh:
+                cache.refresh_in_background(key, lambda: fetch_github_profile(username, backend, use_cache=False))
+            for event in _github_profile_events(cached):
+                yield event
+            return
+    if backend == "graphql" and get_github_token_pool().authenticated:
+        profile = await fetch_github_profile(username, backend, use_cache=False)
+        if use_cache:
+            cache.set(key, profile)
+        for event in _github_profile_events(profile):
+            yield event
+        return
+    assembler = GitHubProfileAssembler()
+    async for event_type, payload in _stream_github_profile_rest(username):
+        assembler.add(event_type, payload)
+        yield event_type, payload
+    if use_cache:
+        cache.set(key, assembler.result())
+
+async def fetch_github_profile(username: str, backend: Optional[str] = None, use_cache: bool = True) -> dict:
+    if use_cache:
+        return await get_profile_cache("github").get_or_fetch_async(
+            username.lower(), lambda: fetch_github_profile(username, backend, use_cache=False))
+    backend = backend or os.getenv("GITHUB_FETCH_BACKEND") or get_config(FETCH_CONFIG, "github", "backend")
+    if backend == "graphql":
+        if get_github_token_pool().authenticated:
+            return (await fetch_github_profiles_graphql([username]))[username]
+        logger.warning("GraphQL backend needs GITHUB_API_TOKEN; falling back to REST")
+    assembler = GitHubProfileAssembler()
+    async for event_type, payload in _stream_github_profile_rest(username):
+        assembler.add(event_type, payload)
+    return assembler.result()
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+GITHUB_GRAPHQL_REPO_FIELDS = """
+fragment RepoFields on RepositoryConnection {
+  totalCount
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    name description stargazerCount forkCount diskUsage
+    createdAt updatedAt pushedAt url homepageUrl isFork isArchived
+    primaryLanguage { name }
+    languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    licenseInfo { name }
+    defaultBranchRef { name }
+    issues(states: OPEN) { totalCount }
+    watchers { totalCount }
+  }
+}
+"""
+
+GITHUB_GRAPHQL_USER_FIELDS = """
+fragment UserFields on User {
+  login name bio location company websiteUrl email twitterUsername
+  createdAt updatedAt avatarUrl isHireable
+  gists(privacy: PUBLIC) { totalCount }
+  followers { totalCount }
+  following { totalCount }
+  repositories(first: 100, ownerAffiliations: OWNER, privacy: PUBLIC, orderBy: {field: PUSHED_AT, direction: DESC}) { ...RepoFields }
+  contributionsCollection {
+    totalCommitContributions
+    totalPullRequestContributions
+    totalIssueContributions
+    commitContributionsByRepository(maxRepositories: 100) { repository { nameWithOwner } }
+    pullRequestContributionsByRepository(maxRepositories: 100) { repository { nameWithOwner } }
+    issueContributionsByRepository(maxRepositories: 100) { repository { nameWithOwner } }
+  }
+}
+"""
+
+GITHUB_GRAPHQL_REPO_PAGE_QUERY = """
+query($login: String!, $after: String) {
+  user(login: $login) {
+    repositories(first: 100, after: $after, ownerAffiliations: OWNER, privacy: PUBLIC, orderBy: {field: PUSHED_AT, direction: DESC}) { ...RepoFields }
+  }
+}
+""" + GITHUB_GRAPHQL_REPO_FIELDS
+
+def _build_github_users_query(count: int) -> str:
+    """One query that aliases ``count`` users as u0..uN, each bound to a $uN login variable."""
+    variables = ", ".join(f"$u{i}: String!" for i in range(count))
+    selections = "\n".join(f"  u{i}: user(login: $u{i}) {{ ...UserFields }}" for i in range(count))
+    return f"query({variables}) {{\n{selections}\n}}\n" + GITHUB_GRAPHQL_USER_FIELDS + GITHUB_GRAPHQL_REPO_FIELDS
+
+def _format_github_graphql_repo(repo: Dict) -> Dict:
+    return {
+        "name": repo["name"],
+        "description": repo["description"],
+        "language": (repo.get("primaryLanguage") or {}).get("name"),
+        "stars": repo["stargazerCount"],
+        "forks": repo["forkCount"],
+        "open_issues": repo["issues"]["totalCount"],
+        "watchers": repo["watchers"]["totalCount"],
+        "size": repo["diskUsage"],
+        "created_at": repo["createdAt"],
+        "updated_at": repo["updatedAt"],
+        "pushed_at": repo["pushedAt"],
+        "url": repo["url"],
+        "homepage": repo["homepageUrl"],
+        "topics": [node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]],
+        "license": (repo.get("licenseInfo") or {}).get("name"),
+        "default_branch": (repo.get("defaultBranchRef") or {}).get("name"),
+        "is_fork": repo["isFork"],
+        "archived": repo["isArchived"],
+        "languages": {edge["node"]["name"]: edge["size"] for edge in repo["languages"]["edges"]}
+    }
+
+def _format_github_graphql_user(user: Dict, repos: List[Dict]) -> Dict:
+    collection = user["contributionsCollection"]
+    contributed_to = set()
+    for key in ["commitContributionsByRepository", "pullRequestContributionsByRepository", "issueContributionsByRepository"]:
+        contributed_to.update(item["repository"]["nameWithOwner"] for item in collection[key])
+    return {
+        "username": user["login"],
+        "name": user["name"],
+        "bio": user["bio"],
+        "location": user["location"],
+        "company": user["company"],
+        "blog": user["websiteUrl"],
+        "email": user["email"] or None,
+        "twitter_username": user["twitterUsername"],
+        "public_repos": user["repositories"]["totalCount"],
+        "public_gists": user["gists"]["totalCount"],
+        "followers": user["followers"]["totalCount"],
+        "following": user["following"]["totalCount"],
+        "created_at": user["createdAt"],
+        "updated_at": user["updatedAt"],
+        "avatar_url": user["avatarUrl"],
+        "hireable": user["isHireable"],
+        "repositories": repos,
+        "language_distribution": _github_language_distribution(repos),
+        "contributions": {
+            "commits": collection["totalCommitContributions"],
+            "pull_requests": collection["totalPullRequestContributions"],
+            "issues": collection["totalIssueContributions"],
+            "repositories_contributed_to": list(contributed_to)
         }
+    }
+
+async def _github_graphql(session: aiohttp.ClientSession, query: str, variables: Dict, headers: Dict,
+                          policy: RetryPolicy) -> Dict:
+    resp = await _github_request(session, "POST", GITHUB_GRAPHQL_URL, headers, policy=policy,
+                                 json={"query": query, "variables": variables})
+    if resp.status != 200:
+        raise GitHubAPIError(f"GitHub GraphQL API returned status {resp.status}")
+    payload = resp.json() or {}
+    if payload.get("data") is None:
+        raise GitHubAPIError(f"GitHub GraphQL error: {payload.get('errors')}")
+    return payload["data"]
+
+async def fetch_github_profiles_graphql(usernames: List[str]) -> Dict[str, dict]:
+    """Fetch many profiles via GraphQL, aliasing up to ``graphql_batch_size`` users per request.
+
+    Each user's profile, first 100 repositories (with languages and topics) and
+    contribution counts come back in the same round trip; accounts with more
+    repositories are paged with follow-up cursor queries. Results use the same
+    shape as the REST path of :func:`fetch_github_profile`.
+    """
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "Portfolio-Extractor"
+    }
+    policy = RetryPolicy.from_config("github")
+    breaker = certificate_core.circuit_breakers.get("github", "api.github.com")
+    batch_size = get_config(FETCH_CONFIG, "github", "graphql_batch_size")
+    usernames = list(dict.fromkeys(usernames))
+    results: Dict[str, dict] = {}
+
+    async def fetch_batch(session: aiohttp.ClientSession, batch: List[str]):
+        variables = {f"u{i}": login for i, login in enumerate(batch)}
+        try:
+            data = await _github_graphql(session, _build_github_users_query(len(batch)), variables, headers, policy)
+        except Exception as e:
+            breaker.record_failure()
+            for login in batch:
+                results[login] = {"error": f"GitHub API request failed: {e}"}
+            return
+        breaker.record_success()
+        for i, login in enumerate(batch):
+            user = data.get(f"u{i}")
+            if not user:
+                results[login] = {"error": "GitHub user not found"}
+                continue
+            connection = user["repositories"]
+            nodes = list(connection["nodes"])
+            while connection["pageInfo"]["hasNextPage"]:
+                try:
+                    page = await _github_graphql(session, GITHUB_GRAPHQL_REPO_PAGE_QUERY,
+                                                 {"login": login, "after": connection["pageInfo"]["endCursor"]}, headers, policy)
+                except Exception as e:
+                    logger.warning(f"Stopped paging repositories for {login}: {e}")
+                    break
+                connection = page["user"]["repositories"]
+                nodes.extend(connection["nodes"])
+            results[login] = _format_github_graphql_user(user, [_format_github_graphql_repo(repo) for repo in nodes])
+
+    if not breaker.allow_request():
+        return {login: {"error": circuit_open_message(breaker)} for login in usernames}
+    try:
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(fetch_batch(session, usernames[i:i + batch_size])
+                                   for i in range(0, len(usernames), batch_size)))
+    finally:
+        breaker.release_probe()
+    return results
+
+async def fetch_github_profiles(usernames: List[str], backend: Optional[str] = None) -> Dict[str, dict]:
+    """Bulk counterpart of :func:`fetch_github_profile`; GraphQL batches users into shared requests."""
+    backend = backend or os.getenv("GITHUB_FETCH_BACKEND") or get_config(FETCH_CONFIG, "github", "backend")
+    usernames = list(dict.fromkeys(usernames))
+    if backend == "graphql" and get_github_token_pool().authenticated:
+        cache = get_profile_cache("github")
+        results, missing, stale = {}, [], []
+        for login in usernames:
+            value, fresh = cache.get(login.lower())
+            if value is None:
+                missing.append(login)
+                continue
+            results[login] = value
+            if not fresh and cache.begin_refresh(login.lower()):
+                stale.append(login)
+
+        async def refresh(logins: List[str]):
+            try:
+                for login, profile in (await fetch_github_profiles_graphql(logins)).items():
+                    cache.set(login.lower(), profile)
+            finally:
+                for login in logins:
+                    cache.end_refresh(login.lower())
+
+        if stale:
+            cache.track(asyncio.create_task(refresh(stale)))
+        if missing:
+            fetched = await fetch_github_profiles_graphql(missing)
+            for login, profile in fetched.items():
+                cache.set(login.lower(), profile)
+            results.update(fetched)
+        return {login: results[login] for login in usernames}
+    profiles = await asyncio.gather(*(fetch_github_profile(login, backend="rest") for login in usernames))
+    return dict(zip(usernames, profiles))
 
 app = FastAPI(
     title="Your API Title",
@@ -1566,6 +1967,28 @@ def get_api_key(api_key: str = Depends(api_key_header)):
             detail="Invalid or missing API Key",
         )
 
+@app.get("/cache/stats")
+async def cache_stats(api_key: str = Depends(get_api_key)):
+    stats = {namespace: cache.stats for namespace, cache in profile_caches.items()}
+    stats["certificates"] = get_certificate_cache().stats
+    return stats
+
+@app.get("/validation/stats")
+async def validation_stats(api_key: str = Depends(get_api_key)):
+    return certificate_core.validation_tiers.snapshot()
+
+@app.post("/selectors/reload")
+async def reload_selectors(api_key: str = Depends(get_api_key)):
+    try:
+        program = reload_selector_program()
+    except (OSError, ValueError, soupsieve.SelectorSyntaxError) as e:
+        raise HTTPException(status_code=400, detail=f"Failed to reload selectors: {e}")
+    return {
+        "selectors": compile_selector.cache_info().currsize,
+        "platforms": sorted(program.platforms),
+        "portfolio_groups": sorted(program.portfolio)
+    }
+
 def extract_elements(text):
     patterns = get_config(REGEX_CONFIG, "extract_elements_patterns")
     github = re.search(patterns["github"], text, re.IGNORECASE)
@@ -1602,8 +2025,13 @@ def extract_elements(text):
 @app.post("/upload/")
 async def upload_file(
     file: UploadFile = File(...),
+    crawl: Optional[bool] = Form(None),
+    revalidate: bool = Form(False),
     api_key: str = Depends(get_api_key)
 ):
+    # One time budget for the whole upload; each step gets what is left of it
+    deadline = Deadline.from_config()
+
     # 1. Save and read the uploaded file
     suffix = os.path.splitext(file.filename)[1]
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
@@ -1621,12 +2049,13 @@ async def upload_file(
     # 3a. Scrape Instagram profile if username found
     instagram_profile = None
     if elements.get("instagram"):
-        instagram_profile = parse_instagram(elements["instagram"])
+        instagram_profile = await asyncio.to_thread(parse_instagram, elements["instagram"], deadline=deadline)
 
     # 3b. Scrape portfolio site if URL found
     portfolio_data = None
     if elements.get("portfolio"):
-        portfolio_data = fetch_portfolio(elements["portfolio"])
+        portfolio_data = await within_deadline(asyncio.to_thread(fetch_portfolio, elements["portfolio"], crawl, deadline),
+                                               deadline, "Portfolio extraction")
 
     # --- Extract skills and experience if missing ---
     if portfolio_data:
@@ -1639,9 +2068,7 @@ async def upload_file(
             text_blob = f"{about} {education} {projects}".lower()
             # Common skill keywords
             skill_keywords = get_config(SELECTORS_CONFIG, "skill_keywords")
-            for kw in skill_keywords:
-                if kw in text_blob:
-                    skills_set.add(kw.title())
+            skills_set.update(kw.title() for kw in keyword_matcher(skill_keywords).find_all(text_blob))
             portfolio_data["skills"] = sorted(skills_set)
         # Extract experience if empty
         if not portfolio_data.get("experience"):
@@ -1649,10 +2076,10 @@ async def upload_file(
             about = portfolio_data.get("about", "")
             education = portfolio_data.get("education", [])
             projects = portfolio_data.get("projects", [])
-            experience_keywords = get_config(SELECTORS_CONFIG, "experience_keywords")
+            experience_matcher = keyword_matcher(get_config(SELECTORS_CONFIG, "experience_keywords"))
             # From about/education
             for line in ([about] + education):
-                if any(word in line.lower() for word in experience_keywords):
+                if experience_matcher.search(line):
                     experience.append(line.strip())
             # From projects
             for proj in projects:
@@ -1669,22 +2096,16 @@ async def upload_file(
         github_url = elements["github"]
         github_username = extract_github_username(github_url)
         if github_username:
-            github_profile = await fetch_github_profile(github_username)
+            github_profile = await within_deadline(fetch_github_profile(github_username), deadline, "GitHub profile")
 
     # 4. Collect certificate URLs from both elements and text extraction
-    certificate_urls = set(extract_certificate_urls(text))
-    for key in ["udemy", "credly", "coursera", "edx", "linkedin"]:
-        url = elements.get(key)
-        if url:
-            certificate_urls.add(url)
-    # Filter out any non-URLs (e.g., 'www.')
-    certificate_urls = {url for url in certificate_urls if isinstance(url, str) and url.startswith("http")}
-
-    # 5. Validate each certificate URL using the orchestrator
+    certificate_urls = collect_certificate_urls(text, elements)
+
+    # 5. Validate the certificate URLs concurrently using the orchestrator
     certificates = {}
-    validator = CertificateValidator()
-    for url in certificate_urls:
-        certificates[url] = validator.validate_certificate(url)
+    if certificate_urls:
+        certificates = await asyncio.to_thread(get_certificate_validator().validate_certificates,
+                                               certificate_urls, not revalidate, deadline)
 
     # 6. Build summary
     total_certificates = len(certificates)
@@ -1705,10 +2126,13 @@ async def upload_file(
         "github_profile": github_profile,
         "certificates": certificates,
         "certificate_summary": certificate_summary,
+        "timed_out": timed_out_sections(portfolio_data, github_profile, certificates, instagram_profile),
     }
 
-async def stream_processing_generator(file_content: bytes, filename: str):
+async def stream_processing_generator(file_content: bytes, filename: str, crawl: Optional[bool] = None,
+                                      revalidate: bool = False):
     """Generator function that yields processing updates in real-time"""
+    deadline = Deadline.from_config()
     try:
         # 1. Extract text from DOCX
         suffix = os.path.splitext(filename)[1]
@@ -1731,14 +2155,15 @@ async def stream_processing_generator(file_content: bytes, filename: str):
         instagram_profile = None
         if elements.get("instagram"):
             yield f"data: {json.dumps({'type': 'status', 'message': 'Fetching Instagram profile...', 'step': 'instagram'})}\n\n"
-            instagram_profile = parse_instagram(elements["instagram"])
+            instagram_profile = await asyncio.to_thread(parse_instagram, elements["instagram"], deadline=deadline)
             yield f"data: {json.dumps({'type': 'instagram', 'data': instagram_profile})}\n\n"
 
         # 3b. Scrape portfolio site if URL found
         portfolio_data = None
         if elements.get("portfolio"):
             yield f"data: {json.dumps({'type': 'status', 'message': 'Fetching portfolio data...', 'step': 'portfolio'})}\n\n"
-            portfolio_data = fetch_portfolio(elements["portfolio"])
+            portfolio_data = await within_deadline(asyncio.to_thread(fetch_portfolio, elements["portfolio"], crawl, deadline),
+                                                   deadline, "Portfolio extraction")
             
             # Extract skills and experience if missing
             if portfolio_data:
@@ -1749,9 +2174,7 @@ async def stream_processing_generator(file_content: bytes, filename: str):
                     projects = " ".join([p.get("description", "") or "" for p in portfolio_data.get("projects", [])])
                     text_blob = f"{about} {education} {projects}".lower()
                     skill_keywords = get_config(SELECTORS_CONFIG, "skill_keywords")
-                    for kw in skill_keywords:
-                        if kw in text_blob:
-                            skills_set.add(kw.title())
+                    skills_set.update(kw.title() for kw in keyword_matcher(skill_keywords).find_all(text_blob))
                     portfolio_data["skills"] = sorted(skills_set)
                 
                 if not portfolio_data.get("experience"):
@@ -1759,9 +2182,9 @@ async def stream_processing_generator(file_content: bytes, filename: str):
                     about = portfolio_data.get("about", "")
                     education = portfolio_data.get("education", [])
                     projects = portfolio_data.get("projects", [])
-                    experience_keywords = get_config(SELECTORS_CONFIG, "experience_keywords")
+                    experience_matcher = keyword_matcher(get_config(SELECTORS_CONFIG, "experience_keywords"))
                     for line in ([about] + education):
-                        if any(word in line.lower() for word in experience_keywords):
+                        if experience_matcher.search(line):
                             experience.append(line.strip())
                     for proj in projects:
                         desc = proj.get("description")
@@ -1779,29 +2202,51 @@ async def stream_processing_generator(file_content: bytes, filename: str):
             github_url = elements["github"]
             github_username = extract_github_username(github_url)
             if github_username:
-                github_profile = await fetch_github_profile(github_username)
-            yield f"data: {json.dumps({'type': 'github', 'data': github_profile})}\n\n"
+                assembler = GitHubProfileAssembler()
+                try:
+                    async for event_type, payload in iterate_within(stream_github_profile(github_username), deadline):
+                        assembler.add(event_type, payload)
+                        yield f"data: {json.dumps({'type': event_type, 'data': payload})}\n\n"
+                    github_profile = assembler.result()
+                except DeadlineExceeded:
+                    # Keep whatever pages arrived in time
+                    github_profile = assembler.result() or {}
+                    github_profile = dict(github_profile, timed_out=True) if github_profile else timed_out_result(
+                        "GitHub profile timed out: request deadline exceeded")
+            else:
+                # Close the GitHub section with the same terminal event a fetched profile ends on
+                skipped = {"skipped": True, "error": f"Could not extract a GitHub username from {github_url}"}
+                yield f"data: {json.dumps({'type': 'github_summary', 'data': skipped})}\n\n"
 
         # 4. Collect certificate URLs
-        certificate_urls = set(extract_certificate_urls(text))
-        for key in ["udemy", "credly", "coursera", "edx", "linkedin"]:
-            url = elements.get(key)
-            if url:
-                certificate_urls.add(url)
-        certificate_urls = {url for url in certificate_urls if isinstance(url, str) and url.startswith("http")}
-
-        # 5. Validate each certificate URL
+        certificate_urls = collect_certificate_urls(text, elements)
+
+        # 5. Validate the certificate URLs concurrently, reporting each as it completes
         certificates = {}
-        validator = CertificateValidator()
         total_certs = len(certificate_urls)
         
         if total_certs > 0:
             yield f"data: {json.dumps({'type': 'status', 'message': f'Validating {total_certs} certificates...', 'step': 'certificates'})}\n\n"
+            validations = get_certificate_validator().iter_validations(certificate_urls, use_cache=not revalidate,
+                                                                       deadline=deadline)
+            stopped = threading.Event()
+            def next_validation():
+                try:
+                    return next(validations)
+                finally:
+                    if stopped.is_set():
+                        close_quietly(validations)
             
-            for i, url in enumerate(certificate_urls, 1):
-                yield f"data: {json.dumps({'type': 'status', 'message': f'Validating certificate {i}/{total_certs}...', 'step': 'certificate_progress'})}\n\n"
-                certificates[url] = validator.validate_certificate(url)
-                yield f"data: {json.dumps({'type': 'certificate_progress', 'url': url, 'data': certificates[url], 'progress': i, 'total': total_certs})}\n\n"
+            try:
+                for i in range(1, total_certs + 1):
+                    yield f"data: {json.dumps({'type': 'status', 'message': f'Validating certificate {i}/{total_certs}...', 'step': 'certificate_progress'})}\n\n"
+                    url, certificates[url] = await asyncio.to_thread(next_validation)
+                    yield f"data: {json.dumps({'type': 'certificate_progress', 'url': url, 'data': certificates[url], 'progress': i, 'total': total_certs})}\n\n"
+            finally:
+                # On a client disconnect, cancel the certificates that have not started. If a
+                # worker thread is still inside next(), it closes the generator when it returns.
+                stopped.set()
+                close_quietly(validations)
 
         # 6. Build summary
         total_certificates = len(certificates)
@@ -1822,6 +2267,7 @@ async def stream_processing_generator(file_content: bytes, filename: str):
             "github_profile": github_profile,
             "certificates": certificates,
             "certificate_summary": certificate_summary,
+            "timed_out": timed_out_sections(portfolio_data, github_profile, certificates, instagram_profile),
         }
         
         yield f"data: {json.dumps({'type': 'complete', 'data': final_results})}\n\n"
@@ -1832,12 +2278,14 @@ async def stream_processing_generator(file_content: bytes, filename: str):
 @app.post("/upload/stream/")
 async def upload_file_stream(
     file: UploadFile = File(...),
+    crawl: Optional[bool] = Form(None),
+    revalidate: bool = Form(False),
     api_key: str = Depends(get_api_key)
 ):
     """Streaming endpoint that yields results as they become available"""
     file_content = await file.read()
     return StreamingResponse(
-        stream_processing_generator(file_content, file.filename),
+        stream_processing_generator(file_content, file.filename, crawl, revalidate),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1847,18 +2295,38 @@ async def upload_file_stream(
         }
     )
 
-def parse_instagram(username: str) -> dict:
+def parse_instagram(username: str, use_cache: bool = True, deadline: Optional[Deadline] = None) -> dict:
     import requests
-    from bs4 import BeautifulSoup
     import re
     from datetime import datetime
 
+    deadline = deadline or current_deadline()
+    if use_cache:
+        return get_profile_cache("instagram").get_or_fetch(
+            username.lower(), lambda: parse_instagram(username, use_cache=False, deadline=deadline))
+
     url = f"https://www.instagram.com/{username}/"
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        # Whatever is left of the request deadline, up to 10s
+        timeout = deadline.clamp(10)
+    except DeadlineExceeded:
+        return timed_out_result("Instagram profile skipped: request deadline exceeded")
+    breaker = certificate_core.circuit_breakers.for_url("instagram", url)
+    if not breaker.allow_request():
+        return {"error": circuit_open_message(breaker)}
+    try:
+        try:
+            resp = get_hedged_fetcher().get(url, headers=headers, timeout=timeout)
+        except requests.RequestException:
+            if deadline.expired():
+                # Our own time ran out, which says nothing about Instagram
+                return timed_out_result("Instagram profile timed out: request deadline exceeded")
+            breaker.record_failure()
+            raise
+        record_upstream_status(breaker, resp.status_code)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = make_soup(resp.text)
         desc = soup.find("meta", attrs={"name": "description"})
         if desc and desc.get("content"):
             content = desc["content"]
@@ -1878,6 +2346,8 @@ def parse_instagram(username: str) -> dict:
             return {"error": "Could not find profile meta description"}
     except Exception as e:
         return {"error": str(e)}
+    finally:
+        breaker.release_probe()
 
 def parse_coursera(url: str) -> dict:
     import requests
@@ -1914,33 +2384,31 @@ def parse_udemy(url: str) -> dict:
 
 def parse_edx(url: str) -> dict:
     import requests
-    from bs4 import BeautifulSoup
 
     try:
         response = requests.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(response.text)
+        texts = TextIndex(soup)
 
         # Course title
         course_title = None
-        for h1 in soup.find_all("h1"):
-            if "certificate" not in h1.text.lower():
-                course_title = h1.text.strip()
+        for h1 in texts.by_tag.get("h1", []):
+            if "certificate" not in texts.text(h1).lower():
+                course_title = texts.text(h1).strip()
                 break
 
-        # Recipient name
+        # Recipient name: the div nearest the label, not the page wrapper that also contains it
         recipient = None
-        for div in soup.find_all("div"):
-            if "awarded to" in div.text.lower():
-                recipient = div.text.replace("Awarded to", "").strip()
-                break
+        div = texts.find("awarded to", "div")
+        if div is not None:
+            recipient = texts.text(div).replace("Awarded to", "").strip()
 
         # Issue date
         issue_date = None
-        for div in soup.find_all("div"):
-            if "issued" in div.text.lower():
-                issue_date = div.text.strip()
-                break
+        div = texts.find("issued", "div")
+        if div is not None:
+            issue_date = texts.text(div).strip()
 
         return {
             "course_title": course_title,
@@ -1958,9 +2426,21 @@ def extract_github_username(url):
 def extract_certificate_urls(text):
     urls = []
     for pattern in PATTERNS["certificate_patterns"].values():
-        urls += re.findall(pattern, text)
+        # finditer, not findall: the patterns' (www\.)? group would otherwise be returned instead of the URL
+        urls += [match.group(0) for match in re.finditer(pattern, text)]
     return urls
 
+def collect_certificate_urls(text: str, elements: Dict) -> List[str]:
+    """Canonical URLs of every certificate in the text or the extracted elements, sorted and deduplicated.
+
+    Links on hosts that are not certificate platforms (and stray fragments
+    such as a bare ``www.``) are dropped here rather than validated.
+    """
+    urls = extract_certificate_urls(text)
+    urls += [elements[key] for key in ["udemy", "credly", "coursera", "edx", "linkedin"] if isinstance(elements.get(key), str)]
+    canonical = (canonicalize_certificate_url(url) for url in urls)
+    return sorted({match[2] for match in canonical if match})
+
 def extract_name(soup):
     for selector in get_config(SELECTORS_CONFIG, "name_selectors"):
         tag = soup.select_one(selector)
@@ -1972,24 +2452,6 @@ def extract_name(soup):
         return clean_text(max(candidates, key=lambda t: len(t.get_text())).get_text())
     return None
 
-# --- LOAD CONFIGS FOR REGEX AND SELECTORS ---
-# CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
-# with open(os.path.join(CONFIG_DIR, 'regex_config.json'), 'r', encoding='utf-8') as f:
-#     REGEX_CONFIG = json.load(f)
-# with open(os.path.join(CONFIG_DIR, 'selectors_config.json'), 'r', encoding='utf-8') as f:
-#     SELECTORS_CONFIG = json.load(f)
-
-# Helper to get config value with error handling
-def get_config(config, *keys, default=None):
-    try:
-        for key in keys:
-            config = config[key]
-        return config
-    except (KeyError, TypeError):
-        if default is not None:
-            return default
-        raise KeyError(f"Missing config value for: {'/'.join(keys)}")
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("complete_file:app", host="0.0.0.0", port=8000, reload=True)
@@ -199,13 +199,16 @@ function App() {
 
         const reader = response.body.getReader();
         const decoder = new TextDecoder();
+        // Large events (e.g. repository batches) can span several chunks
+        let buffer = '';
 
         while (true) {
           const { done, value } = await reader.read();
           if (done) break;
 
-          const chunk = decoder.decode(value);
-          const lines = chunk.split('\n');
+          buffer += decoder.decode(value, { stream: true });
+          const lines = buffer.split('\n');
+          buffer = lines.pop();
 
           for (const line of lines) {
             if (line.startsWith('data: ')) {
@@ -228,6 +231,21 @@ function App() {
                   case 'github':
                     setStreamingResults(prev => ({ ...prev, github_profile: data.data }));
                     break;
+                  case 'github_profile':
+                    setStreamingResults(prev => ({ ...prev, github_profile: { ...data.data, repositories: [] } }));
+                    break;
+                  case 'github_repos_batch':
+                    setStreamingResults(prev => ({
+                      ...prev,
+                      github_profile: {
+                        ...prev.github_profile,
+                        repositories: [...(prev.github_profile?.repositories || []), ...data.data.repositories]
+                      }
+                    }));
+                    break;
+                  case 'github_summary':
+                    setStreamingResults(prev => ({ ...prev, github_profile: { ...prev.github_profile, ...data.data } }));
+                    break;
                   case 'certificate_progress':
                     setStreamingResults(prev => ({
                       ...prev,
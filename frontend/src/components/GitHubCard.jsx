@@ -65,9 +65,16 @@ const GitHubCard = ({ data, isLoading = false }) => {
     return acc;
   }, {}) || {};
 
-  const sortedLanguages = Object.entries(topLanguages)
-    .sort(([,a], [,b]) => b - a)
-    .slice(0, 5);
+  // Prefer the byte-weighted distribution; fall back to counting primary languages
+  const languageShares = data.language_distribution && Object.keys(data.language_distribution).length > 0
+    ? Object.fromEntries(Object.entries(data.language_distribution).map(([lang, info]) => [lang, `${info.percentage}%`]))
+    : null;
+
+  const sortedLanguages = languageShares
+    ? Object.entries(languageShares).slice(0, 5)
+    : Object.entries(topLanguages)
+      .sort(([,a], [,b]) => b - a)
+      .slice(0, 5);
 
   const totalStars = data.repositories?.reduce((sum, repo) => sum + repo.stars, 0) || 0;
   const totalForks = data.repositories?.reduce((sum, repo) => sum + repo.forks, 0) || 0;
@@ -70,12 +70,18 @@ const ResultsGraphs = ({ results }) => {
     return acc;
   }, {}) || {};
 
+  // Byte-weighted share of code when the backend provides it
+  const languageDistribution = results.github_profile?.language_distribution || {};
+  const hasDistribution = Object.keys(languageDistribution).length > 0;
+
   const languageData = {
-    labels: Object.keys(githubLanguages).slice(0, 8),
+    labels: (hasDistribution ? Object.keys(languageDistribution) : Object.keys(githubLanguages)).slice(0, 8),
     datasets: [
       {
-        label: 'Number of Repositories',
-        data: Object.values(githubLanguages).slice(0, 8),
+        label: hasDistribution ? 'Share of Code (%)' : 'Number of Repositories',
+        data: (hasDistribution
+          ? Object.values(languageDistribution).map((info) => info.percentage)
+          : Object.values(githubLanguages)).slice(0, 8),
         backgroundColor: 'rgba(54, 162, 235, 0.8)',
         borderColor: 'rgba(54, 162, 235, 1)',
         borderWidth: 1,
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import complete_file  # noqa: E402
+from cert_validator import core  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Fresh certificate cache file, circuit breakers, caches, counters and GitHub token pool per test."""
+    monkeypatch.setenv("CERTIFICATE_CACHE_PATH", str(tmp_path / "certificate_cache.sqlite3"))
+    monkeypatch.setattr(core, "certificate_cache", None)
+    monkeypatch.setattr(core, "circuit_breakers", core.CircuitBreakerRegistry())
+    monkeypatch.setattr(complete_file, "profile_caches", {})
+    monkeypatch.setattr(core, "validation_tiers", core.ValidationTierStats())
+    monkeypatch.setattr(complete_file, "github_token_pool", complete_file.GitHubTokenPool([]))
+    monkeypatch.delenv("PROFILE_CACHE_PATH", raising=False)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Retry immediately so retried requests do not sleep."""
+    policies = core.FETCH_CONFIG["retry_policies"]
+    monkeypatch.setitem(policies, "default", dict(policies["default"], base_delay=0.0, max_delay=0.0))
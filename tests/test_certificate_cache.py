@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from cert_validator.core import CertificateCache, CertificateValidator, CourseraValidator
+
+TTLS = {"Valid": 600, "Expired": 3600, "Invalid": 60, "Error": 5}
+
+
+def make_cache(tmp_path, **kwargs) -> CertificateCache:
+    return CertificateCache(str(tmp_path / "cache.sqlite3"), TTLS, **kwargs)
+
+
+def test_ttl_depends_on_status(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.ttl_for({"status": "Valid", "data": {}}) == 600
+    assert cache.ttl_for({"status": "Invalid"}) == 60
+    assert cache.ttl_for({"status": "Revoked"}) == 0
+
+
+def test_valid_certificate_is_not_cached_past_its_expiry(tmp_path):
+    cache = make_cache(tmp_path)
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    assert cache.ttl_for({"status": "Valid", "data": {"expiry_date": tomorrow}}) <= 600
+    assert cache.ttl_for({"status": "Valid", "data": {"expiry_date": yesterday}}) == 0
+    assert cache.ttl_for({"status": "Valid", "data": {"expiry_date": "soon"}}) == 600
+
+
+def test_round_trip_and_stats(tmp_path):
+    cache = make_cache(tmp_path)
+    result = {"status": "Valid", "data": {"name": "Jane"}, "confidence": 90}
+    assert cache.get("udemy:UC-1") is None
+    cache.set("udemy:UC-1", result)
+    assert cache.get("udemy:UC-1") == result
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1 and cache.stats["writes"] == 1
+
+
+def test_uncacheable_status_and_disabled_cache(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("credly:x", {"status": "Revoked"})
+    assert cache.get("credly:x") is None
+    disabled = make_cache(tmp_path, enabled=False)
+    disabled.set("credly:y", {"status": "Valid", "data": {}})
+    assert disabled.get("credly:y") is None
+
+
+def test_validator_serves_repeat_lookups_from_cache():
+    url = "https://www.coursera.org/account/accomplishments/verify/ABCDEF123"
+    result = {"status": "Valid", "data": {"name": "Jane"}, "confidence": 90}
+    with mock.patch.object(CourseraValidator, "validate_certificate", return_value=result) as validate:
+        validator = CertificateValidator()
+        first = validator.validate_certificate(url)
+        second = validator.validate_certificate(url)
+        forced = validator.validate_certificate(url, use_cache=False)
+    assert first == second == forced
+    assert first["status"] == "Valid"
+    assert validate.call_count == 2
+
+
+def test_mock_metadata_fallback_is_never_cached():
+    url = "https://www.coursera.org/account/accomplishments/verify/ABCDEF123"
+    # A page without the name paragraph or course link falls back to the mock metadata
+    with mock.patch.object(CourseraValidator, "_make_request", return_value="<html><body></body></html>") as fetch:
+        validator = CertificateValidator()
+        first = validator.validate_certificate(url)
+        validator.validate_certificate(url)
+    assert first["status"] == "Valid" and first["data"]["mock"]
+    assert fetch.call_count == 2
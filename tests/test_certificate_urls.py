@@ -0,0 +1,53 @@
+import pytest
+
+from complete_file import collect_certificate_urls, extract_certificate_urls
+from cert_validator.core import canonicalize_certificate_url, certificate_key
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.udemy.com/certificate/UC-1234abcd-5678/",
+    "http://udemy.com/certificate/UC-1234abcd-5678",
+    "HTTPS://WWW.UDEMY.COM/certificate/UC-1234abcd-5678/?utm_source=resume#top",
+    "udemy.com/certificate/UC-1234abcd-5678/",
+])
+def test_spellings_of_one_certificate_share_a_canonical_url(url):
+    assert canonicalize_certificate_url(url) == (
+        "udemy", "UC-1234abcd-5678", "https://www.udemy.com/certificate/UC-1234abcd-5678/")
+
+
+def test_coursera_and_credly_ids():
+    assert canonicalize_certificate_url("https://coursera.org/account/accomplishments/verify/abc123XYZ") == (
+        "coursera", "abc123XYZ", "https://www.coursera.org/account/accomplishments/verify/abc123XYZ")
+    assert canonicalize_certificate_url("https://www.credly.com/badges/0a1b-2c3d/") == (
+        "credly", "0a1b-2c3d", "https://www.credly.com/badges/0a1b-2c3d")
+
+
+def test_path_without_an_id_is_used_as_the_id():
+    platform, certificate_id, canonical = canonicalize_certificate_url("https://www.credly.com/org/acme/badge/cloud-basics/")
+    assert (platform, certificate_id) == ("credly", "/org/acme/badge/cloud-basics")
+    assert canonical == "https://www.credly.com/org/acme/badge/cloud-basics"
+
+
+def test_unknown_host():
+    assert canonicalize_certificate_url("https://example.com/certificate/UC-1") is None
+    assert certificate_key(" https://example.com/x ") == "https://example.com/x"
+
+
+def test_certificate_key_ignores_spelling():
+    assert certificate_key("https://www.edx.org/certificates/abc123") == "edx:abc123"
+    assert certificate_key("http://edx.org/certificates/abc123/?x=1") == "edx:abc123"
+
+
+def test_extract_certificate_urls_returns_whole_urls():
+    text = "See https://www.udemy.com/certificate/UC-1234abcd-5678/ and credly.com/badges/0a1b-2c3d too"
+    urls = extract_certificate_urls(text)
+    assert "https://www.udemy.com/certificate/UC-1234abcd-5678/" in urls
+    assert all("/" in url for url in urls)
+
+
+def test_collected_urls_are_canonical_once_per_certificate():
+    text = ("See https://www.udemy.com/certificate/UC-1234abcd-5678/ and "
+            "http://udemy.com/certificate/UC-1234abcd-5678?utm=cv and credly.com/badges/0a1b-2c3d")
+    elements = {"credly": "www.credly.com/badges/0a1b-2c3d/", "coursera": "www.", "github": "https://github.com/x"}
+    assert collect_certificate_urls(text, elements) == [
+        "https://www.credly.com/badges/0a1b-2c3d", "https://www.udemy.com/certificate/UC-1234abcd-5678/"]
@@ -0,0 +1,143 @@
+import time
+from unittest import mock
+
+import pytest
+
+from cert_validator import core
+from cert_validator.core import CertificateValidator, CircuitBreaker, CircuitBreakerRegistry, record_upstream_status
+
+COURSERA_URL = "https://www.coursera.org/account/accomplishments/verify/ABCDEF123"
+
+
+def open_breaker(cooldown: float = 0.05) -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=cooldown)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert 0 < breaker.retry_after() <= 60
+
+
+def test_half_open_admits_one_probe():
+    breaker = open_breaker()
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_probe_outcome_closes_or_reopens():
+    breaker = open_breaker()
+    time.sleep(0.06)
+    breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker = open_breaker()
+    time.sleep(0.06)
+    breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_probe_without_outcome_admits_the_next_one():
+    breaker = open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_release_after_outcome_is_neutral():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=60)
+    assert breaker.allow_request()
+    breaker.record_success()
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_upstream_status_classification():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=60)
+    record_upstream_status(breaker, 503)
+    record_upstream_status(breaker, 404)
+    record_upstream_status(breaker, 429)
+    assert breaker.state == CircuitBreaker.CLOSED
+    record_upstream_status(breaker, 500)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_registry_keys_by_platform_and_host():
+    registry = CircuitBreakerRegistry()
+    assert registry.for_url("udemy", "https://www.udemy.com/x") is registry.get("udemy", "UDEMY.com")
+    assert registry.get("udemy", "udemy.com") is not registry.get("portfolio", "udemy.com")
+    assert registry.snapshot() == {"udemy:udemy.com": "closed", "portfolio:udemy.com": "closed"}
+
+
+def test_open_circuit_fails_fast_without_calling_the_platform():
+    breaker = core.circuit_breakers.for_url("coursera", COURSERA_URL)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    with mock.patch.object(core.CourseraValidator, "validate_certificate") as validate:
+        result = CertificateValidator().validate_certificate(COURSERA_URL)
+    validate.assert_not_called()
+    assert result["status"] == "Error"
+    assert result["error_message"].startswith("Upstream coursera:coursera.org is failing")
+
+
+def response(status: int) -> mock.Mock:
+    return mock.Mock(status_code=status, ok=status < 400, text="", headers={})
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_missing_certificate_does_not_trip_the_platform_circuit(status, no_backoff):
+    validator = CertificateValidator()
+    with mock.patch("requests.get", return_value=response(status)):
+        for _ in range(5):
+            assert validator.validate_certificate(COURSERA_URL, use_cache=False)["status"] == "Invalid"
+    assert core.circuit_breakers.for_url("coursera", COURSERA_URL).state == CircuitBreaker.CLOSED
+
+
+def test_upstream_errors_trip_the_platform_circuit(no_backoff):
+    validator = CertificateValidator()
+    with mock.patch("requests.get", return_value=response(503)):
+        for _ in range(3):
+            assert validator.validate_certificate(COURSERA_URL, use_cache=False)["status"] == "Error"
+    assert core.circuit_breakers.for_url("coursera", COURSERA_URL).state == CircuitBreaker.OPEN
+
+
+def test_validator_exception_counts_as_a_failure():
+    breaker = core.circuit_breakers.for_url("coursera", COURSERA_URL)
+    with mock.patch.object(core.CourseraValidator, "validate_certificate", side_effect=RuntimeError("boom")):
+        for _ in range(breaker.failure_threshold):
+            assert CertificateValidator().validate_certificate(COURSERA_URL, use_cache=False)["status"] == "Error"
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_probe_that_runs_out_of_request_time_is_released():
+    breaker = core.circuit_breakers.for_url("coursera", COURSERA_URL)
+    breaker.cooldown_seconds = 0.05
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    time.sleep(0.06)
+
+    def slow_error(self, url, capture_screenshot=False):
+        time.sleep(0.1)
+        return {"status": "Error", "data": {}, "confidence": 0, "screenshot": None, "error_message": "slow"}
+
+    with mock.patch.object(core.CourseraValidator, "validate_certificate", slow_error):
+        result = CertificateValidator().validate_certificate(
+            COURSERA_URL, use_cache=False, deadline=core.Deadline(0.05))
+    assert result["timed_out"]
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from cert_validator.core import CredlyValidator
+
+BADGE_URL = "https://www.credly.com/badges/0a1b2c3d-4e5f"
+JSON_URL = "https://www.credly.com/badges/0a1b2c3d-4e5f.json"
+BADGE_JSON = {"data": {
+    "issuer": {"entities": [{"entity": {"name": "Amazon Web Services"}}]},
+    "badge_template": {"name": "AWS Certified Cloud Practitioner", "description": " Cloud basics ",
+                       "skills": [{"name": "AWS"}, "Cloud"], "badge_template_activities": [{"title": "Pass the exam"}]},
+}}
+META_PAGE = """<html><head>
+<meta property="og:title" content="AWS Certified Cloud Practitioner was issued by Amazon Web Services to Jane Doe.">
+<meta property="og:description" content="Cloud basics">
+</head><body></body></html>"""
+
+
+def reply(status, payload=None, text=""):
+    def parse_json():
+        if payload is None:
+            raise ValueError("no json")
+        return payload
+    return SimpleNamespace(status_code=status, ok=200 <= status < 300, text=text, json=parse_json)
+
+
+def routes(table):
+    def fake_get(url, **kwargs):
+        return table[url]
+    return mock.patch("complete_file.requests.get", side_effect=fake_get)
+
+
+@pytest.fixture
+def validator():
+    with mock.patch.object(CredlyValidator, "_setup_webdriver", side_effect=AssertionError("browser launched")):
+        yield CredlyValidator()
+
+
+def test_badge_json_maps_onto_html_keys(validator):
+    with routes({JSON_URL: reply(200, BADGE_JSON)}):
+        metadata = validator.extract_metadata(BADGE_URL)
+    assert metadata["badge_name"] == "AWS Certified Cloud Practitioner"
+    assert metadata["organization"] == "Amazon Web Services"
+    assert metadata["description"] == "Cloud basics"
+    assert metadata["skills"] == ["AWS", "Cloud"]
+    assert metadata["earning_criteria"] == ["Pass the exam"]
+
+
+def test_meta_tags_used_when_json_is_unavailable(validator):
+    with routes({JSON_URL: reply(500), BADGE_URL: reply(200, text=META_PAGE)}):
+        metadata = validator.extract_metadata(BADGE_URL)
+    assert metadata["badge_name"] == "AWS Certified Cloud Practitioner"
+    assert metadata["organization"] == "Amazon Web Services"
+
+
+def test_missing_badge_is_conclusive_without_a_browser(validator):
+    with routes({JSON_URL: reply(404), BADGE_URL: reply(404)}):
+        assert validator._extract_metadata_static(BADGE_URL) == ({}, True)
+
+
+def test_inconclusive_static_read_escalates(validator):
+    with routes({JSON_URL: reply(200, {"data": {}}), BADGE_URL: reply(200, text="<html></html>")}):
+        assert validator._extract_metadata_static(BADGE_URL) == ({}, False)
+
+
+def test_issuer_summary_is_used_when_entities_are_missing(validator):
+    metadata, success = validator._metadata_from_badge_json(
+        {"name": "Badge", "issuer": {"summary": "issued by Acme Corp"}})
+    assert success and metadata["organization"] == "Acme Corp"
+
+
+@pytest.mark.parametrize("issuer", ["Acme Corp", [{"entity": {"name": "Acme Corp"}}], [{"name": "Acme Corp"}]])
+def test_issuer_given_as_a_name_or_entity_list(validator, issuer):
+    metadata, success = validator._metadata_from_badge_json({"name": "Badge", "issuer": issuer})
+    assert success and metadata["organization"] == "Acme Corp"
+
+
+def test_unusable_issuer_is_inconclusive(validator):
+    assert validator._metadata_from_badge_json({"name": "Badge", "issuer": 42}) == ({"badge_name": "Badge"}, False)
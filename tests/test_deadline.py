@@ -0,0 +1,115 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import complete_file
+from cert_validator.core import (NO_DEADLINE, Deadline, DeadlineExceeded, current_deadline, iterate_within,
+                                 timed_out_sections, within_deadline)
+
+
+def test_no_deadline_leaves_timeouts_alone():
+    assert NO_DEADLINE.clamp(10) == 10
+    assert NO_DEADLINE.clamp(None) is None
+    assert NO_DEADLINE.remaining() == float("inf")
+    assert not NO_DEADLINE.expired()
+
+
+def test_clamp_cuts_timeouts_to_the_time_left():
+    deadline = Deadline(5)
+    assert deadline.clamp(1) == 1
+    assert 4 < deadline.clamp(30) <= 5
+    assert 4 < deadline.clamp(None) <= 5
+
+
+def test_clamp_raises_once_expired():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.expired()
+    with pytest.raises(DeadlineExceeded):
+        deadline.clamp(10)
+
+
+def test_narrowed_keeps_the_earlier_expiry():
+    long = Deadline(60)
+    assert long.narrowed(1).remaining() <= 1
+    short = Deadline(1)
+    assert short.narrowed(60) is short
+    assert NO_DEADLINE.narrowed(2).remaining() <= 2
+
+
+def test_applied_sets_the_current_deadline():
+    deadline = Deadline(5)
+    assert current_deadline() is NO_DEADLINE
+    with deadline.applied():
+        assert current_deadline() is deadline
+    assert current_deadline() is NO_DEADLINE
+
+
+def test_within_deadline_returns_a_timed_out_result():
+    async def slow():
+        await asyncio.sleep(1)
+        return {"ok": True}
+
+    result = asyncio.run(within_deadline(slow(), Deadline(0.05), "GitHub profile"))
+    assert result == {"error": "GitHub profile timed out: request deadline exceeded", "timed_out": True}
+    assert asyncio.run(within_deadline(slow(), Deadline(2), "GitHub profile")) == {"ok": True}
+
+
+def test_within_deadline_skips_work_once_expired():
+    deadline = Deadline(0.001)
+    time.sleep(0.01)
+    result = asyncio.run(within_deadline(asyncio.sleep(1), deadline, "Portfolio"))
+    assert result["error"].startswith("Portfolio skipped")
+
+
+def test_iterate_within_stops_a_stream_at_the_deadline():
+    closed = []
+
+    async def events():
+        try:
+            for i in range(10):
+                await asyncio.sleep(0.03)
+                yield i
+        finally:
+            closed.append(True)
+
+    async def consume():
+        seen = []
+        with pytest.raises(DeadlineExceeded):
+            async for item in iterate_within(events(), Deadline(0.1)):
+                seen.append(item)
+        return seen
+
+    seen = asyncio.run(consume())
+    assert 1 <= len(seen) < 10
+    assert closed == [True]
+
+
+def test_timed_out_sections():
+    certificates = {"a": {"status": "Valid"}, "b": {"timed_out": True}}
+    assert timed_out_sections({"timed_out": True}, {"login": "x"}, certificates) == ["portfolio_data", "certificates"]
+    assert timed_out_sections(None, None, {}, {"timed_out": True}) == ["instagram_profile"]
+
+
+class RecordingFetcher:
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, **kwargs):
+        self.timeouts.append(kwargs["timeout"])
+        return SimpleNamespace(status_code=200, raise_for_status=lambda: None,
+                               text='<meta name="description" content="5 followers, 2 following, 1 posts">')
+
+
+def test_instagram_request_timeout_is_clamped_to_the_deadline(monkeypatch):
+    fetcher = RecordingFetcher()
+    monkeypatch.setattr(complete_file, "get_hedged_fetcher", lambda: fetcher)
+    profile = complete_file.parse_instagram("someone", use_cache=False, deadline=Deadline(3))
+    assert profile["followers"] == 5
+    assert 0 < fetcher.timeouts[0] <= 3
+    expired = Deadline(0.01)
+    time.sleep(0.02)
+    assert complete_file.parse_instagram("someone", use_cache=False, deadline=expired)["timed_out"]
+    assert len(fetcher.timeouts) == 1
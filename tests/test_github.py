@@ -0,0 +1,382 @@
+import asyncio
+import json
+
+import pytest
+
+import complete_file
+from cert_validator import core
+from cert_validator.core import FetchResponse
+
+REPOS_URL = "https://api.github.com/users/octo/repos"
+
+
+def repo(index: int, **overrides) -> dict:
+    data = {
+        "name": f"repo{index}", "description": None, "language": "Python",
+        "stargazers_count": 0, "forks_count": 0, "open_issues_count": 0, "watchers_count": 0,
+        "size": 1, "created_at": None, "updated_at": None, "pushed_at": None,
+        "html_url": f"https://github.com/octo/repo{index}", "homepage": None, "topics": [],
+        "license": None, "default_branch": "main", "fork": False, "archived": False,
+    }
+    data.update(overrides)
+    return data
+
+
+def response(status: int, payload=None, headers=None) -> FetchResponse:
+    return FetchResponse(status, headers or {}, json.dumps(payload) if payload is not None else "")
+
+
+@pytest.fixture
+def github_api(monkeypatch):
+    """Route ``_github_get`` to an in-memory table keyed by URL and page."""
+    routes = {}
+    calls = []
+
+    async def fake_get(session, url, headers, params=None, policy=None, **kwargs):
+        page = (params or {}).get("page")
+        calls.append((url, page))
+        route = routes.get((url, page), routes.get(url))
+        if isinstance(route, Exception):
+            raise route
+        if callable(route):
+            return route(headers)
+        return route if route is not None else response(404)
+
+    monkeypatch.setattr(complete_file, "_github_get", fake_get)
+    monkeypatch.setattr(complete_file, "github_token_pool", complete_file.GitHubTokenPool(["token"]))
+    monkeypatch.setitem(core.FETCH_CONFIG["github"], "per_page", 2)
+    return routes, calls
+
+
+@pytest.fixture(autouse=True)
+def fresh_watermarks():
+    complete_file._github_event_watermarks.clear()
+    complete_file._github_language_cache.clear()
+    yield
+    complete_file._github_event_watermarks.clear()
+    complete_file._github_language_cache.clear()
+
+
+def fetch_repos(public_repos):
+    async def walk():
+        return [item async for item in complete_file._iter_github_repo_pages(None, REPOS_URL, {}, None, public_repos)]
+    return [repo for _, page in sorted(asyncio.run(walk()), key=lambda item: item[0]) for repo in page or []]
+
+
+def test_repo_pages_fetched_together_and_merged_in_order(github_api):
+    routes, calls = github_api
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = response(200, [repo(3), repo(4)])
+    routes[(REPOS_URL, 3)] = response(200, [repo(5)])
+    repos = fetch_repos(public_repos=5)
+    assert [r["name"] for r in repos] == ["repo1", "repo2", "repo3", "repo4", "repo5"]
+    assert sorted(page for _, page in calls) == [1, 2, 3]
+
+
+def test_stale_repo_count_walks_remaining_pages(github_api):
+    routes, calls = github_api
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = response(200, [repo(3)])
+    repos = fetch_repos(public_repos=1)
+    assert len(repos) == 3
+    assert [page for _, page in calls] == [1, 2]
+
+
+def test_failed_repo_page_is_skipped(github_api):
+    routes, _ = github_api
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = ConnectionError("reset")
+    assert [r["name"] for r in fetch_repos(public_repos=3)] == ["repo1", "repo2"]
+
+
+def graphql_repo(name: str) -> dict:
+    return {
+        "name": name, "description": None, "stargazerCount": 1, "forkCount": 0, "diskUsage": 1,
+        "createdAt": None, "updatedAt": None, "pushedAt": None, "url": f"https://github.com/x/{name}",
+        "homepageUrl": None, "isFork": False, "isArchived": False, "primaryLanguage": {"name": "Go"},
+        "languages": {"edges": [{"size": 10, "node": {"name": "Go"}}]},
+        "repositoryTopics": {"nodes": []}, "licenseInfo": None, "defaultBranchRef": {"name": "main"},
+        "issues": {"totalCount": 0}, "watchers": {"totalCount": 0},
+    }
+
+
+def graphql_user(login: str, repos, has_next: bool = False) -> dict:
+    return {
+        "login": login, "name": login.title(), "bio": None, "location": None, "company": None,
+        "websiteUrl": None, "email": "", "twitterUsername": None, "createdAt": None, "updatedAt": None,
+        "avatarUrl": None, "isHireable": False, "gists": {"totalCount": 0},
+        "followers": {"totalCount": 3}, "following": {"totalCount": 0},
+        "repositories": {"totalCount": len(repos), "pageInfo": {"hasNextPage": has_next, "endCursor": "c1"},
+                         "nodes": repos},
+        "contributionsCollection": {
+            "totalCommitContributions": 7, "totalPullRequestContributions": 1, "totalIssueContributions": 0,
+            "commitContributionsByRepository": [{"repository": {"nameWithOwner": "x/a"}}],
+            "pullRequestContributionsByRepository": [{"repository": {"nameWithOwner": "x/a"}}],
+            "issueContributionsByRepository": [],
+        },
+    }
+
+
+def test_users_query_aliases_each_login():
+    query = complete_file._build_github_users_query(3)
+    assert query.startswith("query($u0: String!, $u1: String!, $u2: String!)")
+    assert "u2: user(login: $u2) { ...UserFields }" in query
+    assert "fragment RepoFields" in query
+
+
+def test_graphql_batches_users_and_pages_repositories(monkeypatch):
+    monkeypatch.setitem(core.FETCH_CONFIG["github"], "graphql_batch_size", 2)
+    batches = []
+
+    async def fake_graphql(session, query, variables, headers, policy):
+        if "login" in variables:
+            return {"user": {"repositories": {"pageInfo": {"hasNextPage": False, "endCursor": None},
+                                              "nodes": [graphql_repo("second-page")]}}}
+        batches.append(sorted(variables.values()))
+        return {f"u{i}": (graphql_user(login, [graphql_repo("r")], has_next=login == "ann") if login != "ghost" else None)
+                for i, login in enumerate(variables.values())}
+
+    monkeypatch.setattr(complete_file, "_github_graphql", fake_graphql)
+    results = asyncio.run(complete_file.fetch_github_profiles_graphql(["ann", "bob", "ghost", "ann"]))
+
+    assert batches == [["ann", "bob"], ["ghost"]]
+    assert results["ghost"] == {"error": "GitHub user not found"}
+    assert [r["name"] for r in results["ann"]["repositories"]] == ["r", "second-page"]
+    assert results["bob"]["contributions"]["repositories_contributed_to"] == ["x/a"]
+    assert results["bob"]["email"] is None
+    assert results["bob"]["repositories"][0]["languages"] == {"Go": 10}
+
+
+def test_graphql_batch_failure_marks_every_user(monkeypatch):
+    async def failing_graphql(session, query, variables, headers, policy):
+        raise complete_file.GitHubAPIError("boom")
+
+    monkeypatch.setattr(complete_file, "_github_graphql", failing_graphql)
+    results = asyncio.run(complete_file.fetch_github_profiles_graphql(["ann", "bob"]))
+    assert all(r["error"].endswith("boom") for r in results.values())
+
+
+EVENTS_URL = "https://api.github.com/users/octo/events/public"
+
+
+def event(event_id: int, kind: str = "PushEvent", repo_name: str = "octo/a", commits: int = 1) -> dict:
+    return {"id": str(event_id), "type": kind, "repo": {"name": repo_name},
+            "payload": {"commits": [{}] * commits}}
+
+
+def empty_event_pages(routes):
+    routes[(EVENTS_URL, 2)] = response(200, [])
+    routes[(EVENTS_URL, 3)] = response(200, [])
+
+
+def fetch_contributions(username="octo"):
+    return asyncio.run(complete_file._fetch_github_contributions(None, username, EVENTS_URL, {}, None))
+
+
+def test_contributions_aggregate_every_event_page(github_api):
+    routes, calls = github_api
+    routes[(EVENTS_URL, 1)] = response(200, [event(6, commits=2), event(5, "PullRequestEvent")], {"ETag": "e1"})
+    routes[(EVENTS_URL, 2)] = response(200, [event(4, "IssuesEvent", "octo/b"), event(3, "WatchEvent")])
+    routes[(EVENTS_URL, 3)] = response(200, [])
+    contributions = fetch_contributions()
+    assert (contributions["commits"], contributions["pull_requests"], contributions["issues"]) == (2, 1, 1)
+    assert sorted(contributions["repositories_contributed_to"]) == ["octo/a", "octo/b"]
+    assert sorted(page for _, page in calls) == [1, 2, 3]
+
+
+def test_incremental_refresh_adds_only_events_past_the_watermark(github_api):
+    routes, calls = github_api
+    routes[(EVENTS_URL, 1)] = response(200, [event(6), event(5)], {"ETag": "e1"})
+    empty_event_pages(routes)
+    fetch_contributions()
+    calls.clear()
+    sent = []
+
+    def page_one(headers):
+        sent.append(headers.get("If-None-Match"))
+        return response(200, [event(8, commits=3), event(6)], {"ETag": "e2"})
+
+    routes[(EVENTS_URL, 1)] = page_one
+    contributions = fetch_contributions()
+    assert sent == ["e1"]
+    assert contributions["commits"] == 5
+    assert [page for _, page in calls] == [1]
+    assert complete_file._github_event_watermarks["octo"]["watermark"] == 8
+
+
+def test_partial_walk_does_not_advance_the_watermark(github_api):
+    routes, _ = github_api
+    routes[(EVENTS_URL, 1)] = response(200, [event(6), event(5)], {"ETag": "e1"})
+    empty_event_pages(routes)
+    fetch_contributions()
+    routes[(EVENTS_URL, 1)] = response(200, [event(10), event(9)], {"ETag": "e2"})
+    routes[(EVENTS_URL, 2)] = response(502)
+    assert fetch_contributions()["commits"] == 4
+    assert complete_file._github_event_watermarks["octo"]["watermark"] == 6
+
+
+def test_not_modified_keeps_cached_totals(github_api):
+    routes, _ = github_api
+    routes[(EVENTS_URL, 1)] = response(200, [event(6, commits=4)], {"ETag": "e1"})
+    empty_event_pages(routes)
+    fetch_contributions()
+    routes[(EVENTS_URL, 1)] = response(304)
+    assert fetch_contributions()["commits"] == 4
+
+
+def test_watermark_is_shared_across_login_casing(github_api):
+    routes, _ = github_api
+    routes[(EVENTS_URL, 1)] = response(200, [event(6, commits=4)], {"ETag": "e1"})
+    empty_event_pages(routes)
+    fetch_contributions("Octo")
+    routes[(EVENTS_URL, 1)] = response(304)
+    assert fetch_contributions("octo")["commits"] == 4
+    assert list(complete_file._github_event_watermarks) == ["octo"]
+
+
+def languages_url(name: str) -> str:
+    return f"https://api.github.com/repos/octo/{name}/languages"
+
+
+def test_languages_fetched_per_repo_and_cached_until_next_push(github_api):
+    routes, calls = github_api
+    routes[languages_url("repo1")] = response(200, {"Python": 300, "Shell": 100})
+    routes[languages_url("repo2")] = response(500)
+    repos = [complete_file._format_github_repo(repo(1)), complete_file._format_github_repo(repo(2, language="Go"))]
+    asyncio.run(complete_file._fetch_github_languages(None, "octo", repos, {}, None))
+    assert repos[0]["languages"] == {"Python": 300, "Shell": 100}
+    assert repos[1]["languages"] == {"Go": 0}
+
+    calls.clear()
+    again = [complete_file._format_github_repo(repo(1))]
+    asyncio.run(complete_file._fetch_github_languages(None, "octo", again, {}, None))
+    assert again[0]["languages"] == {"Python": 300, "Shell": 100}
+    assert calls == []
+
+    pushed = [complete_file._format_github_repo(repo(1, pushed_at="2026-01-01T00:00:00Z"))]
+    asyncio.run(complete_file._fetch_github_languages(None, "octo", pushed, {}, None))
+    assert calls == [(languages_url("repo1"), None)]
+
+
+def test_languages_fan_out_stops_at_the_reserve(github_api, monkeypatch):
+    routes, calls = github_api
+    monkeypatch.setitem(core.FETCH_CONFIG["github"], "languages_reserve_calls", 4999)
+    for i in (1, 2):
+        routes[languages_url(f"repo{i}")] = response(200, {"Python": 10})
+    repos = [complete_file._format_github_repo(repo(i)) for i in (1, 2)]
+    asyncio.run(complete_file._fetch_github_languages(None, "octo", repos, {}, None))
+    assert len(calls) == 1
+    assert sorted(r["languages"]["Python"] for r in repos) == [0, 10]
+
+
+def test_unauthenticated_stream_skips_the_languages_fan_out(github_api, monkeypatch):
+    routes, calls = github_api
+    monkeypatch.setattr(complete_file, "github_token_pool", complete_file.GitHubTokenPool([]))
+    routes[USER_URL] = response(200, user(public_repos=1))
+    routes[(REPOS_URL, 1)] = response(200, [repo(1)])
+    events = collect(complete_file.stream_github_profile("octo"))
+    assert not any("/languages" in url for url, _ in calls)
+    assert events[-1][1]["language_distribution"] == {}
+
+
+def test_language_distribution_is_byte_weighted_and_skips_forks():
+    repos = [
+        {"languages": {"Python": 300, "Shell": 100}},
+        {"languages": {"Shell": 100}},
+        {"languages": {"C": 10_000}, "is_fork": True},
+    ]
+    assert complete_file._github_language_distribution(repos) == {
+        "Python": {"bytes": 300, "percentage": 60.0},
+        "Shell": {"bytes": 200, "percentage": 40.0},
+    }
+    assert complete_file._github_language_distribution([]) == {}
+
+
+USER_URL = "https://api.github.com/users/octo"
+
+
+def user(**overrides) -> dict:
+    data = {"login": "octo", "name": "Octo", "public_repos": 3}
+    data.update(overrides)
+    return data
+
+
+def collect(stream) -> list:
+    async def drain():
+        return [event async for event in stream]
+    return asyncio.run(drain())
+
+
+def test_stream_yields_profile_then_batches_then_summary(github_api):
+    routes, _ = github_api
+    routes[USER_URL] = response(200, user())
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = response(200, [repo(3)])
+    routes[(EVENTS_URL, 1)] = response(200, [event(1, commits=2)])
+    routes[languages_url("repo1")] = response(200, {"Python": 10})
+
+    events = collect(complete_file.stream_github_profile("octo"))
+    kinds = [kind for kind, _ in events]
+    assert kinds[0] == "github_profile" and kinds[-1] == "github_summary"
+    assert kinds.count("github_repos_batch") == 2
+    assert events[0][1]["username"] == "octo"
+    assert events[-1][1]["contributions"]["commits"] == 2
+
+    assembler = complete_file.GitHubProfileAssembler()
+    for kind, payload in events:
+        assembler.add(kind, payload)
+    profile = assembler.result()
+    assert [r["name"] for r in profile["repositories"]] == ["repo1", "repo2", "repo3"]
+    assert complete_file.get_profile_cache("github").get("octo") == (profile, True)
+
+
+def test_batches_are_yielded_before_their_language_fan_out(github_api):
+    routes, _ = github_api
+    log = []
+    routes[USER_URL] = response(200, user())
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = response(200, [repo(3)])
+    for i in (1, 2, 3):
+        routes[languages_url(f"repo{i}")] = lambda headers, i=i: log.append(f"languages repo{i}") or response(200, {"Go": i})
+
+    async def drain():
+        async for kind, payload in complete_file.stream_github_profile("octo", use_cache=False):
+            log.append(kind if kind != "github_repos_batch" else f"batch {payload['page']}")
+            if kind == "github_summary":
+                return payload
+
+    summary = asyncio.run(drain())
+    assert log.index("batch 1") < log.index("languages repo1")
+    assert log[-1] == "github_summary"
+    assert summary["language_distribution"]["Go"]["bytes"] == 6
+
+
+def test_cached_profile_replays_the_same_events(github_api):
+    routes, calls = github_api
+    profile = {"username": "octo", "repositories": [{"name": f"r{i}"} for i in range(3)],
+               "language_distribution": {}, "contributions": {"commits": 1}}
+    complete_file.get_profile_cache("github").set("octo", profile)
+    events = collect(complete_file.stream_github_profile("OCTO"))
+    assert calls == []
+    assert [kind for kind, _ in events] == ["github_profile", "github_repos_batch", "github_repos_batch", "github_summary"]
+    assembler = complete_file.GitHubProfileAssembler()
+    for kind, payload in events:
+        assembler.add(kind, payload)
+    assert assembler.result() == profile
+
+
+def test_stream_reports_profile_errors_once(github_api):
+    routes, _ = github_api
+    routes[USER_URL] = response(404)
+    assert collect(complete_file.stream_github_profile("octo")) == [
+        ("github_profile", {"error": "GitHub API returned status 404"})]
+
+
+def test_missing_repo_page_marks_the_profile_incomplete_and_uncached(github_api):
+    routes, _ = github_api
+    routes[USER_URL] = response(200, user())
+    routes[(REPOS_URL, 1)] = response(200, [repo(1), repo(2)])
+    routes[(REPOS_URL, 2)] = response(502)
+    events = collect(complete_file.stream_github_profile("octo"))
+    assert events[-1][0] == "github_summary" and events[-1][1]["incomplete"]
+    assert complete_file.get_profile_cache("github").get("octo") == (None, False)
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+
+from complete_file import GitHubAPIError, GitHubTokenPool
+from cert_validator.core import FetchResponse
+
+
+def test_unauthenticated_pool_uses_anonymous_budget():
+    pool = GitHubTokenPool([])
+    assert not pool.authenticated
+    assert asyncio.run(pool.acquire()) is None
+    assert pool._budget(None, "core")["remaining"] == 59
+
+
+def test_acquire_prefers_token_with_most_remaining():
+    pool = GitHubTokenPool(["a", "b"])
+    pool.update("a", "core", {"X-RateLimit-Remaining": "10", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "0"})
+    pool.update("b", "core", {"X-RateLimit-Remaining": "900", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "0"})
+    assert asyncio.run(pool.acquire()) == "b"
+    assert pool._budget("b", "core")["remaining"] == 899
+
+
+def test_update_tracks_resources_separately():
+    pool = GitHubTokenPool(["a"])
+    pool.update("a", "core", {"X-RateLimit-Resource": "graphql", "X-RateLimit-Remaining": "3"})
+    assert pool._budget("a", "graphql")["remaining"] == 3
+    assert pool._budget("a", "core")["remaining"] == 5000
+
+
+def test_update_ignores_responses_without_rate_limit_headers():
+    pool = GitHubTokenPool(["a"])
+    pool.update("a", "core", {})
+    assert pool._budget("a", "core")["remaining"] == 5000
+
+
+def test_exhausted_budget_refills_after_reset():
+    pool = GitHubTokenPool(["a"])
+    pool.update("a", "core", {"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "5000",
+                              "X-RateLimit-Reset": str(time.time() - 1)})
+    assert asyncio.run(pool.acquire()) == "a"
+
+
+def test_missing_reset_assumes_a_short_window(monkeypatch):
+    pool = GitHubTokenPool(["a"], max_queue_wait=900)
+    pool.update("a", "core", {"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "5000"})
+    reset = pool._budget("a", "core")["reset"]
+    assert 0 < reset - time.time() <= GitHubTokenPool.DEFAULT_RESET_SECONDS
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        monkeypatch.setattr(time, "time", lambda: reset + 1)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    assert asyncio.run(pool.acquire()) == "a"
+    # One wait for the assumed reset, not a 1s poll loop up to max_queue_wait
+    assert len(sleeps) == 1 and sleeps[0] <= GitHubTokenPool.DEFAULT_RESET_SECONDS
+
+
+def test_acquire_gives_up_beyond_max_queue_wait():
+    pool = GitHubTokenPool(["a"], max_queue_wait=5)
+    pool.update("a", "core", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 600)})
+    with pytest.raises(GitHubAPIError):
+        asyncio.run(pool.acquire())
+
+
+def test_is_rate_limited():
+    assert GitHubTokenPool.is_rate_limited(FetchResponse(403, {"X-RateLimit-Remaining": "0"}, ""))
+    assert not GitHubTokenPool.is_rate_limited(FetchResponse(403, {}, ""))
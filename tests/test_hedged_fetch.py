@@ -0,0 +1,129 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from complete_file import HedgedFetcher, HostLatencyTracker
+
+URL = "https://slow.example/page"
+
+
+class Response:
+    def __init__(self, name):
+        self.name = name
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+def fetcher(**kw) -> HedgedFetcher:
+    options = dict(default_delay=0.05, min_delay=0.01, max_hedge_ratio=1.0, workers=4)
+    options.update(kw)
+    return HedgedFetcher(**options)
+
+
+def test_latency_percentile_needs_min_samples():
+    tracker = HostLatencyTracker(window=10)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        tracker.record("h", seconds)
+    assert tracker.percentile("h", 0.95, min_samples=5) is None
+    assert tracker.percentile("h", 0.95, min_samples=4) == 0.4
+    assert tracker.percentile("h", 0.5) == 0.3
+
+
+def test_hedge_delay_uses_default_until_observed():
+    hf = fetcher(default_delay=2.0, min_delay=0.25, min_samples=2)
+    assert hf.hedge_delay("h") == 2.0
+    hf.latencies.record("h", 0.1)
+    hf.latencies.record("h", 0.1)
+    assert hf.hedge_delay("h") == 0.25
+
+
+def test_fast_response_sends_no_hedge():
+    hf = fetcher()
+    with mock.patch("complete_file.requests.get", return_value="fast") as get:
+        assert hf.get(URL) == "fast"
+    assert get.call_count == 1
+
+
+def test_slow_primary_is_hedged_and_backup_wins():
+    hf = fetcher()
+    calls = []
+    release = threading.Event()
+    primary = Response("primary")
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            release.wait(2)
+            return primary
+        return Response("backup")
+
+    with mock.patch("complete_file.requests.get", side_effect=fake_get):
+        assert hf.get(URL, timeout=5).name == "backup"
+        release.set()
+        # The losing primary is closed once it lands and frees the hedge slot
+        assert primary.closed.wait(2)
+    hf._executor.shutdown(wait=True)
+    assert len(calls) == 2
+    assert hf._inflight_hedges["slow.example"] == 0
+
+
+def test_hedge_slot_is_held_until_the_loser_finishes():
+    hf = fetcher(max_inflight_per_host=1)
+    release = threading.Event()
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["timeout"])
+        if len(calls) == 1:
+            release.wait(2)
+        return Response(len(calls))
+
+    with mock.patch("complete_file.requests.get", side_effect=fake_get):
+        hf.get(URL)
+        assert hf._inflight_hedges["slow.example"] == 1
+        release.set()
+    hf._executor.shutdown(wait=True)
+    assert hf._inflight_hedges["slow.example"] == 0
+    # Attempts without a caller timeout still get one, so no worker is held forever
+    assert calls == [hf.request_timeout, hf.request_timeout]
+
+
+def test_hedge_disabled_per_call():
+    hf = fetcher()
+
+    def slow_get(url, **kwargs):
+        time.sleep(0.1)
+        return "primary"
+
+    with mock.patch("complete_file.requests.get", side_effect=slow_get) as get:
+        assert hf.get(URL, hedge=False) == "primary"
+    assert get.call_count == 1
+
+
+def test_hedge_ratio_caps_extra_load():
+    hf = fetcher(max_hedge_ratio=0.0)
+
+    def slow_get(url, **kwargs):
+        time.sleep(0.1)
+        return "primary"
+
+    with mock.patch("complete_file.requests.get", side_effect=slow_get) as get:
+        hf.get(URL)
+        assert hf.get(URL) == "primary"
+    assert get.call_count == 3
+
+
+def test_error_raised_only_when_both_attempts_fail():
+    hf = fetcher()
+
+    def failing_get(url, **kwargs):
+        time.sleep(0.1)
+        raise ConnectionError("down")
+
+    with mock.patch("complete_file.requests.get", side_effect=failing_get):
+        with pytest.raises(ConnectionError):
+            hf.get(URL)
@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+from cert_validator import core
+from cert_validator.core import CertificateValidatorAPI, Deadline, ValidationBulkheads
+
+SLOW = "https://www.udemy.com/certificate/UC-SLOW/"
+FAST = "https://www.coursera.org/account/accomplishments/verify/FAST123"
+OTHER = "https://www.coursera.org/account/accomplishments/verify/OTHER12"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(core, "validation_bulkheads", ValidationBulkheads(["udemy", "credly"], 2, 2))
+    delays = {}
+    calls = []
+    deadlines = {}
+    canonicals = {}
+
+    def validate(self, url, use_cache=True, deadline=None, canonical=None):
+        calls.append(url)
+        deadlines[url] = deadline
+        canonicals[url] = canonical
+        time.sleep(delays.get(url, 0))
+        return {"status": "Valid", "data": {"url": url}}
+
+    monkeypatch.setattr(CertificateValidatorAPI, "validate_single_certificate", validate)
+    instance = CertificateValidatorAPI()
+    instance.delays = delays
+    instance.calls = calls
+    instance.deadlines = deadlines
+    instance.canonicals = canonicals
+    return instance
+
+
+def test_results_arrive_in_completion_order_and_duplicates_run_once(api):
+    api.delays[SLOW] = 0.3
+    order = [url for url, _ in api.iter_validations([SLOW, FAST, FAST, OTHER])]
+    assert order[-1] == SLOW
+    assert sorted(order) == sorted([SLOW, FAST, OTHER])
+    assert sorted(api.calls) == sorted([SLOW, FAST, OTHER])
+
+
+def test_validate_certificates_keeps_input_order(api):
+    api.delays[FAST] = 0.1
+    assert list(api.validate_certificates([FAST, OTHER, FAST])) == [FAST, OTHER]
+
+
+def test_browser_platforms_do_not_block_http_workers(api, monkeypatch):
+    release = threading.Event()
+    validate = CertificateValidatorAPI.validate_single_certificate
+
+    def blocking(self, url, use_cache=True, deadline=None, canonical=None):
+        if "udemy" in url:
+            release.wait(2)
+        return validate(self, url, use_cache, deadline, canonical)
+
+    monkeypatch.setattr(CertificateValidatorAPI, "validate_single_certificate", blocking)
+    udemy = [f"https://www.udemy.com/certificate/UC-{i}/" for i in range(4)]
+    stream = api.iter_validations(udemy + [FAST])
+    assert next(stream)[0] == FAST
+    release.set()
+    assert len(list(stream)) == 4
+
+
+def test_slow_url_is_reported_as_timed_out(api):
+    api.delays[SLOW] = 1.0
+    results = dict(api.iter_validations([SLOW, FAST], url_timeout=0.2))
+    assert results[FAST]["status"] == "Valid"
+    assert results[SLOW]["status"] == "Error"
+    assert "timed out" in results[SLOW]["error_message"]
+
+
+def test_spellings_of_one_certificate_are_validated_once(api):
+    spellings = [FAST, "http://coursera.org/account/accomplishments/verify/FAST123?utm=cv"]
+    results = dict(api.iter_validations(spellings))
+    assert set(results) == set(spellings)
+    assert len(api.calls) == 1
+
+
+def test_workers_receive_the_canonical_form_computed_for_grouping(api):
+    dict(api.iter_validations([FAST]))
+    assert api.canonicals[FAST] == core.canonicalize_certificate_url(FAST)
+
+
+def test_request_deadline_stops_everything_still_pending(api):
+    api.delays[SLOW] = 1.0
+    results = dict(api.iter_validations([SLOW, FAST], url_timeout=30, deadline=Deadline(0.2)))
+    assert results[FAST]["status"] == "Valid"
+    assert results[SLOW]["timed_out"]
+    assert results[SLOW]["error_message"] == "Validation stopped: request deadline exceeded"
+
+
+def test_workers_run_under_their_url_timeout(api):
+    dict(api.iter_validations([FAST], url_timeout=5, deadline=Deadline(60)))
+    assert api.deadlines[FAST].remaining() <= 5
+
+
+def test_closing_the_stream_cancels_queued_validations(api, monkeypatch):
+    monkeypatch.setattr(core, "validation_bulkheads", ValidationBulkheads(["udemy"], 1, 1))
+    urls = [f"https://www.udemy.com/certificate/UC-{i}/" for i in range(4)]
+    for url in urls:
+        api.delays[url] = 0.1
+    stream = api.iter_validations(urls)
+    next(stream)
+    core.close_quietly(stream)
+    time.sleep(0.3)
+    assert len(api.calls) < len(urls)
+
+
+def test_timed_out_validations_are_cancelled_or_counted_as_abandoned(api, monkeypatch):
+    bulkheads = ValidationBulkheads(["udemy"], 1, 1)
+    monkeypatch.setattr(core, "validation_bulkheads", bulkheads)
+    running, queued = "https://www.udemy.com/certificate/UC-1/", "https://www.udemy.com/certificate/UC-2/"
+    api.delays[running] = api.delays[queued] = 0.4
+    results = dict(api.iter_validations([running, queued], url_timeout=30, deadline=Deadline(0.1)))
+    assert results[running]["timed_out"] and results[queued]["timed_out"]
+    # The queued one never starts; the running one holds its slot until it returns
+    assert bulkheads.abandoned["browser"] == 1
+    time.sleep(0.5)
+    assert api.calls == [running]
+    assert bulkheads.abandoned["browser"] == 0
@@ -0,0 +1,42 @@
+import random
+import string
+
+import pytest
+
+from cert_validator.core import KeywordMatcher, keyword_matcher
+
+
+def naive(keywords, text):
+    return {kw.lower() for kw in keywords if kw and kw.lower() in text.lower()}
+
+
+def test_search_is_case_insensitive():
+    matcher = KeywordMatcher(["Contact", "GitHub"])
+    assert matcher.search("Find me on GITHUB")
+    assert not matcher.search("nothing here")
+    assert not matcher.search(None)
+
+
+def test_find_all_reports_overlapping_and_prefix_keywords():
+    matcher = KeywordMatcher(["java", "javascript", "script", "c", "c++"])
+    assert matcher.find_all("JavaScript and C++") == {"java", "javascript", "script", "c", "c++"}
+
+
+def test_empty_keyword_list_never_matches():
+    matcher = KeywordMatcher([""])
+    assert not matcher.search("anything")
+    assert matcher.find_all("anything") == set()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_find_all_agrees_with_substring_checks(seed):
+    rng = random.Random(seed)
+    alphabet = "abc+."
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)]
+    text = "".join(rng.choice(alphabet + string.ascii_uppercase[:3] + " ") for _ in range(60))
+    assert KeywordMatcher(keywords).find_all(text) == naive(keywords, text)
+
+
+def test_keyword_matcher_is_shared_per_list():
+    assert keyword_matcher(["a", "b"]) is keyword_matcher(["a", "b"])
+    assert not keyword_matcher(None).search("a")
@@ -0,0 +1,96 @@
+import pytest
+
+import complete_file
+from cert_validator import core
+from complete_file import parse_portfolio
+from cert_validator.core import available_parser_backends, get_parser_backend, make_soup
+
+PORTFOLIO = """
+<html><head><title>Jane Doe | Portfolio</title></head>
+<body>
+  <h1 class="name">Jane Doe</h1>
+  <a href="mailto:jane@example.com">Email</a>
+  <a href="https://github.com/janedoe">GitHub</a>
+  <a href="https://www.linkedin.com/in/janedoe">LinkedIn</a>
+  <section id="skills"><h2>Skills</h2><ul><li>Python</li><li>React</li></ul></section>
+  <section id="projects"><h2>Projects</h2>
+    <div class="project"><h3>Scraper</h3><p>Scrapes portfolio pages.</p></div>
+  </section>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_backend(monkeypatch):
+    monkeypatch.setattr(core, "_parser_backend", None)
+    monkeypatch.delenv("HTML_PARSER_BACKEND", raising=False)
+
+
+def test_auto_backend_follows_preference():
+    expected = next(name for name in ["lxml", "html.parser"] if name in available_parser_backends())
+    assert get_parser_backend() == expected
+
+
+def test_env_selects_backend_and_unknown_falls_back(monkeypatch):
+    monkeypatch.setenv("HTML_PARSER_BACKEND", "html.parser")
+    assert get_parser_backend() == "html.parser"
+    monkeypatch.setattr(core, "_parser_backend", None)
+    monkeypatch.setenv("HTML_PARSER_BACKEND", "no-such-parser")
+    assert get_parser_backend() in available_parser_backends()
+
+
+def test_make_soup_uses_requested_backend():
+    assert make_soup("<p>x</p>", "html.parser").builder.NAME == "html.parser"
+
+
+@pytest.mark.parametrize("backend", available_parser_backends())
+def test_parse_portfolio_is_backend_independent(monkeypatch, backend):
+    baseline = parse_portfolio(PORTFOLIO, "https://jane.example")
+    assert baseline["name"] == "Jane Doe"
+    assert baseline["contact"]["email"] == "jane@example.com"
+    monkeypatch.setattr(core, "_parser_backend", backend)
+    assert parse_portfolio(PORTFOLIO, "https://jane.example") == baseline
+
+
+INDEXED = """
+<html><body>
+  <div id="main" class="wrap outer">
+    <section class="about card"><p class="lead">Hello</p><a href="https://github.com/x" rel="me">gh</a></section>
+    <section class="skills card" data-kind="list"><ul><li class="skill">Go</li><li class="skill">SQL</li></ul></section>
+  </div>
+  <footer><a href="mailto:me@example.com">mail</a><p class="lead">Bye</p></footer>
+</body></html>
+"""
+
+SELECTORS = ["section", ".card", "#main", "li.skill", "a[href^='mailto:']", "a[href*='github']",
+             "section[data-kind='list']", "[rel]", "p.lead", "div > section", "section:nth-of-type(2)"]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_document_index_select_matches_soupsieve(selector):
+    soup = make_soup(INDEXED, "html.parser")
+    index = complete_file.DocumentIndex(soup)
+    assert index.select(selector) == soup.select(selector)
+    main = soup.select_one("#main")
+    assert index.scope(main).select(selector) == main.select(selector)
+
+
+def test_document_index_find_all_and_keyword_tags():
+    soup = make_soup(INDEXED, "html.parser")
+    index = complete_file.DocumentIndex(soup)
+    footer = soup.find("footer")
+    assert index.find_all("p") == soup.find_all("p")
+    assert index.scope(footer).find_all("p") == footer.find_all("p")
+    assert index.find_all("a", href=True) == soup.find_all("a", href=True)
+    assert index.find("a", attrs={"rel": ["me"]}) == soup.find("a", rel="me")
+    assert [tag["class"][0] for tag in index.keyword_tags(["SKILL"])] == ["skills", "skill", "skill"]
+
+
+def test_document_index_scope_ignores_position_cache_of_a_dead_list():
+    soup = make_soup(INDEXED, "html.parser")
+    index = complete_file.DocumentIndex(soup)
+    main = soup.select_one("#main")
+    paragraphs = index.find_all("p")
+    # Simulate another list that lived at the same address before being freed
+    index._positions[id(paragraphs)] = ([], [0] * len(paragraphs))
+    assert index._within(paragraphs, main) == main.find_all("p")
@@ -0,0 +1,84 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import complete_file
+from cert_validator import core
+from complete_file import crawl_portfolio, discover_portfolio_links, merge_portfolio_results
+from cert_validator.core import CircuitBreaker
+
+URL = "https://jane.example/"
+LANDING = """
+<html><body><h1 class="name">Jane Doe</h1>
+  <a href="/projects">Projects</a>
+  <a href="/blog/skills-i-learned">Blog</a>
+  <a href="/contact">Say hi</a>
+  <a href="https://other.example/projects">Elsewhere</a>
+  <a href="/projects#top">Projects again</a>
+  <a href="/#skills">Skills</a>
+</body></html>
+"""
+PROJECTS = """
+<html><body><section id="projects"><div class="project"><h3>Scraper</h3>
+<p>Scrapes pages.</p><a href="https://github.com/jane/scraper">code</a></div></section></body></html>
+"""
+
+
+class FakeFetcher:
+    def __init__(self, pages, delays=None):
+        self.pages = pages
+        self.delays = delays or {}
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        time.sleep(self.delays.get(url, 0))
+        body = self.pages.get(url)
+        return SimpleNamespace(status_code=200 if body is not None else 404, text=body or "")
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    def install(pages, delays=None):
+        fake = FakeFetcher(pages, delays)
+        monkeypatch.setattr(complete_file, "hedged_fetcher", fake)
+        return fake
+    return install
+
+
+def test_discovers_same_site_keyword_links_once():
+    links = discover_portfolio_links(LANDING, URL, limit=5)
+    assert links == ["https://jane.example/projects", "https://jane.example/blog/skills-i-learned"]
+    assert discover_portfolio_links(LANDING, URL, limit=1) == ["https://jane.example/projects"]
+
+
+def test_merge_fills_gaps_and_unions_lists():
+    base = {"name": "Jane", "skills": ["Python"], "projects": [{"title": "a", "link": "x"}], "contact": {"email": "j@x"}}
+    extra = {"name": "Other", "about": "Hi", "skills": ["Python", "Go"],
+             "projects": [{"title": "a", "link": "x"}, {"title": "b", "link": None}],
+             "contact": {"email": "other@x", "github": "gh"}, "error": "ignored"}
+    assert merge_portfolio_results(base, extra) == {
+        "name": "Jane", "about": "Hi", "skills": ["Python", "Go"],
+        "projects": [{"title": "a", "link": "x"}, {"title": "b", "link": None}],
+        "contact": {"email": "j@x", "github": "gh"},
+    }
+
+
+def test_crawl_merges_subpage_results(fetcher):
+    fake = fetcher({"https://jane.example/projects": PROJECTS})
+    breaker = CircuitBreaker("test")
+    result = crawl_portfolio(URL, LANDING, {"name": "Jane Doe", "projects": []}, breaker)
+    assert sorted(fake.requested) == ["https://jane.example/blog/skills-i-learned", "https://jane.example/projects"]
+    assert result["name"] == "Jane Doe"
+    assert any(project["title"] == "Scraper" for project in result["projects"])
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_crawl_drops_pages_past_the_time_budget(fetcher, monkeypatch):
+    monkeypatch.setitem(core.FETCH_CONFIG["portfolio_crawl"], "time_budget_seconds", 0.2)
+    fetcher({"https://jane.example/projects": PROJECTS}, delays={"https://jane.example/projects": 1.0})
+    started = time.monotonic()
+    result = crawl_portfolio(URL, LANDING, {"name": "Jane Doe"}, CircuitBreaker("test"))
+    assert time.monotonic() - started < 0.8
+    assert "projects" not in result
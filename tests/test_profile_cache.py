@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+
+from complete_file import ProfileCache
+
+
+def backdate(cache: ProfileCache, key: str, seconds: float):
+    stored_at, value = cache._entries[key]
+    cache._entries[key] = (stored_at - seconds, value)
+
+
+def test_fresh_hit_skips_fetch():
+    cache = ProfileCache("test", ttl_seconds=60)
+    calls = []
+    fetch = lambda: calls.append(1) or {"login": "octo"}
+    assert cache.get_or_fetch("octo", fetch) == {"login": "octo"}
+    assert cache.get_or_fetch("octo", fetch) == {"login": "octo"}
+    assert len(calls) == 1
+    assert cache.stats == {"hits": 1, "stale_hits": 0, "misses": 1, "refreshes": 0}
+
+
+def test_errors_are_not_cached():
+    cache = ProfileCache("test")
+    cache.set("octo", {"error": "GitHub API returned status 502"})
+    assert cache.get("octo") == (None, False)
+
+
+def test_stale_entry_is_served_while_one_refresh_runs():
+    cache = ProfileCache("test", ttl_seconds=60, stale_ttl_seconds=600)
+    cache.set("octo", {"v": 1})
+    backdate(cache, "octo", 120)
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(2)
+        return {"v": 2}
+
+    assert cache.get_or_fetch("octo", slow_fetch) == {"v": 1}
+    assert cache.get_or_fetch("octo", slow_fetch) == {"v": 1}
+    release.set()
+    deadline = time.time() + 2
+    while cache.get("octo")[0] != {"v": 2} and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get("octo") == ({"v": 2}, True)
+    assert len(calls) == 1
+
+
+def test_entries_past_stale_window_are_refetched():
+    cache = ProfileCache("test", ttl_seconds=60, stale_ttl_seconds=60)
+    cache.set("octo", {"v": 1})
+    backdate(cache, "octo", 200)
+    assert cache.get_or_fetch("octo", lambda: {"v": 2}) == {"v": 2}
+
+
+def test_async_stale_refresh_runs_in_background():
+    cache = ProfileCache("test", ttl_seconds=60)
+    cache.set("octo", {"v": 1})
+    backdate(cache, "octo", 120)
+
+    async def fetch():
+        return {"v": 2}
+
+    async def scenario():
+        served = await cache.get_or_fetch_async("octo", fetch)
+        await asyncio.gather(*cache._background_tasks)
+        return served
+
+    assert asyncio.run(scenario()) == {"v": 1}
+    assert cache.get("octo") == ({"v": 2}, True)
+
+
+def test_lru_bound_and_sqlite_persistence(tmp_path):
+    path = str(tmp_path / "profiles.sqlite3")
+    cache = ProfileCache("test", max_entries=1, persist_path=path)
+    cache.set("a", {"v": "a"})
+    cache.set("b", {"v": "b"})
+    assert list(cache._entries) == ["b"]
+    assert cache.get("a") == ({"v": "a"}, True)
+    assert ProfileCache("test", persist_path=path).get("b") == ({"v": "b"}, True)
+    assert ProfileCache("other", persist_path=path).get("b") == (None, False)
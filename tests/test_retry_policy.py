@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from cert_validator.core import Deadline, RetryBudget, RetryPolicy
+
+
+class Response:
+    def __init__(self, status, headers=None):
+        self.status_code = status
+        self.headers = headers or {}
+
+
+def policy(**kwargs) -> RetryPolicy:
+    settings = dict(max_attempts=3, base_delay=0.0, max_delay=0.0, max_total_delay=1.0, retry_statuses=[503])
+    settings.update(kwargs)
+    return RetryPolicy(**settings)
+
+
+def test_retries_retryable_statuses_until_success():
+    responses = iter([Response(503), Response(503), Response(200)])
+    budget = policy().new_budget()
+    assert policy().call(lambda: next(responses), budget=budget).status_code == 200
+    assert budget.attempts == 3
+
+
+def test_returns_the_last_response_once_attempts_run_out():
+    calls = []
+    result = policy(max_attempts=2).call(lambda: calls.append(1) or Response(503))
+    assert result.status_code == 503
+    assert len(calls) == 2
+
+
+def test_non_retryable_status_and_exception_are_not_retried():
+    calls = []
+    assert policy().call(lambda: calls.append(1) or Response(404)).status_code == 404
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bug")
+
+    with pytest.raises(ValueError):
+        policy().call(broken)
+    assert len(calls) == 2
+
+
+def test_transport_errors_are_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise requests.ConnectionError("reset")
+        return Response(200)
+
+    assert policy().call(flaky).status_code == 200
+
+
+def test_server_delay_wins_and_is_bounded_by_the_budget():
+    p = policy(max_total_delay=5.0)
+    assert p.server_delay({"Retry-After": "2"}) == 2.0
+    assert p.delay_for(0, {"Retry-After": "2"}) == 2.0
+    budget = RetryBudget(max_attempts=3, max_total_delay=5.0)
+    budget.attempts = 1
+    assert not budget.allows(6.0)
+    calls = []
+    # Retry-After beyond the budget stops retrying instead of sleeping
+    result = p.call(lambda: calls.append(1) or Response(503, {"Retry-After": "60"}))
+    assert result.status_code == 503 and len(calls) == 1
+
+
+def test_exhausted_github_rate_limit_is_retryable():
+    p = policy(retry_statuses=[])
+    assert p.should_retry_status(403, {"X-RateLimit-Remaining": "0"})
+    assert not p.should_retry_status(403, {"X-RateLimit-Remaining": "12"})
+
+
+def test_backoff_stays_within_the_cap():
+    p = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    assert all(0 <= p.backoff(attempt) <= 4.0 for attempt in range(10))
+
+
+def test_async_path_retries_the_same_way():
+    responses = iter([Response(503), Response(200)])
+
+    async def fetch():
+        return next(responses)
+
+    assert asyncio.run(policy().call_async(fetch)).status_code == 200
+
+
+def test_sync_budgets_get_the_tighter_blocking_cap():
+    p = policy(max_total_delay=30.0, max_sync_total_delay=8.0)
+    assert p.new_budget().max_total_delay == 30.0
+    assert p.new_budget(sync=True).max_total_delay == 8.0
+    assert p.new_budget(sync=True, max_attempts=1).max_attempts == 1
+    # A server delay beyond the sync cap stops retrying instead of blocking the worker
+    calls = []
+    result = p.call(lambda: calls.append(1) or Response(503, {"Retry-After": "10"}))
+    assert result.status_code == 503 and len(calls) == 1
+
+
+def test_sync_wait_never_sleeps_past_the_deadline(monkeypatch):
+    monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt: 0.3)
+    p = policy(max_total_delay=10.0)
+    budget = RetryBudget(3, 10.0, deadline=Deadline(0.35))
+    budget.attempts = 1
+    started = time.monotonic()
+    assert p.wait(budget)
+    budget.attempts += 1
+    # The second backoff no longer fits before the deadline
+    assert not p.wait(budget)
+    assert time.monotonic() - started < 0.5
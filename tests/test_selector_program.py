@@ -0,0 +1,71 @@
+import copy
+import json
+
+import pytest
+import soupsieve
+
+from cert_validator import core
+from cert_validator.core import CompiledSelector, SelectorProgram, compile_selector, make_soup
+
+
+@pytest.fixture
+def selectors_config(monkeypatch):
+    config = copy.deepcopy(core.SELECTORS_CONFIG)
+    monkeypatch.setattr(core, "SELECTORS_CONFIG", config)
+    monkeypatch.setattr(core, "selector_program", None)
+    monkeypatch.delenv("SELECTORS_CONFIG_PATH", raising=False)
+    yield config
+    compile_selector.cache_clear()
+
+
+@pytest.mark.parametrize("text, plan", [
+    ("a.product-link", ("a", [("class", "product-link", None, None)])),
+    ("#main", (None, [("id", "main", None, None)])),
+    ("a[href^='mailto:']", ("a", [("attr", "href", "^=", "mailto:")])),
+    ("div p", None),
+    ("span.completion-date, time", None),
+    ("li:first-child", None),
+])
+def test_compound_plan(text, plan):
+    assert CompiledSelector(text).plan == plan
+
+
+def test_compiled_selector_selects_like_soupsieve():
+    soup = make_soup("<div><span class='completion-date'>May 2024</span><time>2024</time></div>", "html.parser")
+    selector = compile_selector("span.completion-date, time")
+    assert selector is compile_selector("span.completion-date, time")
+    assert selector.select(soup) == soup.select("span.completion-date, time")
+    assert selector.select_one(soup).get_text() == "May 2024"
+
+
+def test_program_groups_platform_and_portfolio_selectors(selectors_config):
+    program = SelectorProgram(selectors_config)
+    assert program.platform("coursera")["course"].text == selectors_config["coursera"]["course"]
+    assert program.platform("unknown") == {}
+    assert [s.text for s in program.portfolio["name"]] == selectors_config["portfolio_name_selectors"]
+    assert len(program.dates) == len(selectors_config.get("date_selectors", []))
+
+
+def test_reload_reads_overrides_from_json(selectors_config, tmp_path):
+    path = tmp_path / "selectors.json"
+    path.write_text(json.dumps({"coursera": {"name": "h1.learner", "course": "a.course", "date": "time"}}))
+    program = core.reload_selector_program(str(path))
+    assert core.get_selector_program() is program
+    assert program.platform("coursera")["name"].text == "h1.learner"
+    assert selectors_config["coursera"]["course"] == "a.course"
+
+
+@pytest.mark.parametrize("content, error", [
+    ('{"coursera": {"name": "h1[", "course": "a", "date": "time"}}', soupsieve.SelectorSyntaxError),
+    ('["not", "an", "object"]', ValueError),
+    ('{"coursera": "h1"}', ValueError),
+])
+def test_bad_reload_leaves_config_and_program_untouched(selectors_config, tmp_path, content, error):
+    program = core.get_selector_program()
+    before = copy.deepcopy(selectors_config)
+    path = tmp_path / "selectors.json"
+    path.write_text(content)
+    with pytest.raises(error):
+        core.reload_selector_program(str(path))
+    assert selectors_config == before
+    assert core.get_selector_program() is program
@@ -0,0 +1,31 @@
+import asyncio
+import io
+import json
+
+import docx
+
+import complete_file
+
+
+def resume(*paragraphs) -> bytes:
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def stream_events(content: bytes) -> list:
+    async def drain():
+        return [json.loads(chunk[len("data: "):]) async for chunk in
+                complete_file.stream_processing_generator(content, "resume.docx")]
+    return asyncio.run(drain())
+
+
+def test_unparseable_github_link_ends_the_section_with_a_skipped_summary(monkeypatch):
+    monkeypatch.setattr(complete_file, "extract_elements", lambda text: {"github": "https://github.com/"})
+    events = stream_events(resume("Jane Doe"))
+    github = [event for event in events if event["type"].startswith("github")]
+    assert github == [{"type": "github_summary",
+                       "data": {"skipped": True, "error": "Could not extract a GitHub username from https://github.com/"}}]
@@ -0,0 +1,90 @@
+import json
+
+from complete_file import DocumentIndex, extract_structured_portfolio, parse_portfolio
+from cert_validator.core import make_soup
+
+URL = "https://jane.example/"
+
+
+def page(*scripts: str, body: str = "") -> str:
+    return f"<html><head>{''.join(scripts)}</head><body>{body}</body></html>"
+
+
+def json_ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def next_data(page_props) -> str:
+    return f'<script id="__NEXT_DATA__" type="application/json">{json.dumps({"props": {"pageProps": page_props}})}</script>'
+
+
+def structured(html: str) -> dict:
+    return extract_structured_portfolio(DocumentIndex(make_soup(html)), URL)
+
+
+def test_json_ld_person_and_projects():
+    html = page(json_ld({"@graph": [
+        {"@type": "Person", "name": "Jane Doe", "description": "Backend engineer",
+         "knowsAbout": ["Python", {"name": "Kubernetes"}], "alumniOf": {"name": "MIT"},
+         "email": "mailto:jane@example.com", "sameAs": ["https://github.com/jane", "https://linkedin.com/in/jane"]},
+        {"@type": "SoftwareSourceCode", "name": "scraper", "codeRepository": "/code/scraper"},
+    ]}))
+    result = structured(html)
+    assert result["name"] == "Jane Doe"
+    assert result["about"] == "Backend engineer"
+    assert result["skills"] == ["Python", "Kubernetes"]
+    assert result["education"] == ["MIT"]
+    assert result["contact"] == {"email": "jane@example.com", "github": "https://github.com/jane",
+                                 "linkedin": "https://linkedin.com/in/jane"}
+    assert result["projects"] == [{"title": "scraper", "description": None, "link": "https://jane.example/code/scraper"}]
+
+
+def test_next_data_page_props():
+    html = page(next_data({"profile": {
+        "name": "Jane Doe", "bio": "Builds things",
+        "skills": [{"category": "Languages", "items": ["Go", "Rust"]}, "SQL, Bash"],
+        "projects": [{"title": "cli", "description": "A tool", "url": "https://cli.jane.dev"}],
+        "links": {"github": "https://github.com/jane"},
+    }}))
+    result = structured(html)
+    assert result["name"] == "Jane Doe"
+    assert result["skills"] == ["Go", "Rust", "SQL", "Bash"]
+    assert result["projects"][0]["link"] == "https://cli.jane.dev"
+    assert result["contact"]["github"] == "https://github.com/jane"
+
+
+def test_malformed_scripts_are_ignored():
+    html = page('<script type="application/ld+json">{not json</script>',
+                '<script id="__NEXT_DATA__">[]</script>')
+    assert structured(html) == {}
+
+
+def test_structured_fields_take_precedence_over_dom_heuristics():
+    html = page(json_ld({"@type": "Person", "name": "Jane Doe", "knowsAbout": ["Elixir"]}),
+                body='<h1 class="name">Someone Else</h1><section id="skills"><li>Python</li></section>')
+    result = parse_portfolio(html, URL)
+    assert result["name"] == "Jane Doe"
+    assert result["skills"] == ["Elixir"]
+
+
+def test_open_graph_does_not_override_dom_fields():
+    html = page('<meta property="og:site_name" content="Jane\'s Blog">',
+                '<meta property="og:description" content="Posts about cooking">',
+                body='<h1 class="name">Jane Doe</h1>')
+    assert "name" not in structured(html)
+    assert parse_portfolio(html, URL)["name"] == "Jane Doe"
+
+
+def test_open_graph_still_fills_empty_fields():
+    html = page('<meta property="og:site_name" content="Jane Doe">')
+    assert parse_portfolio(html, URL)["name"] == "Jane Doe"
+
+
+def test_next_data_names_come_only_from_profile_objects():
+    html = page(next_data({
+        "seo": {"name": "Portfolio Home", "description": "Welcome"},
+        "featured": {"name": "Scraper", "description": "A project"},
+        "author": {"name": "Jane Doe"},
+    }))
+    assert structured(html)["name"] == "Jane Doe"
+    assert "about" not in structured(page(next_data({"seo": {"name": "Home", "description": "Welcome"}})))
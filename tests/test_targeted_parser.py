@@ -0,0 +1,88 @@
+import pytest
+
+from cert_validator import core
+from cert_validator.core import FieldSpec, compile_selector, element_text, extract_page_fields
+
+CERTIFICATE = """
+<html><body>
+  <div class="header"><p class="learner">   </p><p class="learner">Jane Doe</p></div>
+  <div class="course"><h2>Course</h2><a class="product-link">Machine Learning</a></div>
+  <span class="completion-date">May 1, 2024</span>
+  """ + "<p>filler</p>" * 500 + """
+  <footer><span class="late">tail</span></footer>
+</body></html>
+"""
+
+
+def spec(*selectors, accept=None):
+    return FieldSpec([compile_selector(s) for s in selectors], accept=accept)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setitem(core.PARSE_CONFIG, "targeted_chunk_size", 256)
+
+
+def texts(page) -> dict:
+    return {field: element_text(element, True) if element is not None else None
+            for field, element in page.elements.items()}
+
+
+FIELDS = {
+    "name": spec("p.learner", "h1", accept=lambda text: bool(text)),
+    "course": spec("div.course a.product-link"),
+    "date": spec("div > span.completion-date, time"),
+}
+
+
+def test_targeted_and_full_parses_agree():
+    targeted = extract_page_fields(CERTIFICATE, FIELDS, targeted=True)
+    full = extract_page_fields(CERTIFICATE, FIELDS, targeted=False)
+    assert (targeted.mode, full.mode) == ("targeted", "full")
+    assert texts(targeted) == texts(full)
+
+
+def test_first_match_rejected_falls_through_to_next_selector():
+    page = extract_page_fields(CERTIFICATE, FIELDS, targeted=False)
+    # select_one semantics: only the first p.learner is considered, and it is blank
+    assert texts(page)["name"] is None
+
+
+def test_parsing_stops_once_every_field_is_settled():
+    page = extract_page_fields(CERTIFICATE, {"course": spec("a.product-link")}, targeted=True)
+    assert element_text(page.get("course")) == "Machine Learning"
+    assert page.parsed_chars < page.total_chars
+    # Text fallbacks still see the whole page; the rest is parsed on demand
+    assert "tail" in page.text()
+
+
+def test_missing_field_parses_the_whole_page():
+    page = extract_page_fields(CERTIFICATE, {"badge": spec("div.badge")}, targeted=True)
+    assert page.get("badge") is None
+    assert page.parsed_chars == page.total_chars
+    assert "tail" in page.text()
+
+
+def test_unsupported_selectors_fall_back_to_full_parse():
+    page = extract_page_fields(CERTIFICATE, {"late": spec("footer span:first-child")}, targeted=True)
+    assert page.mode == "full"
+    assert element_text(page.get("late")) == "tail"
+
+
+def test_coursera_course_is_read_inside_the_name_paragraph(monkeypatch):
+    page = """<html><body>
+      <nav><a class="product-link">Browse catalog</a></nav>
+      <p class="account-verification-description">Jane Doe's account is verified.
+        Coursera certifies completion of <a class="product-link">Machine Learning</a></p>
+      <span class="completion-date">May 1, 2024</span>
+    </body></html>"""
+    validator = core.CourseraValidator()
+    monkeypatch.setattr(validator, "_make_request", lambda url: page)
+    metadata = validator.extract_metadata("https://www.coursera.org/account/accomplishments/verify/ABC123")
+    assert (metadata["name"], metadata["course"], metadata["issue_date"]) == ("Jane Doe", "Machine Learning", "2024-05-01")
+
+    # A link in some later paragraph of the same class is not this certificate's course
+    page = page.replace('<a class="product-link">Machine Learning</a></p>',
+                        '</p><p class="account-verification-description"><a class="product-link">Other</a></p>')
+    metadata = validator.extract_metadata("https://www.coursera.org/account/accomplishments/verify/ABC123")
+    assert metadata["name"] == "Jane Doe" and "course" not in metadata
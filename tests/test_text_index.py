@@ -0,0 +1,40 @@
+from complete_file import TextIndex
+from cert_validator.core import make_soup
+
+HTML = """
+<html><body>
+  <div id="card"><h2>Certificate of <b>Achievement</b></h2>
+    <p>Awarded to Jane Doe</p><!-- a comment --><script>var x = "Jane";</script>
+    <span>Issued <em>May 2024</em></span>
+  </div>
+  <p>Verify at edx.org</p>
+</body></html>
+"""
+
+
+def soup():
+    return make_soup(HTML, "html.parser")
+
+
+def test_text_slices_match_get_text():
+    page = soup()
+    index = TextIndex(page)
+    assert index.text() == page.get_text()
+    assert "var x" not in index.text()
+    for tag in page.find_all(lambda tag: tag.name != "script"):
+        assert index.text(tag) == tag.get_text()
+
+
+def test_find_returns_innermost_enclosing_element():
+    page = soup()
+    index = TextIndex(page)
+    assert index.find("achievement").name == "b"
+    assert index.find("Certificate of Achievement").name == "h2"
+    assert index.find("jane doe", name="div")["id"] == "card"
+
+
+def test_find_skips_occurrences_without_an_element_of_that_name():
+    index = TextIndex(soup())
+    assert index.find("verify", name="p").get_text() == "Verify at edx.org"
+    assert index.find("Jane", name="span") is None
+    assert index.find("missing") is None
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+import complete_file
+from cert_validator import core
+from cert_validator.core import UdemyValidator
+
+URL = "https://www.udemy.com/certificate/UC-1A2B3C/"
+DESCRIPTION_PAGE = """<html><body><div data-purpose="certificate-description">
+This is to certify that <a data-purpose="certificate-recipient-url" href="/user/jane/">Jane Doe</a>
+successfully completed <a data-purpose="certificate-course-url" href="/course/py/">Python Bootcamp</a>
+on 05/01/2024</div></body></html>"""
+OG_PAGE = """<html><head>
+<meta property="og:description" content="Jane Doe completed Python Bootcamp online course on 05/01/2024">
+<meta property="og:image" content="https://udemy-certificate.s3.amazonaws.com/image/UC-1A2B3C.jpg">
+</head><body><div id="app"></div></body></html>"""
+
+
+def reply(status, text=""):
+    return SimpleNamespace(status_code=status, ok=200 <= status < 300, text=text)
+
+
+@pytest.fixture
+def validator():
+    with mock.patch.object(UdemyValidator, "_setup_webdriver", side_effect=AssertionError("browser launched")):
+        yield UdemyValidator()
+
+
+def probe(validator, response):
+    with mock.patch("complete_file.requests.get", return_value=response):
+        return validator._probe_certificate(URL)
+
+
+def test_server_rendered_description_settles_statically(validator):
+    metadata, conclusive = probe(validator, reply(200, DESCRIPTION_PAGE))
+    assert conclusive
+    assert (metadata["recipient"], metadata["course"]) == ("Jane Doe", "Python Bootcamp")
+    assert core.validation_tiers.snapshot() == {"udemy": {"static": 1}}
+
+
+def test_open_graph_fallback(validator):
+    metadata, conclusive = probe(validator, reply(200, OG_PAGE))
+    assert conclusive
+    assert (metadata["recipient"], metadata["course"]) == ("Jane Doe", "Python Bootcamp")
+    assert metadata["issue_date"]
+    assert metadata["certificate_image"].endswith("UC-1A2B3C.jpg")
+    assert core.validation_tiers.snapshot() == {"udemy": {"open_graph": 1}}
+
+
+def test_not_found_is_conclusive(validator):
+    assert probe(validator, reply(404)) == ({}, True)
+    assert core.validation_tiers.snapshot() == {"udemy": {"not_found": 1}}
+
+
+@pytest.mark.parametrize("response", [reply(403), reply(200, "<html><body>Just a moment...</body></html>")])
+def test_blocked_or_bare_pages_escalate(validator, response):
+    assert probe(validator, response) == ({}, False)
+
+
+def test_probe_can_be_disabled(validator, monkeypatch):
+    monkeypatch.setitem(core.FETCH_CONFIG["static_validation"]["udemy"], "enabled", False)
+    with mock.patch("complete_file.requests.get") as get:
+        assert validator._probe_certificate(URL) == ({}, False)
+    get.assert_not_called()
+
+
+def test_open_graph_for_another_certificate_escalates(validator):
+    page = OG_PAGE.replace("UC-1A2B3C.jpg", "UC-OTHER.jpg")
+    metadata, conclusive = probe(validator, reply(200, page))
+    assert not conclusive
+    assert core.validation_tiers.snapshot() == {}
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from collections import OrderedDict
+
+import pytest
+
+import complete_file
+from cert_validator import core
+from cert_validator.core import CertificateValidator, ValidatorRegistry, validator_registry
+
+
+@pytest.mark.parametrize("host, expected", [
+    ("www.Udemy.com", "udemy.com"),
+    ("user@www.credly.com:443", "credly.com"),
+    ("", ""),
+])
+def test_normalize_host(host, expected):
+    assert ValidatorRegistry.normalize_host(host) == expected
+
+
+def test_string_factories_are_imported_and_built_once():
+    registry = ValidatorRegistry()
+    registry.register("dummy", ("dummy.example",), "collections:OrderedDict")
+    assert registry.platform_for("WWW.dummy.example") == "dummy"
+    first = registry.for_host("dummy.example")
+    assert isinstance(first, OrderedDict)
+    assert registry.get("dummy") is first
+    registry.register("dummy", ("dummy.example",), dict)
+    assert type(registry.get("dummy")) is dict
+    assert registry.for_host("unknown.example") is None
+    assert registry.get("unknown") is None
+
+
+def test_builtin_platforms_are_registered():
+    assert validator_registry.platforms() == ["coursera", "credly", "edx", "linkedin", "udemy"]
+    validator = CertificateValidator()._get_validator("https://udemy.com/certificate/UC-1/")
+    assert isinstance(validator, core.UdemyValidator)
+
+
+def test_importing_does_not_load_selenium():
+    code = ("import sys, complete_file, cert_validator.core as core, cert_validator.validators as v; "
+            "v.UdemyValidator(); core.CertificateValidator(); "
+            "print('selenium' in sys.modules, 'webdriver_manager' in sys.modules)")
+    assert run_python(code) == ["False", "False"]
+
+
+def test_validator_shims_do_not_load_the_web_app():
+    code = ("import sys, cert_validator.validators as v, cert_validator.certificate_validator_api as api; "
+            "v.UdemyValidator(); api.get_certificate_validator(); "
+            "print(*(name in sys.modules for name in ('complete_file', 'fastapi', 'aiohttp', 'selenium')))")
+    assert run_python(code) == ["False", "False", "False", "False"]
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                          cwd=complete_file.os.path.dirname(complete_file.__file__)).stdout.split()
+